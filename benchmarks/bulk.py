@@ -0,0 +1,70 @@
+'''
+Scaling benchmark of the bulk primitives against drawing shapes one call at a time.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.bulk [maxCount]
+'''
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import time
+from typing import Callable
+
+import numpy
+import pygame
+
+from ..components.Surface import Container
+from ..utils.color import Color
+
+SIZE = (1280, 720)
+
+def timeit(func: Callable[[], None], repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(maxCount: int = 50000) -> None:
+    pygame.init()
+    pygame.display.set_mode(SIZE)
+
+    rng = numpy.random.default_rng(0)
+    surface = Container((0, 0), SIZE)
+    opaque = Color((30, 120, 220))
+    translucent = Color((220, 60, 30, 128))
+
+    print(f'{"count":>8} {"case":<24} {"per call ms":>12} {"bulk ms":>10} {"speedup":>8}')
+    count = 1000
+    while count <= maxCount:
+        points = rng.uniform(0, SIZE, (count, 2))
+        rects = numpy.concatenate([rng.uniform(0, SIZE, (count, 2)), rng.uniform(2, 16, (count, 2))], axis=1)
+        # Telemetry is plotted as a series of nearby samples
+        series = numpy.stack([numpy.linspace(0, SIZE[0] - 1, count), numpy.clip(SIZE[1] / 2 + numpy.cumsum(rng.normal(0, 3, count)), 0, SIZE[1] - 1)], axis=1)
+        seriesColors = rng.integers(0, 256, (count - 1, 4))
+        pointList = [(float(x), float(y)) for x, y in points]
+        seriesList = [(float(x), float(y)) for x, y in series]
+        rectList = [((float(r[0]), float(r[1])), (float(r[2]), float(r[3]))) for r in rects]
+
+        cases = [
+            ('points/opaque', lambda: [surface.drawCircle(opaque, p, 1, 0, True, True, True, True) for p in pointList], lambda: surface.drawPoints(points, opaque, 2)),
+            ('points/translucent', lambda: [surface.drawCircle(translucent, p, 1, 0, True, True, True, True) for p in pointList], lambda: surface.drawPoints(points, translucent, 2)),
+            ('rects/opaque', lambda: [surface.drawRect(opaque, p, s) for p, s in rectList], lambda: surface.drawRects(rects, opaque)),
+            ('rects/translucent', lambda: [surface.drawRect(translucent, p, s) for p, s in rectList], lambda: surface.drawRects(rects, translucent)),
+            ('polyline/opaque', lambda: [surface.drawLine(opaque, a, b, 1) for a, b in zip(seriesList, seriesList[1:])], lambda: surface.drawPolyline(series, opaque)),
+            ('polyline/translucent', lambda: [surface.drawLine(translucent, a, b, 1) for a, b in zip(seriesList, seriesList[1:])], lambda: surface.drawPolyline(series, translucent)),
+            ('polyline/per-segment', lambda: [surface.drawLine(Color(tuple(int(v) for v in c)), a, b, 1) for a, b, c in zip(seriesList, seriesList[1:], seriesColors)], lambda: surface.drawPolyline(series, seriesColors)),
+        ]
+        for name, perCall, bulk in cases:
+            a = timeit(perCall)
+            b = timeit(bulk)
+            print(f'{count:>8} {name:<24} {a * 1000:>12.2f} {b * 1000:>10.2f} {a / b:>7.1f}x')
+
+        count *= 5 if str(count).startswith('1') else 2
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
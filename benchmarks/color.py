@@ -0,0 +1,43 @@
+'''
+Cost of constructing colors from tuples, hex strings and the named table, of using them as
+cache keys, and of building styles which default to named colors.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.color [repeat]
+'''
+import sys
+import time
+from typing import Callable
+
+from ..components.Button import ButtonStyle, SliderStyle
+from ..utils.color import Color, COLORS
+
+def timeit(func: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+def run(repeat: int = 200000) -> None:
+    red = Color((255, 0, 0))
+    cache = {(red, 'label'): None}
+
+    cases = (
+        ('Color(tuple)', lambda: Color((255, 0, 0))),
+        ('Color(hex)', lambda: Color('#ff8000')),
+        ('COLORS.BLACK', lambda: COLORS.BLACK),
+        ('hash(color)', lambda: hash(red)),
+        ('cache lookup, new color', lambda: (Color((255, 0, 0)), 'label') in cache),
+        ('cache lookup, named color', lambda: (COLORS.RED, 'label') in cache),
+        ('ButtonStyle()', lambda: ButtonStyle(None)),
+        ('SliderStyle()', lambda: SliderStyle()),
+    )
+    print(f'{"case":<28} {"ns/op":>8}')
+    for name, func in cases:
+        print(f'{name:<28} {timeit(func, repeat) * 1e9:>8.0f}')
+
+    # Before colors compared by value, equal colors missed every cache keyed by them
+    print(f'equal colors hit the cache: {(Color((255, 0, 0)), "label") in cache}')
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,38 @@
+'''
+Times a keystroke with HangulComposer against composing the whole buffer again on every key.
+Composition itself is checked by tests/test_hangul.py.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.hangul [maxKeys]
+'''
+import sys
+import time
+
+from ..utils.language import Hangul, HangulComposer
+
+def run(maxKeys: int = 4000) -> None:
+    print(f'{"keys":>8} {"recompose us/key":>18} {"composer us/key":>16} {"speedup":>8}')
+    sentence = 'dkssudgktpdy tjdnfdms qkfqk '
+    count = 250
+    while count <= maxKeys:
+        keys = (sentence * (count // len(sentence) + 1))[:count]
+
+        start = time.perf_counter()
+        buffer = ''
+        for key in keys:
+            buffer += key
+            Hangul.combineIntoHangul(buffer)
+        recompose = (time.perf_counter() - start) / count
+
+        start = time.perf_counter()
+        composer = HangulComposer()
+        for key in keys:
+            composer.push(key)
+            composer.text
+        incremental = (time.perf_counter() - start) / count
+
+        print(f'{count:>8} {recompose * 1e6:>18.2f} {incremental * 1e6:>16.2f} {recompose / incremental:>7.1f}x')
+        count *= 2
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 4000)
@@ -0,0 +1,75 @@
+'''
+Hit-testing benchmark for Surface mouse event dispatch.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.hittest [numOfButtons]
+'''
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import time
+import random
+from typing import List, Optional
+
+import pygame
+
+from ..components.Scene import Scene
+from ..components.Button import Button, ButtonStyle
+from ..components.Base import InteractiveComponent
+from ..utils.color import COLORS
+
+class GridScene(Scene):
+    def __init__(self, size, numOfButtons: int) -> None:
+        super().__init__(size)
+        columns = int(numOfButtons ** 0.5) + 1
+        w = size[0] // columns
+        h = size[1] // columns
+        style = ButtonStyle(None, backgroundHoverColor=COLORS.RED)
+        self.buttons = [Button(((i % columns) * w, (i // columns) * h), (w - 2, h - 2), style) for i in range(numOfButtons)]
+
+    def draw(self):
+        for button in self.buttons:
+            self.drawButton(button)
+
+def linearTarget(objects: List[InteractiveComponent], pos) -> Optional[InteractiveComponent]:
+    # Reference implementation of the former linear scan
+    temp = None
+    for obj in objects:
+        if obj.doEventSpread(pos):
+            if temp is None or temp.zIndex is None:
+                temp = obj
+            elif obj.zIndex is not None and temp.zIndex <= obj.zIndex:
+                temp = obj
+    return temp
+
+def run(numOfButtons: int = 10000, numOfEvents: int = 20000) -> None:
+    pygame.init()
+    size = (1920, 1080)
+    pygame.display.set_mode(size)
+
+    scene = GridScene(size, numOfButtons)
+    scene.draw()
+    scene.render()
+
+    rng = random.Random(0)
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(rng.randrange(size[0]), rng.randrange(size[1])), rel=(0, 0), buttons=(0, 0, 0)) for _ in range(numOfEvents)]
+
+    start = time.perf_counter()
+    for event in events:
+        scene.onMouseMove(event)
+    indexed = time.perf_counter() - start
+
+    sample = events[:max(1, numOfEvents // 20)]
+    start = time.perf_counter()
+    for event in sample:
+        linearTarget(scene.buttons, event.pos)
+    linear = (time.perf_counter() - start) * (numOfEvents / len(sample))
+
+    print(f'{numOfButtons} buttons, {numOfEvents} MOUSEMOTION events')
+    print(f'  spatial index : {indexed / numOfEvents * 1e6:9.2f} us/event')
+    print(f'  linear scan   : {linear / numOfEvents * 1e6:9.2f} us/event (hit test only)')
+    pygame.quit()
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,84 @@
+'''
+Memory held by each widget instance and the time to construct it, measured over a large grid of widgets
+with a few of them having event listeners.\n
+Every widget is also measured as it was before __slots__ and lazy event listeners, as a baseline.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.memory [count]
+'''
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import gc
+import sys
+import time
+import tracemalloc
+from types import MemberDescriptorType
+from typing import Callable, List, Type
+
+import pygame
+
+from ..components.Base import InteractiveComponent
+from ..components.TextBox import TextBox, TextBoxStyle
+from ..components.Button import Button, ButtonStyle, Slider, SliderStyle
+from ..utils.event import EventType
+
+def baseline(cls: Type[InteractiveComponent]) -> Type[InteractiveComponent]:
+    '''
+    Subclass of a widget keeping its attributes in a __dict__ and a listener list for every event type,
+    as widgets did before they had __slots__ and created their listener lists lazily.
+    '''
+    # Slots are kept by the subclass, so their values are copied into the __dict__ to have it hold the same attributes
+    slots = [value for c in cls.__mro__ for value in vars(c).values() if isinstance(value, MemberDescriptorType)]
+
+    class Baseline(cls):
+        def __init__(self, *args) -> None:
+            super().__init__(*args)
+            self._InteractiveComponent__eventListeners = {eventType: [] for eventType in EventType}
+            self.__dict__.update({slot.__name__: slot.__get__(self) for slot in slots})
+
+    return Baseline
+
+def measure(build: Callable[[int], InteractiveComponent], count: int) -> tuple:
+    gc.collect()
+    start = time.perf_counter()
+    widgets: List[InteractiveComponent] = [build(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    del widgets
+
+    # Tracing slows allocations down, so memory is measured on a second pass
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    widgets = [build(i) for i in range(count)]
+    # One widget in a hundred listens to clicks
+    for widget in widgets[::100]:
+        widget.addEventListener(EventType.onClick, print)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del widgets
+    return (after - before) / count, elapsed / count
+
+def run(count: int = 20000) -> None:
+    pygame.init()
+    font = pygame.font.Font(None, 20)
+    textBoxStyle = TextBoxStyle(font)
+    buttonStyle = ButtonStyle(font)
+    sliderStyle = SliderStyle()
+
+    widgets = (
+        ('TextBox', TextBox, lambda cls, i: cls((i % 100 * 50, i // 100 * 20), (50, 20), textBoxStyle, 'cell')),
+        ('Button', Button, lambda cls, i: cls((i % 100 * 50, i // 100 * 20), (50, 20), buttonStyle, 'cell')),
+        ('Slider', Slider, lambda cls, i: cls((i % 100 * 50, i // 100 * 20), (50, 10), sliderStyle, 0.5)),
+    )
+    print(f'{"widget":<10} {"bytes before":>13} {"bytes after":>12} {"us before":>10} {"us after":>9}')
+    for name, cls, build in widgets:
+        old = baseline(cls)
+        oldSize, oldElapsed = measure(lambda i: build(old, i), count)
+        size, elapsed = measure(lambda i: build(cls, i), count)
+        print(f'{name:<10} {oldSize:>13.0f} {size:>12.0f} {oldElapsed * 1e6:>10.2f} {elapsed * 1e6:>9.2f}')
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,65 @@
+'''
+Frames of a scene with sliders, scroll boxes and an opened dropdown, with the surface pool reusing surfaces
+and with it disabled, reporting pygame surfaces allocated per frame.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.pool [frames]
+'''
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import time
+
+import pygame
+
+from ..components.Surface import Container, ScrollBox, ScrollBoxStyle, Dropdown, DropdownStyle
+from ..components.Button import Slider, SliderStyle, ButtonStyle
+from ..utils.app import renewFramerate
+from ..utils.color import COLORS
+from ..utils.pool import getSurfacePool
+from ..utils.profiler import enableProfiling, disableProfiling
+
+def run(frames: int = 300) -> None:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    renewFramerate(60)
+    font = pygame.font.Font(None, 20)
+
+    rows = [Container.buildByCenteredText((195, 30), f'row {i}', font, COLORS.BLACK, COLORS.WHITE) for i in range(200)]
+    boxes = [ScrollBox((10 + 210 * i, 10), (200, 300), ScrollBoxStyle(elementHeight=30, backgroundColor=COLORS.GRAY), contents=rows) for i in range(4)]
+    sliders = [Slider((20, 340 + 20 * i), (400, 10), SliderStyle(sliderRadius=5), i / 10) for i in range(10)]
+    dropdown = Dropdown((450, 340), (150, 30), (150, 240), DropdownStyle(ButtonStyle(font), ScrollBoxStyle(elementHeight=30), font, COLORS.BLACK, COLORS.WHITE, COLORS.SKYBLUE), [f'item {i}' for i in range(50)])
+    dropdown.onButtonClick(None)
+    scene = Container((0, 0), (860, 600))
+
+    print(f'{"pool":<10} {"ms/frame":>10} {"surfaces/frame":>15} {"pool hit rate":>14}')
+    for name, maxFree in (('disabled', 0), ('enabled', 32)):
+        pool = getSurfacePool()
+        pool.maxFreePerKey = maxFree
+        pool.clear()
+        profiler = enableProfiling()
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            profiler.beginFrame()
+            scene.tick()
+            scene.fill(COLORS.BLACK)
+            for i, slider in enumerate(sliders):
+                slider.value = ((frame + i) % 50) / 50
+                scene.drawSlider(slider)
+            for box in boxes:
+                scene.drawScrollBox(box)
+            scene.drawDropdown(dropdown)
+            scene.render()
+            profiler.endFrame()
+        elapsed = (time.perf_counter() - start) / frames
+
+        # The average over the window excludes the first frames, which fill the pool
+        print(f'{name:<10} {elapsed * 1000:>10.3f} {profiler.allocationsPerFrame:>15.2f} {pool.stats.hitRate:>14.2f}')
+        disableProfiling()
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,84 @@
+'''
+Soak benchmark for listener registration over a long uptime.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.soak [numOfFrames]
+
+A surface with a ScrollBox and a Slider is drawn every frame and receives one MOUSEMOTION and one MOUSEBUTTONUP.
+Dispatch time and traced memory are reported per window of frames. The run fails with a non-zero exit
+if either has grown from the first window to the last by more than the tolerances.
+'''
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+from ..components.Surface import Container, ScrollBox, ScrollBoxStyle
+from ..components.Button import Slider, SliderStyle
+from ..utils.color import COLORS
+from ..utils.app import renewFramerate
+
+# Growth allowed from the first window to the last
+MEMORY_TOLERANCE = 64 * 1024
+DISPATCH_TOLERANCE = 1.5
+
+def run(numOfFrames: int = 100000, numOfWindows: int = 10) -> bool:
+    '''
+    Return:
+        True if memory and dispatch time have stayed within the tolerances
+    '''
+    pygame.init()
+    pygame.display.set_mode((640, 480))
+    renewFramerate(60)
+
+    surface = Container((0, 0), (640, 480))
+    box = ScrollBox((10, 10), (200, 300), ScrollBoxStyle(elementHeight=30), contents=[Container((0, 0), (195, 30)) for _ in range(20)])
+    slider = Slider((300, 100), (200, 10), SliderStyle())
+
+    move = pygame.event.Event(pygame.MOUSEMOTION, pos=(400, 105), rel=(1, 0), buttons=(0, 0, 0))
+    up = pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(400, 105), button=1)
+
+    window = max(numOfFrames // numOfWindows, 1)
+    tracemalloc.start()
+    print(f'{"frames":>10} {"dispatch us/frame":>18} {"traced KiB":>12}')
+
+    windows = []
+    dispatch = 0.0
+    for frame in range(1, numOfFrames + 1):
+        surface.tick()
+        surface.drawScrollBox(box)
+        surface.drawSlider(slider)
+        surface.render()
+
+        start = time.perf_counter()
+        surface.onMouseMove(move)
+        surface.onMouseUp(up)
+        dispatch += time.perf_counter() - start
+
+        if frame % window == 0:
+            current, _ = tracemalloc.get_traced_memory()
+            print(f'{frame:>10} {dispatch / window * 1e6:>18.2f} {current / 1024:>12.1f}')
+            windows.append((dispatch / window, current))
+            dispatch = 0.0
+
+    tracemalloc.stop()
+    pygame.quit()
+
+    (firstDispatch, firstMemory), (lastDispatch, lastMemory) = windows[0], windows[-1]
+    passed = True
+    if lastMemory - firstMemory > MEMORY_TOLERANCE:
+        print(f'FAIL: traced memory grew by {(lastMemory - firstMemory) / 1024:.1f} KiB')
+        passed = False
+    if lastDispatch > firstDispatch * DISPATCH_TOLERANCE:
+        print(f'FAIL: dispatch time grew from {firstDispatch * 1e6:.2f} to {lastDispatch * 1e6:.2f} us/frame')
+        passed = False
+    if passed:
+        print('memory and dispatch time stayed flat')
+    return passed
+
+if __name__ == '__main__':
+    sys.exit(0 if run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000) else 1)
@@ -0,0 +1,294 @@
+'''
+Headless benchmark suite for the rendering and event pipeline.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.suite [--quick] [--output results.json] [--filter name]
+
+Every case is measured frame by frame and reported as frames/sec, p50/p99 frame time and the peak RSS of the process
+after the case has run. Results are written to a JSON file so they can be compared between commits.
+'''
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from ..core.app import App
+from ..components.Scene import Scene
+from ..components.Surface import Container, ScrollBox, ScrollBoxStyle, ScrollBoxSource, Dropdown, DropdownStyle
+from ..components.TextBox import TextBox, TextBoxStyle
+from ..components.Button import Button, ButtonStyle
+from ..utils.color import Color, COLORS
+from ..utils.font import loadFont
+from ..utils.app import renewFramerate
+
+SCREEN_SIZE = (1280, 720)
+
+# name -> (setup returning a callable which runs one frame, number of frames)
+Case = Tuple[str, Callable[[], Callable[[], None]], int]
+
+def getPeakRSS() -> Optional[int]:
+    '''
+    Return:
+        Peak resident set size of the process in bytes, None if it cannot be measured on this platform
+    '''
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+def measure(name: str, frame: Callable[[], None], numOfFrames: int) -> Dict:
+    frame()  # warm up caches before measuring
+
+    times = []
+    for _ in range(numOfFrames):
+        start = time.perf_counter()
+        frame()
+        times.append(time.perf_counter() - start)
+
+    return summarize(name, times)
+
+def summarize(name: str, times: List[float]) -> Dict:
+    total = sum(times)
+    return {
+        'name': name,
+        'frames': len(times),
+        'fps': len(times) / total if total > 0 else float('inf'),
+        'p50_ms': percentile(times, 50) * 1000,
+        'p99_ms': percentile(times, 99) * 1000,
+        'peak_rss': getPeakRSS(),
+    }
+
+def primitives(size: Tuple[int, int]) -> Callable[[], None]:
+    surface = Container((0, 0), size)
+    rng = random.Random(0)
+    w, h = size
+    shapes = [((rng.randrange(w), rng.randrange(h)), (rng.randrange(4, 64), rng.randrange(4, 64))) for _ in range(50)]
+    opaque = COLORS.RED
+    translucent = Color((0, 0, 255, 128))
+
+    def frame() -> None:
+        surface.fill(COLORS.WHITE)
+        for i, (pos, s) in enumerate(shapes):
+            color = opaque if i % 2 == 0 else translucent
+            surface.drawRect(color, pos, s)
+            surface.drawCircle(color, pos, s[0] // 2, 0, True, True, True, True)
+            surface.drawLine(color, pos, (pos[0] + s[0], pos[1] + s[1]), 2)
+            surface.drawAntialiasedLine(color, pos, (pos[0] + s[1], pos[1] + s[0]))
+        surface.render()
+
+    return frame
+
+def widgetGrid(kind: str, numOfWidgets: int) -> Callable[[], None]:
+    surface = Container((0, 0), SCREEN_SIZE)
+    columns = int(numOfWidgets ** 0.5) + 1
+    w = max(SCREEN_SIZE[0] // columns, 4)
+    h = max(SCREEN_SIZE[1] // columns, 4)
+
+    if kind == 'button':
+        style = ButtonStyle('bench', backgroundHoverColor=COLORS.SKYBLUE)
+        widgets = [Button(((i % columns) * w, (i // columns) * h), (w - 2, h - 2), style, str(i)) for i in range(numOfWidgets)]
+        draw = surface.drawButton
+    else:
+        style = TextBoxStyle('bench')
+        widgets = [TextBox(((i % columns) * w, (i // columns) * h), (w - 2, h - 2), style, str(i)) for i in range(numOfWidgets)]
+        draw = surface.drawTextBox
+
+    def frame() -> None:
+        surface.tick()
+        surface.fill(COLORS.WHITE)
+        for widget in widgets:
+            draw(widget)
+        surface.render()
+
+    return frame
+
+class _RowSource(ScrollBoxSource):
+    def __init__(self, numOfRows: int, size: Tuple[int, int]) -> None:
+        self.__numOfRows = numOfRows
+        self.__size = size
+
+    def count(self) -> int:
+        return self.__numOfRows
+
+    def build(self, index: int, hovered: bool) -> Container:
+        return Container.buildByCenteredText(self.__size, str(index), 'bench', COLORS.BLACK, COLORS.SKYBLUE if hovered else COLORS.WHITE)
+
+def scrollBox(numOfRows: int) -> Callable[[], None]:
+    style = ScrollBoxStyle(elementHeight=30, backgroundColor=COLORS.WHITE)
+    box = ScrollBox((0, 0), (300, 600), style, source=_RowSource(numOfRows, (295, 30)))
+    down = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1)
+    up = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=1)
+    state = {'event': down}
+
+    def frame() -> None:
+        # Scroll back and forth so rows keep entering the viewport
+        if box.offset >= box.maxOffset:
+            state['event'] = up
+        elif box.offset <= 0:
+            state['event'] = down
+        box.onMouseWheel(state['event'])
+        box.render()
+
+    return frame
+
+def dropdown(opened: bool) -> Callable[[], None]:
+    surface = Container((0, 0), SCREEN_SIZE)
+    style = DropdownStyle(ButtonStyle('bench'), ScrollBoxStyle(elementHeight=30), 'bench', COLORS.BLACK, COLORS.WHITE, COLORS.SKYBLUE)
+    box = Dropdown((100, 100), (200, 30), (200, 300), style, [f'item {i}' for i in range(1000)])
+    if opened:
+        box.onButtonClick(None)
+
+    def frame() -> None:
+        surface.tick()
+        surface.fill(COLORS.WHITE)
+        surface.drawDropdown(box)
+        surface.render()
+
+    return frame
+
+def mouseMotionStorm(numOfWidgets: int, numOfEvents: int) -> Callable[[], None]:
+    surface = Container((0, 0), SCREEN_SIZE)
+    columns = int(numOfWidgets ** 0.5) + 1
+    w = SCREEN_SIZE[0] // columns
+    h = SCREEN_SIZE[1] // columns
+    style = ButtonStyle(None, backgroundHoverColor=COLORS.SKYBLUE)
+    buttons = [Button(((i % columns) * w, (i // columns) * h), (w - 2, h - 2), style) for i in range(numOfWidgets)]
+    for button in buttons:
+        surface.drawButton(button)
+    surface.render()
+
+    rng = random.Random(0)
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(rng.randrange(SCREEN_SIZE[0]), rng.randrange(SCREEN_SIZE[1])), rel=(0, 0), buttons=(0, 0, 0)) for _ in range(numOfEvents)]
+
+    def frame() -> None:
+        for event in events:
+            surface.onMouseMove(event)
+
+    return frame
+
+class _ScriptedScene(Scene):
+    def __init__(self, app: App, numOfFrames: int) -> None:
+        super().__init__(SCREEN_SIZE)
+        self.__app = app
+        self.__numOfFrames = numOfFrames
+        self.__last: Optional[float] = None
+        self.times: List[float] = []
+
+        style = ButtonStyle('bench', backgroundHoverColor=COLORS.SKYBLUE)
+        self.__buttons = [Button(((i % 20) * 64, (i // 20) * 36), (60, 32), style, str(i)) for i in range(400)]
+        self.__rng = random.Random(0)
+
+    def draw(self):
+        self.fill(COLORS.WHITE)
+        for button in self.__buttons:
+            self.drawButton(button)
+
+    def tick(self):
+        now = time.perf_counter()
+        if self.__last is not None:
+            self.times.append(now - self.__last)
+        self.__last = now
+
+        if len(self.times) >= self.__numOfFrames:
+            self.__app.terminate()
+        else:
+            # Script some input so the frames are not all identical
+            pos = (self.__rng.randrange(SCREEN_SIZE[0]), self.__rng.randrange(SCREEN_SIZE[1]))
+            pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+        super().tick()
+
+def appRun(numOfFrames: int, retained: bool) -> Dict:
+    '''
+    App.run quits pygame when it returns, so it has to be the last case.
+    '''
+    app = App()
+    app.setWindowMode(*SCREEN_SIZE)
+    app.framerate = 0
+    app.retainedMode = retained
+    scene = _ScriptedScene(app, numOfFrames)
+    try:
+        app.run(scene)
+    except SystemExit:
+        pass
+    return summarize(f'app.run/{"retained" if retained else "immediate"}', scene.times)
+
+def getCases(quick: bool) -> List[Case]:
+    frames = 20 if quick else 120
+    counts = [100, 1000] if quick else [100, 1000, 10000]
+    rows = [10, 1000] if quick else [10, 1000, 10000]
+
+    cases: List[Case] = []
+    for size in [(320, 240), (1280, 720), (1920, 1080)]:
+        cases.append((f'primitives/{size[0]}x{size[1]}', lambda size=size: primitives(size), frames))
+    for kind in ['textbox', 'button']:
+        for n in counts:
+            cases.append((f'{kind}-grid/{n}', lambda kind=kind, n=n: widgetGrid(kind, n), max(frames // (n // 100), 5)))
+    for n in rows:
+        cases.append((f'scrollbox/{n}', lambda n=n: scrollBox(n), frames))
+    cases.append(('dropdown/closed', lambda: dropdown(False), frames))
+    cases.append(('dropdown/opened', lambda: dropdown(True), frames))
+    for n in counts:
+        cases.append((f'mousemotion/{n}', lambda n=n: mouseMotionStorm(n, 1000), max(frames // 4, 5)))
+    return cases
+
+def run(output: str, quick: bool = False, pattern: Optional[str] = None) -> List[Dict]:
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    loadFont(None, 18, 'bench')
+    renewFramerate(60)
+
+    results = []
+    for name, setup, numOfFrames in getCases(quick):
+        if pattern is not None and pattern not in name:
+            continue
+        result = measure(name, setup(), numOfFrames)
+        results.append(result)
+        print(f'{name:<28} {result["fps"]:10.1f} fps  p50 {result["p50_ms"]:8.3f} ms  p99 {result["p99_ms"]:8.3f} ms')
+
+    for retained in [False, True]:
+        name = f'app.run/{"retained" if retained else "immediate"}'
+        if pattern is not None and pattern not in name:
+            continue
+        if not pygame.get_init():
+            pygame.init()
+            loadFont(None, 18, 'bench')
+        result = appRun(20 if quick else 120, retained)
+        results.append(result)
+        print(f'{name:<28} {result["fps"]:10.1f} fps  p50 {result["p50_ms"]:8.3f} ms  p99 {result["p99_ms"]:8.3f} ms')
+
+    report = {
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'results written to {output}')
+
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Replex benchmark suite')
+    parser.add_argument('--output', default='benchmark-results.json')
+    parser.add_argument('--quick', action='store_true', help='fewer frames and smaller cases')
+    parser.add_argument('--filter', default=None, help='only run cases whose name contains this')
+    args = parser.parse_args()
+    run(args.output, args.quick, args.filter)
@@ -0,0 +1,62 @@
+'''
+Latency of a keystroke and the following frame in a TextInput holding long text,
+against a TextBox whose whole text is replaced and rendered again on every key.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.textinput [maxLength]
+'''
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import time
+
+import pygame
+
+from ..components.Surface import Container
+from ..components.TextBox import TextBox, TextBoxStyle
+from ..components.TextInput import TextInput, TextInputStyle
+from ..utils.font import clearTextCache
+
+KEYS = 200
+
+def keyEvent(key: int) -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='')
+
+def run(maxLength: int = 16000) -> None:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    font = pygame.font.Font(None, 20)
+    surface = Container((0, 0), (800, 60))
+    print(f'{"length":>8} {"replace ms/key":>16} {"TextInput ms/key":>18} {"speedup":>8}')
+
+    length = 1000
+    while length <= maxLength:
+        text = ('operator note ' * (length // 14 + 1))[:length]
+        clearTextCache()
+
+        box = TextBox((0, 10), (800, 40), TextBoxStyle(font), text)
+        start = time.perf_counter()
+        for i in range(KEYS):
+            box.text = box.text[:length // 2 + i] + chr(97 + i % 26) + box.text[length // 2 + i:]
+            surface.drawTextBox(box)
+            surface.render()
+        replace = (time.perf_counter() - start) / KEYS
+
+        textInput = TextInput((0, 10), (800, 40), TextInputStyle(font), text)
+        # Type in the middle so the text after the cursor has to move too
+        textInput.cursor = length // 2
+        start = time.perf_counter()
+        for i in range(KEYS):
+            textInput.onKeyDown(keyEvent(pygame.K_a + i % 26))
+            surface.drawTextInput(textInput)
+            surface.render()
+        incremental = (time.perf_counter() - start) / KEYS
+
+        print(f'{length:>8} {replace * 1000:>16.3f} {incremental * 1000:>18.3f} {replace / incremental:>7.1f}x')
+        length *= 2
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 16000)
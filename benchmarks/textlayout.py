@@ -0,0 +1,80 @@
+'''
+Cost of laying out a large text cold, again after editing one paragraph, and of drawing a frame of it
+in a ScrollBox through TextLayoutSource against drawing every line.
+
+Run from the directory containing Replex:
+    python -m Replex.benchmarks.textlayout [maxParagraphs]
+'''
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import time
+from typing import Callable
+
+import pygame
+
+from ..components.Surface import Container, ScrollBox, ScrollBoxStyle, TextLayoutSource
+from ..utils.color import COLORS
+from ..utils.font import clearTextCache
+from ..utils.textlayout import clearLayoutCache, getLayoutCacheStats, layoutText
+
+WIDTH = 480
+
+def timeit(func: Callable[[], None], repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(maxParagraphs: int = 2000) -> None:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    font = pygame.font.Font(None, 20)
+    words = 'the operator noted that the pressure in line four was stable after the valve was replaced'.split()
+    print(f'{"paragraphs":>10} {"lines":>7} {"cold ms":>9} {"edit ms":>9} {"all lines ms":>13} {"scrollbox ms":>13}')
+
+    count = 250
+    while count <= maxParagraphs:
+        paragraphs = [f'{i}. ' + ' '.join(words[(i + j) % len(words)] for j in range(30 + i % 40)) for i in range(count)]
+        text = '\n'.join(paragraphs)
+
+        def cold() -> None:
+            clearLayoutCache()
+            layoutText(text, font, WIDTH)
+        coldTime = timeit(cold)
+
+        edits = iter(range(1000))
+        def edit() -> None:
+            # Only the edited paragraph misses the line break cache
+            paragraphs[count // 2] += f' {next(edits)}'
+            layoutText('\n'.join(paragraphs), font, WIDTH)
+        editTime = timeit(edit)
+        stats = getLayoutCacheStats()
+        layout = layoutText('\n'.join(paragraphs), font, WIDTH)
+
+        surface = Container((0, 0), (WIDTH + 5, 600))
+        clearTextCache()
+        def drawAll() -> None:
+            h = layout.lineHeight
+            for i, line in enumerate(layout.lines):
+                surface.drawTextByFont((0, h * i), line, font, COLORS.BLACK)
+            surface.render()
+        allTime = timeit(drawAll, 1)
+
+        source = TextLayoutSource(layout.text, font, COLORS.BLACK, WIDTH, COLORS.WHITE)
+        box = ScrollBox((0, 0), (WIDTH + 5, 600), ScrollBoxStyle(elementHeight=source.lineHeight), source=source)
+        def drawBox() -> None:
+            surface.drawScrollBox(box)
+            surface.render()
+        boxTime = timeit(drawBox, 1)
+
+        print(f'{count:>10} {layout.numOfLines:>7} {coldTime * 1000:>9.2f} {editTime * 1000:>9.2f} {allTime * 1000:>13.2f} {boxTime * 1000:>13.2f}   (break cache hit rate {stats.hitRate:.2f})')
+        count *= 2
+
+    pygame.quit()
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -1,12 +1,31 @@
 from __future__ import annotations
+from typing import Dict, Optional
 
 import pygame
 
-__all__ = ['Audio']
+__preloadedSounds: Dict[str, bytes] = {}
+
+__all__ = ['Audio', 'addPreloadedSound', 'getPreloadedSound', 'clearPreloadedSounds']
+
+def addPreloadedSound(path: str, raw: bytes) -> None:
+    '''
+    Stores samples decoded elsewhere, Audio created from path uses them instead of decoding the file again
+    '''
+    __preloadedSounds[path] = raw
+
+def getPreloadedSound(path: str) -> Optional[bytes]:
+    return __preloadedSounds.get(path)
+
+def clearPreloadedSounds() -> None:
+    __preloadedSounds.clear()
 
 class Audio:
     def __init__(self, path: str) -> None:
-        self.__audio = pygame.mixer.Sound(path)
+        raw = getPreloadedSound(path)
+        if raw is not None:
+            self.__audio = pygame.mixer.Sound(buffer=raw)
+        else:
+            self.__audio = pygame.mixer.Sound(path)
 
     def play(self, loops: int = 1, maxtime: int = 0, fade: int = 0) -> Audio:
         '''
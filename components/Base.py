@@ -2,16 +2,24 @@ from __future__ import annotations
 
 from typing import final, Callable, Dict, List, Optional
 from ..utils.event import EventType
-from ..utils.position import int2d, float2d
+from ..utils.position import int2d, float2d, getBoundingRect
 from pygame.event import Event
+from pygame import Rect
 
 __all__ = ['Component', 'InteractiveComponent']
 
 class Component:
+    '''
+    Components use __slots__ to stay small in large widget trees. Subclasses without __slots__ of their own
+    still work, but get a __dict__ back.
+    '''
+    __slots__ = ('__pos', '__size', '__zIndex', '__dirty')
+
     def __init__(self, pos: float2d, size: int2d) -> None:
         self.__pos: float2d = pos
         self.__size: int2d = size
         self.__zIndex: Optional[int] = None
+        self.__dirty: bool = True
 
     @final
     @property
@@ -21,7 +29,9 @@ class Component:
     @final
     @pos.setter
     def pos(self, pos: float2d):
-        self.__pos = pos
+        if pos != self.__pos:
+            self.__pos = pos
+            self.markDirty()
 
     @final
     @property
@@ -31,7 +41,9 @@ class Component:
     @final
     @size.setter
     def size(self, size: int2d):
-        self.__size = size
+        if size != self.__size:
+            self.__size = size
+            self.markDirty()
        
     @final
     @property
@@ -43,6 +55,36 @@ class Component:
     def zIndex(self, zindex: Optional[int]):
         self.__zIndex = zindex
 
+    @property
+    def isDirty(self) -> bool:
+        '''
+        Return:
+            True if the component has changed since it was last drawn by a retained Surface
+        '''
+        return self.__dirty
+
+    def markDirty(self) -> None:
+        self.__dirty = True
+
+    def clearDirty(self) -> None:
+        self.__dirty = False
+
+    @property
+    def isAnimating(self) -> bool:
+        '''
+        Return:
+            True if the component changes by itself and needs frames without any input event
+        '''
+        return False
+
+    @property
+    def renderRect(self) -> Rect:
+        '''
+        Return:
+            The area covered by the component when it is drawn
+        '''
+        return getBoundingRect(self.pos, self.size)
+
     @final
     def vw(self, radio: float) -> int:
         '''
@@ -74,14 +116,15 @@ class Component:
     
 
 class InteractiveComponent(Component):
+    __slots__ = ('__isMouseEntered', '__eventListeners', '__clickpos', '__clickbtn')
+
     def __init__(self, pos: float2d, size: int2d) -> None:
         super().__init__(pos, size)
         self.__isMouseEntered: bool = False
-        self.__eventListeners: Dict[EventType, List[Callable[..., None]]] = {}
+        # Lists are only created for the event types which get a listener
+        self.__eventListeners: Optional[Dict[EventType, List[Callable[..., None]]]] = None
         self.__clickpos: Optional[float2d] = None
         self.__clickbtn: Optional[int] = None
-        for type in EventType:
-            self.__eventListeners[type] = []
     
     @final
     @property
@@ -90,60 +133,72 @@ class InteractiveComponent(Component):
     
     @final
     def addEventListener(self, eventType: EventType, callback: Callable[..., None]) -> InteractiveComponent:
-        self.__eventListeners[eventType].append(callback)
+        if self.__eventListeners is None:
+            self.__eventListeners = {}
+        self.__eventListeners.setdefault(eventType, []).append(callback)
         return self
     
     @final
     def removeEventListener(self, eventType: EventType, callback: Callable[..., None]) -> InteractiveComponent:
-        self.__eventListeners[eventType].remove(callback)
+        '''
+        Raises ValueError if the callback is not listening to eventType
+        '''
+        callbacks = self.__eventListeners.get(eventType) if self.__eventListeners is not None else None
+        if callbacks is None:
+            raise ValueError(f'{callback} is not listening to {eventType}')
+        callbacks.remove(callback)
         return self
 
     @final
     def clearEventListeners(self, eventType: EventType) -> InteractiveComponent:
-        self.__eventListeners[eventType].clear()
+        if self.__eventListeners is not None and eventType in self.__eventListeners:
+            self.__eventListeners[eventType].clear()
         return self
 
+    def __dispatch(self, eventType: EventType, event) -> None:
+        if self.__eventListeners is None:
+            return
+        callbacks = self.__eventListeners.get(eventType)
+        if callbacks is not None:
+            for callback in callbacks:
+                callback(event)
+
     def doEventSpread(self, pos: float2d) -> bool:
         cpos = self.pos
         size = self.size
         return (cpos[0] < pos[0] < cpos[0] + size[0]) and (cpos[1] < pos[1] < cpos[1] + size[1])
 
     def onClick(self, event) -> None:
-        for callback in self.__eventListeners[EventType.onClick]:
-            callback(event)
+        self.__dispatch(EventType.onClick, event)
 
     def onMouseDown(self, event) -> None:
         self.__clickpos = event.pos
         self.__clickbtn = event.button
-        for callback in self.__eventListeners[EventType.onMouseDown]:
-            callback(event)
+        self.__dispatch(EventType.onMouseDown, event)
 
     def onMouseUp(self, event) -> None:
         if self.__clickpos == event.pos and self.__clickbtn == event.button:
             self.onClick(Event(1026, {'pos': event.pos, 'button': event.button}))
         self.__clickpos = None
 
-        for callback in self.__eventListeners[EventType.onMouseUp]:
-            callback(event)
+        self.__dispatch(EventType.onMouseUp, event)
 
     def onMouseWheel(self, event) -> None:
-        for callback in self.__eventListeners[EventType.onMouseWheel]:
-            callback(event)
+        self.__dispatch(EventType.onMouseWheel, event)
 
     def onMouseMove(self, event) -> None:
         self.__clickpos = None
         self.__clickbtn = None
-        for callback in self.__eventListeners[EventType.onMouseMove]:
-            callback(event)
+        self.__dispatch(EventType.onMouseMove, event)
     
     def onMouseEnter(self, event) -> None:
         '''
         * This event doesn't work on Scene
         '''
         self.__isMouseEntered = True
+        self.markDirty()
 
-        for callback in self.__eventListeners[EventType.onMouseEnter]:
-            callback(event)
+        self.__dispatch(EventType.onMouseEnter, event)
 
     def onMouseLeave(self, event) -> None:
         '''
@@ -152,17 +207,15 @@ class InteractiveComponent(Component):
         self.__clickpos = None
         self.__clickbtn = None
         self.__isMouseEntered = False
+        self.markDirty()
 
-        for callback in self.__eventListeners[EventType.onMouseLeave]:
-            callback(event)
+        self.__dispatch(EventType.onMouseLeave, event)
 
     def onKeyDown(self, event) -> None:
-        for callback in self.__eventListeners[EventType.onKeyDown]:
-            callback(event)
+        self.__dispatch(EventType.onKeyDown, event)
 
     def onKeyUp(self, event) -> None:
-        for callback in self.__eventListeners[EventType.onKeyUp]:
-            callback(event)
+        self.__dispatch(EventType.onKeyUp, event)
     
 '''class DynamicObject(DisplayObject, metaclass=ABCMeta):
     def __init__(self, pos: Pos) -> None:
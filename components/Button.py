@@ -1,12 +1,15 @@
 from __future__ import annotations
 from typing import Optional
 
+from pygame import Rect
+
 from Replex.utils.color import Color, COLORS
 from Replex.utils.font import Font
 from .Base import float2d, int2d, InteractiveComponent
 from .TextBox import TextBox, TextBoxStyle
 from Replex.utils.style import ComponentStyle
 from Replex.utils.event import EventType
+from Replex.utils.position import getBoundingRect
 
 __all__ = ['Button', 'ButtonStyle', 'Slider', 'SliderStyle']
 
@@ -20,6 +23,8 @@ class ButtonStyle(TextBoxStyle):
         self.textHoverColor = textHoverColor
 
 class Button(TextBox):
+    __slots__ = ('__backgroundHoverColor', '__textHoverColor')
+
     def __init__(self, pos: float2d, size: int2d, style: ButtonStyle, text: str = '') -> None:
         super().__init__(pos, size, style, text)
         self.__backgroundHoverColor = style.backgroundHoverColor
@@ -32,6 +37,7 @@ class Button(TextBox):
     @textHoverColor.setter
     def textHoverColor(self, color: Optional[Color]):
         self.__textHoverColor = color
+        self.markDirty()
 
     @property
     def textRenderColor(self) -> Color:
@@ -62,6 +68,7 @@ class Button(TextBox):
     @backgroundHoverColor.setter
     def backgroundHoverColor(self, color: Optional[Color]):
         self.__backgroundHoverColor = color
+        self.markDirty()
     
 class SliderStyle(ComponentStyle):
     sliderColor: Color
@@ -82,6 +89,8 @@ class SliderStyle(ComponentStyle):
         self.sliderFilledColor = sliderFilledColor
 
 class Slider(InteractiveComponent):
+    __slots__ = ('__sliderColor', '__handleColor', '__sliderRadius', '__handleRadius', '__handleSize', '__handleHoverColor', '__sliderFilledColor', '__value', '__handle', '__dragging')
+
     def __init__(self, pos: float2d, size: int2d, style: SliderStyle, value: float = 0) -> None:
         super().__init__(pos, size)
         self.__sliderColor = style.sliderColor
@@ -112,6 +121,7 @@ class Slider(InteractiveComponent):
     def value(self, value: float) -> None:
         self.__value = 1 if value > 1 else 0 if value < 0 else value
         self.renewHandlePos()
+        self.markDirty()
 
     @property
     def sliderColor(self) -> Color:
@@ -131,6 +141,21 @@ class Slider(InteractiveComponent):
     
     def getHandle(self) -> Button:
         return self.__handle
+
+    @property
+    def isDirty(self) -> bool:
+        return super().isDirty or self.__handle.isDirty
+
+    def clearDirty(self) -> None:
+        super().clearDirty()
+        self.__handle.clearDirty()
+
+    @property
+    def renderRect(self) -> Rect:
+        p = self.pos
+        hs = self.handleSize
+        s = self.size
+        return getBoundingRect((p[0] - (hs[0] / 2), p[1]), (s[0] + hs[0], s[1])).union(self.__handle.renderRect)
     
     def onMouseDown(self, event) -> None:
         self.value = (event.pos[0] - self.pos[0]) / self.size[0]
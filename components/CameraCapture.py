@@ -1,35 +1,144 @@
+import pygame
 import pygame.camera
-from typing import List
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, List, Optional
 from ..utils.position import float2d, int2d
 from .Base import Component
 
 pygame.camera.init(None)
 
-all = ["getCameraList", "CameraCapture"]
+__all__ = ["getCameraList", "CameraCapture"]
 
 def getCameraList() -> List[str]:
     return pygame.camera.list_cameras()
 
 class CameraCapture(Component):
-    def __init__(self, pos: float2d, size: int2d, device: str, hflip: bool = True, vflip: bool = False) -> None:
+    def __init__(self, pos: float2d, size: int2d, device: Optional[str], hflip: bool = True, vflip: bool = False, threaded: bool = False, bufferSize: int = 3, backend: Any = None) -> None:
+        '''
+        if threaded is True, frames are captured on a background thread so a slow camera does not hold back the frame.
+        Only the latest frame is kept, older frames which were never drawn are dropped.\n
+        backend replaces pygame.camera.Camera, such as a fake camera in tests. device is ignored if backend is given.
+        '''
         super().__init__(pos, size)
-        if device not in getCameraList():
-            raise ValueError("Invalid device name")
-        self.__cam = pygame.camera.Camera(device, size)
+        if backend is None:
+            if device not in getCameraList():
+                raise ValueError("Invalid device name")
+            backend = pygame.camera.Camera(device, size)
+        if threaded and bufferSize < 3:
+            raise ValueError("bufferSize must be at least 3")
+
+        self.__cam = backend
         self.__cam.start()
         self.__cam.set_controls(hflip, vflip)
-        
+
+        # Destination surfaces are reused instead of allocating one per frame
+        self.__buffers: List[pygame.Surface] = []
+        self.__latest: Optional[int] = None
+        self.__reading: Optional[int] = None
+        self.__unread: bool = False
+        self.__lock = threading.Lock()
+        self.__capturedFrames: int = 0
+        self.__droppedFrames: int = 0
+        self.__captureTimes: Deque[float] = deque(maxlen=30)
+        self.__thread: Optional[threading.Thread] = None
+        self.__running = threading.Event()
+
+        if threaded:
+            first = self.__cam.get_image()
+            self.__buffers = [first] + [first.copy() for _ in range(bufferSize - 1)]
+            self.__publish(0)
+            self.__running.set()
+            self.__thread = threading.Thread(target=self.__captureLoop, daemon=True)
+            self.__thread.start()
+
     def setOptions(self, hflip: bool = False, vflip: bool = False):
         self.__cam.set_controls(hflip, vflip)
 
     @property
-    def image(self):
-        return self.__cam.get_image()
-    
+    def threaded(self) -> bool:
+        return self.__thread is not None
+
+    def __publish(self, index: int) -> None:
+        with self.__lock:
+            if self.__unread:
+                self.__droppedFrames += 1
+            self.__latest = index
+            self.__unread = True
+            self.__capturedFrames += 1
+            self.__captureTimes.append(time.perf_counter())
+
+    def __captureLoop(self) -> None:
+        while self.__running.is_set():
+            with self.__lock:
+                # Never overwrite the frame being drawn or the latest one
+                index = next(i for i in range(len(self.__buffers)) if i != self.__latest and i != self.__reading)
+            try:
+                self.__cam.get_image(self.__buffers[index])
+            except Exception:
+                if not self.__running.is_set():
+                    break
+                raise
+            self.__publish(index)
+
     @property
-    def size(self) -> int2d:
-        return self.__size
-    
+    def image(self) -> pygame.Surface:
+        '''
+        Return:
+            The latest frame. In threaded mode it stays unchanged until image is requested again.
+        '''
+        if self.__thread is None:
+            if len(self.__buffers) == 0:
+                self.__buffers.append(self.__cam.get_image())
+            else:
+                self.__cam.get_image(self.__buffers[0])
+            self.__capturedFrames += 1
+            self.__captureTimes.append(time.perf_counter())
+            return self.__buffers[0]
+
+        with self.__lock:
+            self.__reading = self.__latest
+            self.__unread = False
+            return self.__buffers[self.__reading]
+
+    @property
+    def capturedFrames(self) -> int:
+        return self.__capturedFrames
+
+    @property
+    def droppedFrames(self) -> int:
+        '''
+        Return:
+            Number of captured frames which were replaced before they were drawn
+        '''
+        return self.__droppedFrames
+
+    @property
+    def captureFps(self) -> float:
+        with self.__lock:
+            times = list(self.__captureTimes)
+        if len(times) < 2 or times[-1] == times[0]:
+            return 0
+        return (len(times) - 1) / (times[-1] - times[0])
+
+    @property
+    def isDirty(self) -> bool:
+        if self.__thread is None:
+            return True
+        return self.__unread or super().isDirty
+
+    @property
+    def isAnimating(self) -> bool:
+        return True
+
+    def tick(self) -> None:
+        pass
+
     def stop(self):
+        if self.__thread is not None:
+            self.__running.clear()
+            self.__thread.join()
+            self.__thread = None
         self.__cam.stop()
-    
+
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, final, overload
+from typing import Hashable, Optional, final, overload
 
 import pygame
 
@@ -8,10 +8,13 @@ from .Base import InteractiveComponent
 from ..utils.position import float2d, int2d
 from ..utils.color import Color
 from ..utils.font import getFont, Font
+from ..utils.image import loadImage, getScaledImage
 
 __all__ = ['Image']
 
 class Image(InteractiveComponent):
+    __slots__ = ('__image', '__source', '__original')
+
     @overload
     def __init__(self, pos: float2d, path: str):
         ...
@@ -21,12 +24,18 @@ class Image(InteractiveComponent):
         ...
 
     def __init__(self, pos: float2d, value: str | pygame.surface.Surface) -> None:
+        '''
+        Images loaded from the same path share their pixel data, so the surface must not be modified.
+        '''
         if isinstance(value, pygame.surface.Surface):
             self.__image = value
+            self.__source: Hashable = value
         elif isinstance(value, str):
-            self.__image: pygame.surface.Surface = pygame.image.load(value)
+            self.__image: pygame.surface.Surface = loadImage(value)
+            self.__source = value
         else:
             raise Exception("Image source must not be None")
+        self.__original = self.__image
             
         super().__init__(pos, self.__image.get_size())
 
@@ -36,8 +45,12 @@ class Image(InteractiveComponent):
 
     @final
     def rescale(self, size: int2d) -> Image:
-        self.__image = pygame.transform.scale(self.__image, size)
+        '''
+        The image is always scaled from its original, and scaled variants are shared with other Images of the same source.
+        '''
+        self.__image = getScaledImage(self.__source, self.__original, size)
         self.size = size
+        self.markDirty()
         return self
     
     @staticmethod
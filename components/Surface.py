@@ -1,7 +1,12 @@
 from __future__ import annotations
-from typing import List, Optional, final, Callable, overload, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, final, Callable, overload, TypeVar
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from bisect import bisect_left, bisect_right
 
 from copy import deepcopy
+import math
+from time import perf_counter
 
 import pygame
 
@@ -11,8 +16,9 @@ from Replex.components.Button import ButtonStyle
 from ..utils.font import getFont
 from ..utils.app import getCurrentFramerate, getWindowSize
 from .Base import InteractiveComponent, int2d, float2d, Component
-from ..utils.position import Position
-from ..utils.font import Font
+from ..utils.position import Position, getBoundingRect
+from ..utils.font import Font, renderText, getGlyphAtlas
+from ..utils.textlayout import TextLayout, layoutText
 from ..utils.color import Color
 from .Image import Image
 from .Button import Button, Slider
@@ -23,8 +29,14 @@ from ..utils.color import Color, COLORS
 from ..utils.style import ComponentStyle
 from ..utils.event import EventType
 from ..utils.mouse import getMousePos
+from ..utils.grid import HitGrid
+from ..utils.profiler import getProfiler, profileDrawCall, countSurfaceAllocation
+from ..utils.pool import getSurfacePool
 
-__all__ = ['Surface', 'Container', 'ScrollBox', 'ScrollBoxStyle', 'Dropdown', 'DropdownStyle']
+# numpy arrays or anything numpy.asarray accepts
+ArrayLike = Any
+
+__all__ = ['Surface', 'Container', 'DisplayList', 'DisplayListRecorder', 'ScrollBox', 'ScrollBoxStyle', 'ScrollBoxSource', 'TextLayoutSource', 'Dropdown', 'DropdownStyle']
 
 
 class Surface(InteractiveComponent):
@@ -43,27 +55,234 @@ class Surface(InteractiveComponent):
         else:
             super().__init__(pos, value)
             self.__surface = pygame.Surface(value)
+            countSurfaceAllocation()
         
         self.__tickObjects: List[Surface] = []
         self.__eventObjects: List[InteractiveComponent] = []
+        self.__hitGrid: HitGrid[InteractiveComponent] = HitGrid()
+        self.__hitGridStale: bool = False
+        self.__enteredObjects: List[InteractiveComponent] = []
+        self.__frameListeners: Dict[EventType, Dict[Callable[..., None], None]] = {}
         self.__zIndexCallbackList: List[List[Callable[..., None]]] = []
         self.__zIndexLock: bool = False
+        self.__scratchLayer: Optional[pygame.Surface] = None
+        self.__pendingBlits: List[Tuple] = []
+        # Surfaces read by the queued blits, and the surfaces whose queued blits read this one
+        self.__pendingSources: List[Surface] = []
+        self.__readers: Dict[Surface, None] = {}
+        # Surfaces of the surface pool drawn this frame, returned at tick
+        self.__pooledSurfaces: List[pygame.Surface] = []
+
+        self.__retained: bool = False
+        self.__nodes: Dict[Component, pygame.Rect] = {}
+        self.__frameNodes: Dict[Component, pygame.Rect] = {}
+        self.__nodeDepth: int = 0
+        self.__invalidRects: List[pygame.Rect] = []
     
     @final
     def render(self):
         self.__zIndexLock = True
-        for index in self.__zIndexCallbackList:
-            for callback in index:
-                callback()
+        self.__flushBlits()
+        profiler = getProfiler()
+        if profiler is None:
+            for index in self.__zIndexCallbackList:
+                for callback in index:
+                    callback()
+                self.__flushBlits()
+        else:
+            for i, index in enumerate(self.__zIndexCallbackList):
+                start = perf_counter()
+                for callback in index:
+                    callback()
+                self.__flushBlits()
+                profiler.addTime(f'z-index {i}', perf_counter() - start)
                 
         self.__zIndexCallbackList.clear()
         self.__zIndexLock = False
 
+        if self.__retained:
+            self.__commitNodes()
+
+    @property
+    def retained(self) -> bool:
+        '''
+        If True, components drawn into this surface are tracked so that only their changed areas have to be redrawn.\n
+        Drawings which do not belong to a component are not tracked, use invalidate when they change.
+        '''
+        return self.__retained
+
+    @retained.setter
+    def retained(self, value: bool) -> None:
+        self.__retained = value
+        self.__nodes.clear()
+        self.__frameNodes.clear()
+        self.__invalidRects.clear()
+        if value:
+            self.invalidate()
+
+    @property
+    def isDirty(self) -> bool:
+        if not self.__retained:
+            return True
+        return super().isDirty or len(self.__invalidRects) > 0 or any(node.isDirty for node in self.__nodes)
+
+    @property
+    def isAnimating(self) -> bool:
+        return any(obj.isAnimating for obj in self.__tickObjects) or any(obj.isAnimating for obj in self.__eventObjects)
+
+    @final
+    def invalidate(self, pos: Optional[float2d] = None, size: Optional[int2d] = None) -> None:
+        '''
+        Marks an area to be redrawn in the next frame.\n
+        if pos or size is None, the whole surface will be redrawn.
+        '''
+        if pos is None or size is None:
+            self.__invalidRects.append(self.__surface.get_rect())
+        else:
+            self.__invalidRects.append(getBoundingRect(pos, size))
+        self.markDirty()
+
+    @final
+    def collectDirtyRects(self) -> List[pygame.Rect]:
+        '''
+        Return:
+            Areas which have changed since the last frame, the whole surface if retained is False.\n
+        Dirty state of the collected components is cleared.
+        '''
+        bound = self.__surface.get_rect()
+        if not self.__retained:
+            return [bound]
+
+        rects = self.__invalidRects
+        self.__invalidRects = []
+        for node, rect in self.__nodes.items():
+            if node.isDirty:
+                rects.append(rect)
+                rects.append(node.renderRect)
+                node.clearDirty()
+        self.clearDirty()
+
+        return [r for r in (rect.clip(bound) for rect in rects) if r.width > 0 and r.height > 0]
+
+    @final
+    def __addNode(self, component: Component) -> None:
+        if self.__retained and self.__nodeDepth == 0:
+            self.__frameNodes[component] = component.renderRect
+
+    @final
+    def __commitNodes(self) -> None:
+        # Components which appeared or disappeared are only known after drawing, so they are redrawn in the next frame
+        for node, rect in self.__nodes.items():
+            if node not in self.__frameNodes:
+                self.__invalidRects.append(rect)
+        for node, rect in self.__frameNodes.items():
+            if node not in self.__nodes:
+                self.__invalidRects.append(rect)
+
+        self.__nodes = self.__frameNodes
+        self.__frameNodes = {}
+
+    @final
+    def __queueBlit(self, source: pygame.Surface, dest: float2d | pygame.Rect, area: Optional[pygame.Rect] = None) -> None:
+        '''
+        Blits are collected and submitted together by __flushBlits, so sources must not change until then.
+        '''
+        if area is None:
+            self.__pendingBlits.append((source, dest))
+        else:
+            self.__pendingBlits.append((source, dest, area))
+
     @final
-    def __createTransparentPygameSurface(self) -> pygame.Surface:
-        s = pygame.Surface(self.size, pygame.SRCALPHA)
+    def __queueSurfaceBlit(self, surface: Surface, dest: float2d) -> None:
+        '''
+        Queues a blit of a Surface which can still be drawn on. Blits of it queued here are submitted before its pixels change.
+        '''
+        self.__queueBlit(surface.getPygameSurface(), dest)
+        if self not in surface.__readers:
+            surface.__readers[self] = None
+            self.__pendingSources.append(surface)
+
+    @final
+    def __flushBlits(self) -> None:
+        '''
+        Submits the collected blits in order. Must be called before anything else touches the pixels of the surface,
+        which includes handing it out through getPygameSurface.
+        '''
+        if len(self.__readers) > 0:
+            # Surfaces which have queued blits of this one have to submit them while its pixels are unchanged
+            readers = self.__readers
+            self.__readers = {}
+            for reader in readers:
+                reader.__flushBlits()
+
+        if len(self.__pendingBlits) > 0:
+            self.__surface.blits(self.__pendingBlits, doreturn=False)
+            self.__pendingBlits = []
+            for source in self.__pendingSources:
+                source.__readers.pop(self, None)
+            self.__pendingSources.clear()
+
+    @final
+    def __createTransparentPygameSurface(self, size: Optional[int2d] = None) -> pygame.Surface:
+        s = pygame.Surface(self.size if size is None else size, pygame.SRCALPHA)
+        countSurfaceAllocation()
         return s.convert_alpha()
 
+    @staticmethod
+    def __getBounds(points: List[float2d], padding: float = 0) -> pygame.Rect:
+        left = math.floor(min(p[0] for p in points) - padding)
+        top = math.floor(min(p[1] for p in points) - padding)
+        right = math.ceil(max(p[0] for p in points) + padding) + 1
+        bottom = math.ceil(max(p[1] for p in points) + padding) + 1
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    @final
+    def __drawPrimitive(self, color: Color, bounds: pygame.Rect, draw: Callable[[pygame.Surface, int2d], None]) -> None:
+        '''
+        draw is called with the target surface and the offset which must be subtracted from every coordinate.\n
+        Opaque colors are drawn straight onto the surface, otherwise only the bounding box of the primitive is allocated and composited.
+        '''
+        self.__flushBlits()
+        alpha = color.rgba[3]
+        if alpha == 255:
+            draw(self.__surface, (0, 0))
+            return
+
+        bounds = bounds.clip(self.__surface.get_clip())
+        if bounds.width == 0 or bounds.height == 0:
+            return
+
+        s = self.__createTransparentPygameSurface(bounds.size)
+        draw(s, bounds.topleft)
+        s.set_alpha(alpha)
+        self.__surface.blit(s, bounds.topleft)
+
+    @final
+    def __getScratchLayer(self) -> pygame.Surface:
+        '''
+        Return:
+            A transparent layer of the size of the surface, areas drawn into it must be cleared after compositing
+        '''
+        if self.__scratchLayer is None or self.__scratchLayer.get_size() != self.__surface.get_size():
+            # Layers are shared by surfaces of the same size, so short-lived containers do not allocate one each
+            self.__scratchLayer = getSurfacePool().getScratchLayer(self.__surface.get_size())
+        return self.__scratchLayer
+
+    @final
+    def __drawAntialiasedPrimitive(self, color: Color, draw: Callable[[pygame.Surface], pygame.Rect]) -> None:
+        '''
+        Antialiased primitives are not translation invariant, so they are drawn at their own coordinates into a reused layer.
+        Only the part of the area returned by draw inside the clip is composited, and the whole area is cleared afterwards.
+        '''
+        self.__flushBlits()
+        s = self.__getScratchLayer()
+        bounds = draw(s)
+        visible = bounds.clip(self.__surface.get_clip())
+        if visible.width > 0 and visible.height > 0:
+            s.set_alpha(color.rgba[3])
+            self.__surface.blit(s, visible.topleft, visible)
+        s.fill((0, 0, 0, 0), bounds)
+
     @final
     def registerDrawing(self, zindex: int, callback: Callable[..., None]):
         if zindex is None or callback is None:
@@ -79,30 +298,32 @@ class Surface(InteractiveComponent):
 
     @final
     def getPygameSurface(self):
+        self.__flushBlits()
         return self.__surface
 
     @final
+    @profileDrawCall
     def fill(self, color: Color, zindex: Optional[int] = None) -> None:
         if zindex is not None:
             self.registerDrawing(zindex, lambda: self.fill(color))
             return
         
-        s = self.__createTransparentPygameSurface()
-        s.fill(color.rgba)
-        s.set_alpha(color.rgba[3])
-        self.__surface.blit(s, (0,0))
+        self.__drawPrimitive(color, self.__surface.get_rect(), lambda s, o: s.fill(color.rgba))
 
     @final
     def flip(self, flip_x: bool, flip_y: bool) -> None:
+        self.__flushBlits()
         self.__surface = pygame.transform.flip(self.__surface, flip_x, flip_y)
 
     @final
     def scale(self, size: int2d) -> None:
+        self.__flushBlits()
         self.__surface = pygame.transform.scale(self.__surface, size)
         self.size = self.__surface.get_size()
 
     @final
     def scale_by(self, factor: float) -> None:
+        self.__flushBlits()
         self.__surface = pygame.transform.scale(self.__surface, (self.size[0] * factor, self.size[1] * factor))
         self.size = self.__surface.get_size()
 
@@ -112,21 +333,25 @@ class Surface(InteractiveComponent):
         This will return a new image that is double the size of the original.
         It uses the AdvanceMAME Scale2X algorithm which does a 'jaggie-less' scale of bitmap graphics.
         '''
+        self.__flushBlits()
         self.__surface = pygame.transform.scale2x(self.__surface)
         self.size = self.__surface.get_size()
 
     @final
     def smoothscale(self, size: int2d) -> None:
+        self.__flushBlits()
         self.__surface = pygame.transform.smoothscale(self.__surface, size)
         self.size = self.__surface.get_size()
 
     @final
     def smoothscale_by(self, factor: float) -> None:
+        self.__flushBlits()
         self.__surface = pygame.transform.smoothscale(self.__surface, (self.size[0] * factor, self.size[1] * factor))
         self.size = self.__surface.get_size()
 
     @final
     def chop(self, pos: float2d, size: int2d) -> None:
+        self.__flushBlits()
         self.__surface = self.__surface.subsurface((int(pos[0]), int(pos[1]), size[0], size[1]))
         self.size = self.__surface.get_size()
 
@@ -136,15 +361,21 @@ class Surface(InteractiveComponent):
         return deepcopy(self)
 
     @final
+    @profileDrawCall
     def drawTextByFont(self, pos: float2d, text: str, font: Font, color: Color, antialias: bool = True, position: Position = Position.TOPLEFT, zindex: Optional[int] = None) -> None:
         if zindex is not None:
             self.registerDrawing(zindex, lambda: self.drawTextByFont(pos, text, font, color, antialias, position))
             return
 
-        image = font.render(text, antialias, color.rgba)
-        image.set_alpha(color.rgba[3])
+        image = renderText(font, text, antialias, color)
 
         rect = image.get_rect()
+        self.__placeRect(rect, pos, position)
+
+        self.__queueBlit(image, rect)
+
+    @staticmethod
+    def __placeRect(rect: pygame.Rect, pos: float2d, position: Position) -> None:
         v = (round(pos[0]), round(pos[1]))
 
         if position == Position.CENTER:
@@ -158,9 +389,40 @@ class Surface(InteractiveComponent):
         elif position == Position.BOTTOMRIGHT:
             rect.bottomright = v
 
-        self.__surface.blit(image, rect)
+    @final
+    @profileDrawCall
+    def drawGlyphTextByFont(self, pos: float2d, text: str, font: Font, color: Color, antialias: bool = True, position: Position = Position.TOPLEFT, zindex: Optional[int] = None) -> None:
+        '''
+        Draws text from the glyph atlas of the font instead of rendering the whole string.\n
+        This suits text which changes every frame, the text is as wide as with drawTextByFont,
+        but single glyphs may be placed a pixel or two apart from it.
+        '''
+        if zindex is not None:
+            self.registerDrawing(zindex, lambda: self.drawGlyphTextByFont(pos, text, font, color, antialias, position))
+            return
+
+        blits, size = getGlyphAtlas(font, antialias, color).layout(text)
+
+        rect = pygame.Rect((0, 0), size)
+        self.__placeRect(rect, pos, position)
+
+        x, y = rect.topleft
+        self.__pendingBlits.extend([(page, (p[0] + x, p[1] + y), area) for page, p, area in blits])
+
+    @final
+    @profileDrawCall
+    def drawGlyphTextByFontName(self, pos: float2d, text: str, fontName: str, color: Color, antialias: bool = True, position: Position = Position.TOPLEFT, zindex: Optional[int] = None) -> None:
+        if zindex is not None:
+            self.registerDrawing(zindex, lambda: self.drawGlyphTextByFontName(pos, text, fontName, color, antialias, position))
+            return
+        
+        font = getFont(fontName)
+        if font is None:
+            raise ValueError("invalid font name")
+        self.drawGlyphTextByFont(pos, text, font, color, antialias, position)
 
     @final
+    @profileDrawCall
     def drawTextByFontName(self, pos: float2d, text: str, fontName: str, color: Color, antialias: bool = True, position: Position = Position.TOPLEFT, zindex: Optional[int] = None) -> None:
         if zindex is not None:
             self.registerDrawing(zindex, lambda: self.drawTextByFontName(pos, text, fontName, color, antialias, position))
@@ -173,14 +435,30 @@ class Surface(InteractiveComponent):
             self.drawTextByFont(pos, text, font, color, antialias, position)
 
     @final
+    @profileDrawCall
     def drawImage(self, image: Image, zindex: Optional[int] = None):
         if zindex is not None:
             self.registerDrawing(zindex, lambda: self.drawImage(image))
             return
 
-        self.__surface.blit(image.getPygameImage(), image.pos)
+        self.__queueBlit(image.getPygameImage(), image.pos)
+        self.__addNode(image)
+
+    @final
+    @profileDrawCall
+    def drawDisplayList(self, displayList: DisplayList, zindex: Optional[int] = None):
+        if zindex is not None:
+            self.registerDrawing(zindex, lambda: self.drawDisplayList(displayList))
+            return
+
+        if displayList.rasterized:
+            self.__queueBlit(displayList.getLayer(), (0, 0))
+        else:
+            displayList.replay(self)
+        self.__addNode(displayList)
 
     @final
+    @profileDrawCall
     def drawRect(self, color: Color, pos: float2d, size: int2d, thickness: int = 0, radius: int = -1, top_left_radius: int = -1, top_right_radius: int = -1, bottom_left_radius: int = -1, bottom_right_radius: int = -1, zindex: Optional[int] = None) -> None:
         '''
         if thickness is 0, it will draw filled rectangle.\n
@@ -191,12 +469,11 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawRect(color, pos, size, thickness, radius, top_left_radius, top_right_radius, bottom_left_radius, bottom_right_radius))
             return
 
-        s = self.__createTransparentPygameSurface()
-        pygame.draw.rect(s, color.rgba, ((pos[0], pos[1]), (size[0], size[1])), thickness)
-        s.set_alpha(color.rgba[3])
-        self.__surface.blit(s, (0,0))
+        bounds = self.__getBounds([pos, (pos[0] + size[0], pos[1] + size[1])], 1)
+        self.__drawPrimitive(color, bounds, lambda s, o: pygame.draw.rect(s, color.rgba, ((pos[0] - o[0], pos[1] - o[1]), (size[0], size[1])), thickness))
 
     @final
+    @profileDrawCall
     def drawCircle(self, color: Color, pos: float2d, radius: int, thickness: int = 0, draw_top_right: Optional[bool] = None, draw_top_left: Optional[bool] = None, draw_bottom_left: Optional[bool] = None, draw_bottom_right: Optional[bool] = None, zindex: Optional[int] = None) -> None:
         '''
         if thickness is 0, it will draw filled circle.\n
@@ -206,12 +483,11 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawCircle(color, pos, radius, thickness, draw_top_right, draw_top_left, draw_bottom_left, draw_bottom_right))
             return
 
-        s = self.__createTransparentPygameSurface()
-        pygame.draw.circle(s, color.rgba, pos, radius, thickness, draw_top_right, draw_top_left, draw_bottom_right, draw_bottom_left)
-        s.set_alpha(color.rgba[3])
-        self.__surface.blit(s, (0,0))
+        bounds = self.__getBounds([(pos[0] - radius, pos[1] - radius), (pos[0] + radius, pos[1] + radius)], 1)
+        self.__drawPrimitive(color, bounds, lambda s, o: pygame.draw.circle(s, color.rgba, (pos[0] - o[0], pos[1] - o[1]), radius, thickness, draw_top_right, draw_top_left, draw_bottom_right, draw_bottom_left))
     
     @final
+    @profileDrawCall
     def drawEllipse(self, color: Color, pos: float2d, size: int2d, thickness: int = 0, zindex: Optional[int] = None) -> None:
         '''
         if thickness is 0, it will draw filled ellipse.
@@ -220,12 +496,11 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawEllipse(color, pos, size, thickness))
             return
 
-        s = self.__createTransparentPygameSurface()
-        pygame.draw.ellipse(s, color.rgba, ((pos[0], pos[1]), (size[0], size[1])), thickness)
-        s.set_alpha(color.rgba[3])
-        self.__surface.blit(s, (0,0))
+        bounds = self.__getBounds([pos, (pos[0] + size[0], pos[1] + size[1])], 1)
+        self.__drawPrimitive(color, bounds, lambda s, o: pygame.draw.ellipse(s, color.rgba, ((pos[0] - o[0], pos[1] - o[1]), (size[0], size[1])), thickness))
 
     @final
+    @profileDrawCall
     def drawLine(self, color: Color, start_pos: float2d, end_pos: float2d, thickness: int = 1, zindex: Optional[int] = None) -> None:
         '''
         if thickness < 1, nothing will be drawn.
@@ -234,12 +509,11 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawLine(color, start_pos, end_pos, thickness))
             return
 
-        s = self.__createTransparentPygameSurface()
-        pygame.draw.line(s, color.rgba, start_pos, end_pos, thickness)
-        s.set_alpha(color.rgba[3])
-        self.__surface.blit(s, (0,0))
+        bounds = self.__getBounds([start_pos, end_pos], thickness)
+        self.__drawPrimitive(color, bounds, lambda s, o: pygame.draw.line(s, color.rgba, (start_pos[0] - o[0], start_pos[1] - o[1]), (end_pos[0] - o[0], end_pos[1] - o[1]), thickness))
 
     @final
+    @profileDrawCall
     def drawLines(self, color: Color, points: List[float2d], closed: bool = False, thickness: int = 1, zindex: Optional[int] = None) -> None:
         '''
         if thickness < 1, nothing will be drawn.\n
@@ -249,23 +523,20 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawLines(color, points, closed, thickness))
             return
 
-        s = self.__createTransparentPygameSurface()
-        pygame.draw.lines(s, color.rgba, closed, points, thickness)
-        s.set_alpha(color.rgba[3])
-        self.__surface.blit(s, (0,0))
+        bounds = self.__getBounds(points, thickness)
+        self.__drawPrimitive(color, bounds, lambda s, o: pygame.draw.lines(s, color.rgba, closed, [(p[0] - o[0], p[1] - o[1]) for p in points], thickness))
 
     @final
+    @profileDrawCall
     def drawAntialiasedLine(self, color: Color, start_pos: float2d, end_pos: float2d, blend: int = 1, zindex: Optional[int] = None) -> None:
         if zindex is not None:
             self.registerDrawing(zindex, lambda: self.drawAntialiasedLine(color, start_pos, end_pos, blend))
             return
 
-        s = self.__createTransparentPygameSurface()
-        pygame.draw.aaline(s, color.rgba, start_pos, end_pos, blend)
-        s.set_alpha(color.rgba[3])
-        self.__surface.blit(s, (0,0))
+        self.__drawAntialiasedPrimitive(color, lambda s: pygame.draw.aaline(s, color.rgba, start_pos, end_pos, blend))
 
     @final
+    @profileDrawCall
     def drawAntialiasedLines(self, color: Color, points: List[float2d], closed: bool = False, blend: int = 1, zindex: Optional[int] = None) -> None:
         '''
         if closed is True, an additional line segment is drawn between the first and last points in the points sequence.
@@ -274,10 +545,185 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawAntialiasedLines(color, points, closed, blend))
             return
 
-        s = self.__createTransparentPygameSurface()
-        pygame.draw.aalines(s, color.rgba, closed, points, blend)
-        s.set_alpha(color.rgba[3])
-        self.__surface.blit(s, (0,0))
+        self.__drawAntialiasedPrimitive(color, lambda s: pygame.draw.aalines(s, color.rgba, closed, points, blend))
+
+    @staticmethod
+    def __requireNumpy():
+        try:
+            import numpy
+            import pygame.surfarray
+        except ImportError as e:
+            raise ImportError("Bulk drawing requires numpy") from e
+        return numpy
+
+    @staticmethod
+    def __toColorArray(colors: Color | ArrayLike, count: int):
+        '''
+        Return:
+            uint8 array of shape (count, 4)
+        '''
+        np = Surface.__requireNumpy()
+        if isinstance(colors, Color):
+            return np.broadcast_to(np.array(colors.rgba, dtype=np.uint8), (count, 4))
+
+        array = np.asarray(colors, dtype=np.uint8)
+        if array.ndim != 2 or array.shape[0] != count or array.shape[1] not in (3, 4):
+            raise ValueError(f"colors must be a Color or an array of shape ({count}, 3) or ({count}, 4)")
+        if array.shape[1] == 3:
+            array = np.concatenate([array, np.full((count, 1), 255, dtype=np.uint8)], axis=1)
+        return array
+
+    @final
+    def __drawPixels(self, xs, ys, colors) -> None:
+        '''
+        Writes colors at the integer coordinates xs, ys in one pass.
+        Opaque pixels are written straight into the surface, otherwise they are written into the scratch layer and composited once.
+        '''
+        np = Surface.__requireNumpy()
+        clip = self.__surface.get_clip()
+        inside = (xs >= clip.left) & (xs < clip.right) & (ys >= clip.top) & (ys < clip.bottom)
+        if not inside.all():
+            xs, ys, colors = xs[inside], ys[inside], colors[inside]
+        if len(xs) == 0:
+            return
+
+        self.__flushBlits()
+        opaque = bool((colors[:, 3] == 255).all())
+        target = self.__surface if opaque else self.__getScratchLayer()
+
+        pixels = pygame.surfarray.pixels3d(target)
+        pixels[xs, ys] = colors[:, :3]
+        del pixels
+        if target.get_flags() & pygame.SRCALPHA:
+            alpha = pygame.surfarray.pixels_alpha(target)
+            alpha[xs, ys] = colors[:, 3]
+            del alpha
+
+        if not opaque:
+            left, top = int(xs.min()), int(ys.min())
+            bounds = pygame.Rect(left, top, int(xs.max()) - left + 1, int(ys.max()) - top + 1)
+            target.set_alpha(255)
+            self.__surface.blit(target, bounds.topleft, bounds)
+            target.fill((0, 0, 0, 0), bounds)
+
+    @final
+    @profileDrawCall
+    def drawPoints(self, points: ArrayLike, colors: Color | ArrayLike, size: int = 1, zindex: Optional[int] = None) -> None:
+        '''
+        Parameter:
+            points: Array of shape (N, 2)
+            colors: Color, or array of shape (N, 3) or (N, 4)
+            size: Side of the square drawn for every point\n
+        Requires numpy. Overlapping translucent points are not blended with each other.
+        '''
+        if zindex is not None:
+            self.registerDrawing(zindex, lambda: self.drawPoints(points, colors, size))
+            return
+
+        np = Surface.__requireNumpy()
+        xy = np.floor(np.asarray(points, dtype=np.float64)).astype(np.intp).reshape(-1, 2)
+        rgba = Surface.__toColorArray(colors, len(xy))
+
+        if size > 1:
+            offsets = np.stack(np.meshgrid(np.arange(size), np.arange(size)), axis=-1).reshape(-1, 2) - (size - 1) // 2
+            xy = (xy[:, None, :] + offsets[None, :, :]).reshape(-1, 2)
+            rgba = np.repeat(rgba, len(offsets), axis=0)
+
+        self.__drawPixels(xy[:, 0], xy[:, 1], rgba)
+
+    @final
+    @profileDrawCall
+    def drawPolyline(self, points: ArrayLike, colors: Color | ArrayLike, closed: bool = False, zindex: Optional[int] = None) -> None:
+        '''
+        Parameter:
+            points: Array of shape (N, 2)
+            colors: Color, or array with one color per segment\n
+        Draws one pixel wide segments between consecutive points with a single composite. Requires numpy.
+        '''
+        if zindex is not None:
+            self.registerDrawing(zindex, lambda: self.drawPolyline(points, colors, closed))
+            return
+
+        np = Surface.__requireNumpy()
+        p = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if closed and len(p) > 2:
+            p = np.concatenate([p, p[:1]])
+        if len(p) < 2:
+            return
+
+        if isinstance(colors, Color):
+            # A single color is rasterized by pygame in one call
+            self.__flushBlits()
+            rgba = colors.rgba
+            if rgba[3] == 255:
+                pygame.draw.lines(self.__surface, rgba, False, p.tolist(), 1)
+                return
+
+            layer = self.__getScratchLayer()
+            bounds = pygame.draw.lines(layer, rgba, False, p.tolist(), 1)
+            visible = bounds.clip(self.__surface.get_clip())
+            if visible.width > 0 and visible.height > 0:
+                layer.set_alpha(255)
+                self.__surface.blit(layer, visible.topleft, visible)
+            layer.fill((0, 0, 0, 0), bounds)
+            return
+
+        start, delta = p[:-1], p[1:] - p[:-1]
+        rgba = Surface.__toColorArray(colors, len(start))
+
+        # Every segment is sampled once per pixel along its major axis
+        steps = np.ceil(np.abs(delta).max(axis=1)).astype(np.intp)
+        counts = steps + 1
+        segment = np.repeat(np.arange(len(start)), counts)
+        index = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        t = index / np.maximum(steps, 1)[segment]
+
+        xy = np.floor(start[segment] + delta[segment] * t[:, None] + 0.5).astype(np.intp)
+        self.__drawPixels(xy[:, 0], xy[:, 1], rgba[segment])
+
+    @final
+    @profileDrawCall
+    def drawRects(self, rects: ArrayLike, colors: Color | ArrayLike, zindex: Optional[int] = None) -> None:
+        '''
+        Parameter:
+            rects: Array of shape (N, 4) holding x, y, width and height
+            colors: Color, or array of shape (N, 3) or (N, 4)\n
+        Draws filled rectangles with a single composite. Requires numpy. Overlapping translucent rectangles are not blended with each other.
+        '''
+        if zindex is not None:
+            self.registerDrawing(zindex, lambda: self.drawRects(rects, colors))
+            return
+
+        np = Surface.__requireNumpy()
+        r = np.floor(np.asarray(rects, dtype=np.float64)).astype(np.intp).reshape(-1, 4)
+        rgba = Surface.__toColorArray(colors, len(r))
+
+        # Surface.fill does not clip rectangles with negative coordinates, so they are clipped here
+        w, h = self.__surface.get_size()
+        left, top = np.maximum(r[:, 0], 0), np.maximum(r[:, 1], 0)
+        right, bottom = np.minimum(r[:, 0] + r[:, 2], w), np.minimum(r[:, 1] + r[:, 3], h)
+        visible = (right > left) & (bottom > top)
+        r = np.stack([left, top, right - left, bottom - top], axis=1)[visible]
+        rgba = rgba[visible]
+        if len(r) == 0:
+            return
+
+        self.__flushBlits()
+        opaque = bool((rgba[:, 3] == 255).all())
+        target = self.__surface if opaque else self.__getScratchLayer()
+
+        fill = target.fill
+        for rect, color in zip(r.tolist(), rgba.tolist()):
+            fill(color, rect)
+
+        if not opaque:
+            left, top = int(r[:, 0].min()), int(r[:, 1].min())
+            bounds = pygame.Rect(left, top, int((r[:, 0] + r[:, 2]).max()) - left, int((r[:, 1] + r[:, 3]).max()) - top)
+            visible = bounds.clip(self.__surface.get_clip())
+            if visible.width > 0 and visible.height > 0:
+                target.set_alpha(255)
+                self.__surface.blit(target, visible.topleft, visible)
+            target.fill((0, 0, 0, 0), bounds)
 
     '''@final
     def drawDynamicObject(self, obj: DynamicObject):
@@ -286,12 +732,10 @@ class Surface(InteractiveComponent):
         self.__tickObjects.append(obj)'''
 
     @final
-    def drawTextBox(self, textBox: TextBox, zindex: Optional[int] = None):
-        if not self.__zIndexLock:
-            textBox.zIndex = zindex
-
-        if zindex is not None:
-            self.registerDrawing(zindex, lambda: self.drawTextBox(textBox))
+    def __drawWidget(self, textBox: TextBox, textColor: Color, backgroundColor: Optional[Color], withText: bool = True) -> None:
+        cached = self.__getWidgetImage(textBox, textColor, backgroundColor, withText)
+        if cached is not None:
+            self.__queueBlit(cached[0], cached[1])
             return
 
         size = textBox.size
@@ -301,14 +745,94 @@ class Surface(InteractiveComponent):
         r = textBox.radius
         if textBox.borderColor is not None:
             self.drawRect(textBox.borderColor, pos, (size[0] + (b * 2), size[1] + (b * 2)), radius=r)
-        if textBox.backgroundColor is not None:
-            self.drawRect(textBox.backgroundColor, (pos[0] + b, pos[1] + b), size, radius=r)
+        if backgroundColor is not None:
+            self.drawRect(backgroundColor, (pos[0] + b, pos[1] + b), size, radius=r)
+        if font is not None and withText:
+            if textBox.multiline:
+                self.__drawTextLines(textBox.getLayout(), (round(pos[0] + b), round(pos[1] + b)), size, textColor)
+            else:
+                self.drawTextByFont((pos[0] + (size[0] / 2), pos[1] + (size[1] / 2)), textBox.text, font, textColor, position=Position.CENTER)
+
+    @final
+    def __drawTextLines(self, layout: TextLayout, pos: int2d, size: int2d, color: Color) -> None:
+        # Only the lines inside the box are rendered, and they are cut at its edges
+        h = layout.lineHeight
+        for i in layout.getVisibleLines(0, size[1]):
+            image = renderText(layout.font, layout.lines[i], True, color)
+            top = h * i
+            self.__queueBlit(image, (pos[0], pos[1] + top), pygame.Rect(0, 0, min(image.get_width(), int(size[0])), min(image.get_height(), int(size[1]) - top)))
+
+    @staticmethod
+    def __getWidgetImage(textBox: TextBox, textColor: Color, backgroundColor: Optional[Color], withText: bool = True) -> Optional[tuple[pygame.Surface, int2d]]:
+        '''
+        Return:
+            Pre-rendered image of the widget and where to blit it, or None if it can't be drawn as a single opaque image
+        '''
+        size = textBox.size
+        b = textBox.borderThickness
+        pos = textBox.pos
+        font = textBox.font if withText else None
+        border = textBox.borderColor
+
+        # The widget is only cached if every pixel of it is opaque, so blitting it gives the same result as drawing it
+        if backgroundColor is None or backgroundColor.rgba[3] != 255 or pos[0] < 0 or pos[1] < 0:
+            return None
+        if border is not None and b > 0 and border.rgba[3] != 255:
+            return None
+
+        if border is not None:
+            areaPos, areaSize = pos, (size[0] + (b * 2), size[1] + (b * 2))
+        else:
+            areaPos, areaSize = (pos[0] + b, pos[1] + b), size
+        origin = (int(areaPos[0]), int(areaPos[1]))
+
+        key = (textBox.text if withText else None, font, textBox.multiline, textColor, backgroundColor, border, b, textBox.radius, size, pos[0] - int(pos[0]), pos[1] - int(pos[1]))
+        # Only buttons change their colors on hover, other widgets keep a single image
+        state = textBox.isMouseEntered if isinstance(textBox, Button) else False
+        image = textBox.getRenderCache(state, key)
+        if image is not None:
+            return image, origin
+
+        local = (pos[0] - origin[0], pos[1] - origin[1])
+        if font is not None and not textBox.multiline:
+            # Text is placed at its absolute position first since rounding is not translation invariant
+            textRect = pygame.Rect((0, 0), textBox.textSize)
+            Surface.__placeRect(textRect, (pos[0] + (size[0] / 2), pos[1] + (size[1] / 2)), Position.CENTER)
+            textRect.move_ip(-origin[0], -origin[1])
+            if not pygame.Rect((0, 0), areaSize).contains(textRect):
+                return None
+
+        c = Container((0, 0), (int(areaSize[0]), int(areaSize[1])))
+        if border is not None:
+            c.drawRect(border, local, (size[0] + (b * 2), size[1] + (b * 2)), radius=textBox.radius)
+        c.drawRect(backgroundColor, (local[0] + b, local[1] + b), size, radius=textBox.radius)
         if font is not None:
-            self.drawTextByFont((pos[0] + (size[0] / 2), pos[1] + (size[1] / 2)), textBox.text, font, textBox.textColor, position=Position.CENTER)
+            if textBox.multiline:
+                c.__drawTextLines(textBox.getLayout(), (round(pos[0] + b) - origin[0], round(pos[1] + b) - origin[1]), size, textColor)
+            else:
+                c.drawTextByFont(textRect.topleft, textBox.text, font, textColor)
+
+        image = c.getPygameSurface()
+        textBox.setRenderCache(state, key, image)
+        return image, origin
+
+    @final
+    @profileDrawCall
+    def drawTextBox(self, textBox: TextBox, zindex: Optional[int] = None):
+        if not self.__zIndexLock:
+            textBox.zIndex = zindex
 
-        self.__eventObjects.append(textBox)
+        if zindex is not None:
+            self.registerDrawing(zindex, lambda: self.drawTextBox(textBox))
+            return
+
+        self.__drawWidget(textBox, textBox.textColor, textBox.backgroundColor)
+
+        self.__addEventObject(textBox)
+        self.__addNode(textBox)
 
     @final
+    @profileDrawCall
     def drawButton(self, button: Button, zindex: Optional[int] = None):
         if not self.__zIndexLock:
             button.zIndex = zindex
@@ -317,32 +841,47 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawButton(button))
             return
 
-        size = button.size
-        b = button.borderThickness
-        pos = button.pos
-        font = button.font
-        r = button.radius
-        if button.borderColor is not None:
-            self.drawRect(button.borderColor, pos, (size[0] + (b * 2), size[1] + (b * 2)), radius=r)
-        if button.backgroundRenderColor is not None:
-            self.drawRect(button.backgroundRenderColor, (pos[0] + b, pos[1] + b), size, radius=r)
-        if font is not None:
-            self.drawTextByFont((pos[0] + (size[0] / 2), pos[1] + (size[1] / 2)), button.text, font, button.textRenderColor, position=Position.CENTER)
+        self.__drawWidget(button, button.textRenderColor, button.backgroundRenderColor)
 
-        self.__eventObjects.append(button)
+        self.__addEventObject(button)
+        self.__addNode(button)
 
     @final
+    @profileDrawCall
     def drawTextInput(self, textInput: TextInput, zindex: Optional[int] = None):
         if not self.__zIndexLock:
             textInput.zIndex = zindex
 
         if zindex is not None:
-            self.registerDrawing(zindex, lambda: self.drawTextBox(textInput))
+            self.registerDrawing(zindex, lambda: self.drawTextInput(textInput))
             return
 
-        self.drawTextBox(textInput)
+        # Multiline text is laid out by paragraphs instead of by chunks of the buffer
+        self.__drawWidget(textInput, textInput.textColor, textInput.backgroundColor, textInput.multiline)
+
+        font = textInput.font
+        if font is not None and not textInput.multiline:
+            chunks, offsets, textSize = textInput.getTextRuns()
+            pos = textInput.pos
+            size = textInput.size
+            rect = pygame.Rect((0, 0), textSize)
+            self.__placeRect(rect, (pos[0] + (size[0] / 2), pos[1] + (size[1] / 2)), Position.CENTER)
+
+            # Only the chunks of the text inside the clip area are drawn
+            clip = self.__surface.get_clip()
+            first = max(bisect_right(offsets, clip.left - rect.x) - 1, 0)
+            last = bisect_left(offsets, clip.right - rect.x)
+            color = textInput.textColor
+            for i in range(first, last):
+                self.__queueBlit(renderText(font, chunks[i], True, color), (rect.x + offsets[i], rect.y))
+
+            self.drawRect(color, (rect.x + textInput.getCursorOffset(), rect.y), (1, rect.height))
+
+        self.__addEventObject(textInput)
+        self.__addNode(textInput)
 
     @final
+    @profileDrawCall
     def drawCameraCapture(self, capture: CameraCapture, zindex: Optional[int] = None):
         if not self.__zIndexLock:
             capture.zIndex = zindex
@@ -350,9 +889,14 @@ class Surface(InteractiveComponent):
         if zindex is not None:
             self.registerDrawing(zindex, lambda: self.drawCameraCapture(capture))
             return
+        # Camera frames are written into reused buffers, so they are blitted right away instead of being queued
+        self.__flushBlits()
         self.__surface.blit(capture.image, capture.pos)
+        self.__tickObjects.append(capture)
+        self.__addNode(capture)
 
     @final
+    @profileDrawCall
     def drawContainer(self, container: Container, zindex: Optional[int] = None):
         if not self.__zIndexLock:
             container.zIndex = zindex
@@ -361,13 +905,16 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawContainer(container))
             return
         
+        # Redrawing the container submits the blits of it which are still queued here
         container.draw()
         container.render()
-        self.__surface.blit(container.getPygameSurface(), container.pos)
+        self.__queueSurfaceBlit(container, container.pos)
         self.__tickObjects.append(container)
-        self.__eventObjects.append(container)
+        self.__addEventObject(container)
+        self.__addNode(container)
 
     @final
+    @profileDrawCall
     def drawScrollBox(self, scrollBox: ScrollBox, zindex: Optional[int] = None):
         if not self.__zIndexLock:
             scrollBox.zIndex = zindex
@@ -376,13 +923,17 @@ class Surface(InteractiveComponent):
             self.registerDrawing(zindex, lambda: self.drawScrollBox(scrollBox))
             return
 
-        self.__surface.blit(scrollBox.render().getPygameSurface(), scrollBox.pos)
+        source = scrollBox.render(pooled=True).getPygameSurface()
+        self.__queueBlit(source, scrollBox.pos)
+        self.__pooledSurfaces.append(source)
         self.__tickObjects.append(scrollBox)
-        self.__eventObjects.append(scrollBox)
-        self.addEventListener(EventType.onMouseUp, scrollBox.onScrollBarDragEnd)
-        self.addEventListener(EventType.onMouseMove, scrollBox.onScrollBarDragging)
+        self.__addEventObject(scrollBox)
+        self.__addNode(scrollBox)
+        self.addFrameEventListener(EventType.onMouseUp, scrollBox.onScrollBarDragEnd)
+        self.addFrameEventListener(EventType.onMouseMove, scrollBox.onScrollBarDragging)
 
     @final
+    @profileDrawCall
     def drawDropdown(self, dropdown: Dropdown, zindex: Optional[int] = None):
         if not self.__zIndexLock:
             dropdown.zIndex = zindex
@@ -403,11 +954,10 @@ class Surface(InteractiveComponent):
             elif (up > box.size[1]) or (down < box.size[1] and up < box.size[1] and down < up):
                 box.pos = (btn.pos[0], btn.pos[1] - box.size[1])
 
-            box.contents = [Container.buildByCenteredText(box.elementSize, dropdown.items[i], dropdown.font, dropdown.itemTextColor, (dropdown.itemHoverColor if dropdown.hoveredIndex == i else dropdown.itemBackgroundColor)) for i in range(0, dropdown.numOfItems)]
-
             self.drawScrollBox(box)
 
     @final
+    @profileDrawCall
     def drawSlider(self, slider: Slider, zindex: Optional[int] = None):
         if not self.__zIndexLock:
             slider.zIndex = zindex
@@ -423,31 +973,98 @@ class Surface(InteractiveComponent):
         r = slider.sliderRadius
         drawpos = (p[0] - (hs[0] / 2), p[1])
         drawsize = (s[0] + hs[0], s[1])
-        c = Container(drawpos, drawsize)
+        self.__addNode(slider)
+        self.__nodeDepth += 1
+        c = self.__acquireContainer(drawpos, drawsize)
         c.drawRect(slider.sliderFilledColor, (0, 0), drawsize, radius=r)
-        c.chop((0, 0), (s[0] * slider.value + (hs[0] / 2), s[1]))
         self.drawRect(slider.sliderColor, drawpos, drawsize, radius=r)
-        self.drawContainer(c)
+        # Only the filled part of the track is blitted
+        self.__queueBlit(c.getPygameSurface(), drawpos, pygame.Rect(0, 0, s[0] * slider.value + (hs[0] / 2), s[1]))
         
-        self.addEventListener(EventType.onMouseMove, slider.onHandlerMouseMove)
-        self.addEventListener(EventType.onMouseUp, slider.onHandlerMouseUp)
-        self.__eventObjects.append(slider)
+        self.addFrameEventListener(EventType.onMouseMove, slider.onHandlerMouseMove)
+        self.addFrameEventListener(EventType.onMouseUp, slider.onHandlerMouseUp)
+        self.__addEventObject(slider)
 
         self.drawButton(handle)
+        self.__nodeDepth -= 1
+
+    @final
+    def clearFrameObjects(self) -> None:
+        '''
+        Forgets the components registered by the last drawing.\n
+        tick calls this unless retained is True, in which case they are kept until the surface is drawn again.
+        '''
+        self.__tickObjects.clear()
+        self.__eventObjects.clear()
+        self.__frameListeners.clear()
+        self.__hitGridStale = True
 
     def tick(self):
         for obj in self.__tickObjects:
             obj.tick()
-        self.__tickObjects.clear()
-        self.__eventObjects.clear()
+        if not self.__retained:
+            self.clearFrameObjects()
+        self.__releasePooledSurfaces()
 
-    def onMouseDown(self, event) -> None:
-        super().onMouseDown(event)
+    @final
+    def __acquireContainer(self, pos: float2d, size: int2d, flags: int = 0) -> Container:
+        container = Container.fromPool(pos, size, flags)
+        self.__pooledSurfaces.append(container.getPygameSurface())
+        return container
 
-        temp: Optional[Component] = None
+    @final
+    def __releasePooledSurfaces(self) -> None:
+        if len(self.__pooledSurfaces) == 0:
+            return
 
-        for obj in self.__eventObjects:
-            if obj.doEventSpread(event.pos):
+        # Blits from pooled surfaces have to be submitted before they can be handed out again
+        self.__flushBlits()
+        pool = getSurfacePool()
+        for surface in self.__pooledSurfaces:
+            pool.release(surface)
+        self.__pooledSurfaces.clear()
+
+    @final
+    def addFrameEventListener(self, eventType: EventType, callback: Callable[..., None]) -> Surface:
+        '''
+        Adds a listener which lives only until the components of this frame are forgotten.\n
+        Adding the same callback again in the same frame has no effect.
+        '''
+        listeners = self.__frameListeners.get(eventType)
+        if listeners is None:
+            listeners = self.__frameListeners[eventType] = {}
+        listeners[callback] = None
+        return self
+
+    @final
+    def __dispatchFrameListeners(self, eventType: EventType, event) -> None:
+        listeners = self.__frameListeners.get(eventType)
+        if listeners:
+            for callback in list(listeners):
+                callback(event)
+
+    @final
+    def __addEventObject(self, obj: InteractiveComponent) -> None:
+        self.__eventObjects.append(obj)
+        self.__hitGridStale = True
+
+    @final
+    def __findEventTarget(self, pos: float2d) -> Optional[InteractiveComponent]:
+        '''
+        Return:
+            The topmost component which contains pos.\n
+        Components are looked up through a grid built from their pos and size, so their hit area must lie inside it.
+        '''
+        if self.__hitGridStale:
+            self.__hitGrid.clear()
+            for obj in self.__eventObjects:
+                self.__hitGrid.insert(obj, obj.pos, obj.size)
+            self.__hitGridStale = False
+
+        temp: Optional[InteractiveComponent] = None
+
+        for obj in self.__hitGrid.query(pos):
+            if obj.doEventSpread(pos):
                 if temp is None:
                     temp = obj
                 elif temp.zIndex is None:
@@ -455,67 +1072,54 @@ class Surface(InteractiveComponent):
                 elif temp.zIndex is not None and obj.zIndex is not None:
                     if temp.zIndex <= obj.zIndex:
                         temp = obj
-        
+
+        return temp
+
+    def onMouseDown(self, event) -> None:
+        super().onMouseDown(event)
+        self.__dispatchFrameListeners(EventType.onMouseDown, event)
+
+        temp = self.__findEventTarget(event.pos)
         if temp is not None:
             temp.onMouseDown(event)
 
     def onMouseUp(self, event) -> None:
         super().onMouseUp(event)
+        self.__dispatchFrameListeners(EventType.onMouseUp, event)
 
-        temp: Optional[Component] = None
-
-        for obj in self.__eventObjects:
-            if obj.doEventSpread(event.pos):
-                if temp is None:
-                    temp = obj
-                elif temp.zIndex is None:
-                    temp = obj
-                elif temp.zIndex is not None and obj.zIndex is not None:
-                    if temp.zIndex <= obj.zIndex:
-                        temp = obj
-        
+        temp = self.__findEventTarget(event.pos)
         if temp is not None:
             temp.onMouseUp(event)
 
     def onMouseWheel(self, event) -> None:
         super().onMouseWheel(event)
+        self.__dispatchFrameListeners(EventType.onMouseWheel, event)
         
-        temp: Optional[Component] = None
-
-        for obj in self.__eventObjects:
-            if obj.doEventSpread(getMousePos()):
-                if temp is None:
-                    temp = obj
-                elif temp.zIndex is None:
-                    temp = obj
-                elif temp.zIndex is not None and obj.zIndex is not None:
-                    if temp.zIndex <= obj.zIndex:
-                        temp = obj
-        
+        temp = self.__findEventTarget(getMousePos())
         if temp is not None:
             temp.onMouseWheel(event)
 
     def onMouseMove(self, event) -> None:
         super().onMouseMove(event)
+        self.__dispatchFrameListeners(EventType.onMouseMove, event)
 
-        temp: Optional[Component] = None
+        temp = self.__findEventTarget(event.pos)
 
-        for obj in self.__eventObjects:
-            if obj.doEventSpread(event.pos):
-                if temp is None:
-                    temp = obj
-                elif temp.zIndex is None:
-                    temp = obj
-                elif temp.zIndex is not None and obj.zIndex is not None:
-                    if temp.zIndex <= obj.zIndex:
-                        temp = obj
+        # Only components which have been entered through this surface can receive onMouseLeave
+        entered: List[InteractiveComponent] = []
+        for obj in self.__enteredObjects:
+            if obj is temp or obj.doEventSpread(event.pos):
+                entered.append(obj)
             elif obj.isMouseEntered:
                 obj.onMouseLeave(event)
+        self.__enteredObjects = entered
         
         if temp is not None:
             temp.onMouseMove(event)
             if not temp.isMouseEntered:
                 temp.onMouseEnter(event)
+            if temp not in self.__enteredObjects:
+                self.__enteredObjects.append(temp)
 
     def onMouseEnter(self, event) -> None:
         super().onMouseEnter(event)
@@ -525,12 +1129,14 @@ class Surface(InteractiveComponent):
 
     def onKeyDown(self, event) -> None:
         super().onKeyDown(event)
+        self.__dispatchFrameListeners(EventType.onKeyDown, event)
 
         for obj in self.__eventObjects:
             obj.onKeyDown(event)
 
     def onKeyUp(self, event) -> None:
         super().onKeyUp(event)
+        self.__dispatchFrameListeners(EventType.onKeyUp, event)
 
         for obj in self.__eventObjects:
             obj.onKeyUp(event)
@@ -556,8 +1162,11 @@ class Container(Surface):
 
     @staticmethod
     @final
-    def buildByText(size: int2d, textPos: float2d, text: str, font: Font | str, textColor: Color, backgroundColor: Optional[Color] = None, antialias: bool = True, position: Position = Position.TOPLEFT) -> Container:
-        obj = Container((0, 0), size)
+    def buildByText(size: int2d, textPos: float2d, text: str, font: Font | str, textColor: Color, backgroundColor: Optional[Color] = None, antialias: bool = True, position: Position = Position.TOPLEFT, pooled: bool = False) -> Container:
+        '''
+        if pooled is True, the container is built on a surface from the surface pool, see fromPool
+        '''
+        obj = Container.fromPool((0, 0), size, clear=backgroundColor is None) if pooled else Container((0, 0), size)
         if backgroundColor is not None:
             obj.fill(backgroundColor)
 
@@ -570,8 +1179,26 @@ class Container(Surface):
     
     @staticmethod
     @final
-    def buildByCenteredText(size: int2d, text: str, font: Font | str, textColor: Color, backgroundColor: Optional[Color] = None, antialias: bool = True) -> Container:
-        return Container.buildByText(size, (size[0] / 2, size[1] / 2), text, font, textColor, backgroundColor, antialias, Position.CENTER)
+    def buildByCenteredText(size: int2d, text: str, font: Font | str, textColor: Color, backgroundColor: Optional[Color] = None, antialias: bool = True, pooled: bool = False) -> Container:
+        return Container.buildByText(size, (size[0] / 2, size[1] / 2), text, font, textColor, backgroundColor, antialias, Position.CENTER, pooled)
+
+    @staticmethod
+    @final
+    def fromPool(pos: float2d, size: int2d, flags: int = 0, clear: bool = True) -> Container:
+        '''
+        Container on a surface from the surface pool instead of a new one.
+        Return it with releaseToPool once nothing draws it anymore.\n
+        clear can be False if the whole container is going to be filled.
+        '''
+        return Container(pos, getSurfacePool().acquire(size, flags, clear))
+
+    @final
+    def releaseToPool(self) -> bool:
+        '''
+        Return:
+            True if the surface of this container came from the surface pool and has been returned
+        '''
+        return getSurfacePool().release(self.getPygameSurface())
 
     def draw(self):
         pass
@@ -579,6 +1206,136 @@ class Container(Surface):
     def tick(self):
         super().tick()
 
+class DisplayListRecorder:
+    '''
+    Stands in for a Surface while a DisplayList is recorded. Only drawings which do not involve components can be recorded.
+    '''
+    RECORDABLE = ('fill', 'drawRect', 'drawCircle', 'drawEllipse', 'drawLine', 'drawLines', 'drawAntialiasedLine', 'drawAntialiasedLines',
+                  'drawTextByFont', 'drawTextByFontName', 'drawGlyphTextByFont', 'drawGlyphTextByFontName', 'drawImage')
+
+    def __init__(self) -> None:
+        self.__commands: List[Tuple[str, tuple, dict]] = []
+
+    @property
+    def commands(self) -> Tuple[Tuple[str, tuple, dict], ...]:
+        return tuple(self.__commands)
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name not in DisplayListRecorder.RECORDABLE:
+            raise AttributeError(f"{name} cannot be recorded into a DisplayList")
+
+        def record(*args, **kwargs) -> None:
+            if kwargs.get('zindex') is not None:
+                raise ValueError("z-index cannot be recorded, draw the DisplayList with a z-index instead")
+            self.__commands.append((name, args, kwargs))
+
+        return record
+
+class DisplayList(Component):
+    '''
+    Draw calls recorded once and drawn every frame until invalidated.\n
+    if rasterize is True, the calls are drawn into a cached layer of size which is blitted instead of replaying them.
+    Translucent drawings are blended twice when rasterized, so they may differ slightly from replaying them.
+    '''
+    def __init__(self, size: int2d, draw: Callable[[DisplayListRecorder], None], rasterize: bool = True) -> None:
+        super().__init__((0, 0), size)
+
+        recorder = DisplayListRecorder()
+        draw(recorder)
+        self.__commands = recorder.commands
+        self.__rasterize = rasterize
+        self.__layer: Optional[pygame.Surface] = None
+
+    @property
+    def commands(self) -> Tuple[Tuple[str, tuple, dict], ...]:
+        return self.__commands
+
+    @property
+    def rasterized(self) -> bool:
+        return self.__rasterize
+
+    @final
+    def replay(self, surface: Surface) -> None:
+        for name, args, kwargs in self.__commands:
+            getattr(surface, name)(*args, **kwargs)
+
+    @final
+    def getLayer(self) -> pygame.Surface:
+        '''
+        Return:
+            The recorded calls drawn onto a transparent surface, drawn again only after invalidate
+        '''
+        if self.__layer is None:
+            layer = Container((0, 0), pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha())
+            self.replay(layer)
+            self.__layer = layer.getPygameSurface()
+        return self.__layer
+
+    @final
+    def invalidate(self) -> None:
+        '''
+        Drops the cached layer, use this when an image or font used by the recorded calls has changed.
+        '''
+        self.__layer = None
+        self.markDirty()
+
+class ScrollBoxSource(metaclass=ABCMeta):
+    '''
+    Provides the contents of a ScrollBox on demand.\n
+    Call ScrollBox.invalidateRows when the data changes.
+    '''
+    @abstractmethod
+    def count(self) -> int:
+        pass
+
+    @abstractmethod
+    def build(self, index: int, hovered: bool) -> Container:
+        '''
+        Return:
+            Content of the given index, it must not be larger than ScrollBox.elementSize
+        '''
+        pass
+
+class TextLayoutSource(ScrollBoxSource):
+    '''
+    Lines of a text wrapped to width as the contents of a ScrollBox, so only the visible lines are rendered.\n
+    The elementHeight of the ScrollBox must be lineHeight, and width at most its elementSize[0].
+    Call ScrollBox.invalidateRows after changing text.
+    '''
+    def __init__(self, text: str, font: Font | str, color: Color, width: int, backgroundColor: Optional[Color] = None) -> None:
+        if isinstance(font, str):
+            loaded = getFont(font)
+            if loaded is None:
+                raise ValueError("invalid font name")
+            font = loaded
+        self.__font: Font = font
+        self.__color = color
+        self.__width = width
+        self.__backgroundColor = backgroundColor
+        self.__layout = layoutText(text, font, width)
+
+    @property
+    def text(self) -> str:
+        return self.__layout.text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        self.__layout = layoutText(text, self.__font, self.__width)
+
+    @property
+    def layout(self) -> TextLayout:
+        return self.__layout
+
+    @property
+    def lineHeight(self) -> int:
+        return self.__layout.lineHeight
+
+    def count(self) -> int:
+        return self.__layout.numOfLines
+
+    def build(self, index: int, hovered: bool) -> Container:
+        return Container.buildByText((self.__width, self.__layout.lineHeight), (0, 0), self.__layout.lines[index], self.__font, self.__color, self.__backgroundColor, pooled=True)
+
 class ScrollBoxStyle(ComponentStyle):
     scrollbarWidth: int
     elementHeight: int
@@ -595,7 +1352,11 @@ class ScrollBoxStyle(ComponentStyle):
         self.radius = radius
 
 class ScrollBox(InteractiveComponent):
-    def __init__(self, pos: float2d, size: int2d, style: ScrollBoxStyle, friction: float = 50, wheel: float = 50, contents: List[Container] = []) -> None:
+    def __init__(self, pos: float2d, size: int2d, style: ScrollBoxStyle, friction: float = 50, wheel: float = 50, contents: List[Container] = [], virtualized: bool = True, overscan: int = 1, source: Optional[ScrollBoxSource] = None, cacheSize: int = 128) -> None:
+        '''
+        if virtualized is True, only the contents inside the viewport and overscan more on each side are drawn per frame.\n
+        if source is given, contents are built by it when they are drawn and up to cacheSize of them are kept.
+        '''
         super().__init__(pos, size)
         self.__scrollbarWidth = style.scrollbarWidth
         self.__scrollbarColor = style.scrollbarColor
@@ -604,6 +1365,8 @@ class ScrollBox(InteractiveComponent):
         self.__friction = friction
         self.__wheel = wheel
         self.__radius = style.radius
+        self.__virtualized = virtualized
+        self.__overscan = overscan
         self.__contents: List[Container] = []
         for content in contents:
             if (content.size[0] > self.__elementSize[0]) or (content.size[1] > self.__elementSize[1]):
@@ -623,11 +1386,19 @@ class ScrollBox(InteractiveComponent):
         self.__hoverHandler: Optional[Callable[[Optional[int]], None]] = None
         self.__lastHoveredIdx: Optional[int] = None
 
+        self.__source: Optional[ScrollBoxSource] = source
+        self.__cacheSize = cacheSize
+        self.__rowCache: OrderedDict[Tuple[int, bool], Container] = OrderedDict()
+        # Rows dropped from the cache, returned to the surface pool at tick once they are no longer drawn
+        self.__droppedRows: List[Container] = []
+
     def clone(self) -> ScrollBox:
         return deepcopy(self)
 
     @property
     def numOfContents(self) -> int:
+        if self.__source is not None:
+            return self.__source.count()
         return len(self.__contents)
     
     @property
@@ -637,6 +1408,64 @@ class ScrollBox(InteractiveComponent):
     @contents.setter
     def contents(self, contents: List[Container]) -> None:
         self.__contents = contents
+        self.markDirty()
+
+    @property
+    def source(self) -> Optional[ScrollBoxSource]:
+        return self.__source
+
+    @source.setter
+    def source(self, source: Optional[ScrollBoxSource]) -> None:
+        self.__source = source
+        self.invalidateRows()
+
+    @property
+    def hoveredIndex(self) -> Optional[int]:
+        return self.__lastHoveredIdx
+
+    @final
+    def invalidateRows(self) -> None:
+        '''
+        Drops the contents built by source, call this when the data of source changes.
+        '''
+        self.__droppedRows.extend(self.__rowCache.values())
+        self.__rowCache.clear()
+        if self.__offset > self.maxOffset:
+            self.__setOffset(self.maxOffset)
+        self.markDirty()
+
+    @final
+    def getContent(self, idx: int) -> Container:
+        if self.__source is None:
+            return self.__contents[idx]
+
+        key = (idx, idx == self.__lastHoveredIdx)
+        content = self.__rowCache.get(key)
+        if content is None:
+            content = self.__source.build(idx, key[1])
+            self.__rowCache[key] = content
+            if len(self.__rowCache) > self.__cacheSize:
+                self.__droppedRows.append(self.__rowCache.popitem(last=False)[1])
+        else:
+            self.__rowCache.move_to_end(key)
+        return content
+
+    @final
+    def __getIndexAt(self, pos: float2d) -> Optional[int]:
+        if (self.pos[0] < pos[0] < self.pos[0] + self.elementSize[0]) and (self.pos[1] < pos[1] < self.pos[1] + self.size[1]):
+            idx = int((self.offset + pos[1] - self.pos[1]) / self.elementSize[1])
+            if idx < self.numOfContents:
+                return idx
+        return None
+
+    @final
+    def __setHoveredIndex(self, idx: Optional[int]) -> None:
+        if idx == self.__lastHoveredIdx:
+            return
+        self.__lastHoveredIdx = idx
+        if self.__hoverHandler is not None:
+            self.__hoverHandler(idx)
+        self.markDirty()
 
     @property
     def scrollbarWidth(self) -> int:
@@ -665,10 +1494,41 @@ class ScrollBox(InteractiveComponent):
     @property
     def elementSize(self) -> int2d:
         return self.__elementSize
+
+    @property
+    def virtualized(self) -> bool:
+        return self.__virtualized
+
+    @virtualized.setter
+    def virtualized(self, value: bool) -> None:
+        self.__virtualized = value
+
+    @property
+    def overscan(self) -> int:
+        return self.__overscan
+
+    @overscan.setter
+    def overscan(self, value: int) -> None:
+        self.__overscan = value
+
+    @property
+    def visibleRange(self) -> range:
+        '''
+        Return:
+            Indices of the contents which are drawn in the current frame, including overscan
+        '''
+        h = self.elementSize[1]
+        first = self.offset // h - self.__overscan
+        last = (self.offset + self.size[1]) // h + 1 + self.__overscan
+        return range(max(first, 0), min(last, self.numOfContents))
     
     @property
     def offset(self) -> int:
         return int(self.__offset)
+
+    @property
+    def isAnimating(self) -> bool:
+        return self.__speedPerTick != 0 or self.__startpos is not None
     
     @property
     def maxOffset(self) -> int:
@@ -685,6 +1545,12 @@ class ScrollBox(InteractiveComponent):
         if self.maxOffset == 0: return 0
         else: return (self.offset / self.maxOffset) * (self.size[1] - self.scrollBarLength)
     
+    @final
+    def __setOffset(self, value: float) -> None:
+        if value != self.__offset:
+            self.__offset = value
+            self.markDirty()
+
     @final
     def setClickHandler(self, handler: Callable[[int], None]) -> None:
         self.__clickHandler = handler
@@ -696,6 +1562,7 @@ class ScrollBox(InteractiveComponent):
     @final
     def append(self, content: Container) -> None:
         self.__contents.append(content)
+        self.markDirty()
 
     @final
     def pop(self, idx: int) -> None:
@@ -703,17 +1570,19 @@ class ScrollBox(InteractiveComponent):
             raise IndexError("list index out of range")
         else:
             self.__contents.pop(idx)
+            self.markDirty()
         
     @final
     def remove(self, content: Container) -> None:
         self.__contents.remove(content)
+        self.markDirty()
 
     def onMouseWheel(self, event) -> None:
         boxMove = -(event.y * self.__wheel)
 
-        if self.offset + boxMove < 0: self.__offset = 0
-        elif self.offset + boxMove > self.maxOffset: self.__offset = self.maxOffset
-        else: self.__offset += boxMove
+        if self.offset + boxMove < 0: self.__setOffset(0)
+        elif self.offset + boxMove > self.maxOffset: self.__setOffset(self.maxOffset)
+        else: self.__setOffset(self.__offset + boxMove)
 
         return super().onMouseWheel(event)
 
@@ -722,24 +1591,19 @@ class ScrollBox(InteractiveComponent):
             self.__speedPerTick = (self.__startpos[1] - event.pos[1]) / self.__tickcount
         self.__startpos = None
         self.__dragpos = None
+        self.__setHoveredIndex(None)
         return super().onMouseLeave(event)
     
     def onMouseMove(self, event) -> None:
-        if (self.pos[0] < event.pos[0] < self.pos[0] + self.elementSize[0]) and (self.pos[1] < event.pos[1] < self.pos[1] + self.size[1]):
-            idx = int(self.offset + (event.pos[1] - self.pos[1]) / self.elementSize[1])
-            if self.__hoverHandler is not None:            
-                self.__hoverHandler(idx)
-                self.__lastHoveredIdx = idx
+        self.__setHoveredIndex(self.__getIndexAt(event.pos))
 
+        if (self.pos[0] < event.pos[0] < self.pos[0] + self.elementSize[0]) and (self.pos[1] < event.pos[1] < self.pos[1] + self.size[1]):
             if self.__dragpos is not None:
                 boxMove = self.__dragpos[1] - event.pos[1]
-                if self.offset + boxMove < 0: self.__offset = 0
-                elif self.offset + boxMove > self.maxOffset: self.__offset = self.maxOffset
-                else: self.__offset += boxMove
+                if self.offset + boxMove < 0: self.__setOffset(0)
+                elif self.offset + boxMove > self.maxOffset: self.__setOffset(self.maxOffset)
+                else: self.__setOffset(self.__offset + boxMove)
                 self.__dragpos = event.pos
-        elif self.__lastHoveredIdx is not None and self.__hoverHandler is not None:
-            self.__hoverHandler(None)
-            self.__lastHoveredIdx = None
 
         return super().onMouseMove(event)
     
@@ -753,9 +1617,9 @@ class ScrollBox(InteractiveComponent):
         if self.__bardragpos is not None:
             barMove = event.pos[1] - self.__bardragpos[1]
             boxMove = barMove * (self.maxOffset / self.size[1])
-            if self.scrollBarOffset + barMove < 0: self.__offset = 0
-            elif self.scrollBarOffset + barMove > self.size[1] - self.scrollBarLength : self.__offset = self.maxOffset
-            else: self.__offset += boxMove
+            if self.scrollBarOffset + barMove < 0: self.__setOffset(0)
+            elif self.scrollBarOffset + barMove > self.size[1] - self.scrollBarLength : self.__setOffset(self.maxOffset)
+            else: self.__setOffset(self.__offset + boxMove)
             self.__bardragpos = event.pos
     
     def onMouseDown(self, event) -> None:
@@ -771,9 +1635,10 @@ class ScrollBox(InteractiveComponent):
         return super().onMouseDown(event)
     
     def onClick(self, event) -> None:
-        if event.button == 1 and (self.pos[0] < event.pos[0] < self.pos[0] + self.elementSize[0]) and (self.pos[1] < event.pos[1] < self.pos[1] + self.size[1]) and self.__clickHandler is not None:
-            idx = int(self.offset + (event.pos[1] - self.pos[1]) / self.elementSize[1])                        
-            self.__clickHandler(idx)
+        if event.button == 1 and self.__clickHandler is not None:
+            idx = self.__getIndexAt(event.pos)
+            if idx is not None:
+                self.__clickHandler(idx)
         return super().onClick(event)
     
     def onMouseUp(self, event) -> None:
@@ -787,20 +1652,25 @@ class ScrollBox(InteractiveComponent):
         return super().onMouseUp(event)
     
     def tick(self) -> None:
+        if len(self.__droppedRows) > 0:
+            for row in self.__droppedRows:
+                row.releaseToPool()
+            self.__droppedRows.clear()
+
         if self.__startpos is not None:
             self.__tickcount += 1
 
         if self.__speedPerTick > 0 and (self.__offset + self.__speedPerTick > self.maxOffset):
-            self.__offset = self.maxOffset
+            self.__setOffset(self.maxOffset)
             self.__speedPerTick = 0
         elif self.__speedPerTick < 0 and (self.__offset + self.__speedPerTick < 0):
-            self.__offset = 0
+            self.__setOffset(0)
             self.__speedPerTick = 0
         else:
             framerate = getCurrentFramerate()
             if framerate == 0: return
             friction = self.__friction / framerate
-            self.__offset += self.__speedPerTick
+            self.__setOffset(self.__offset + self.__speedPerTick)
 
             if self.__speedPerTick > 0:
                 if self.__speedPerTick < friction: self.__speedPerTick = 0
@@ -809,14 +1679,49 @@ class ScrollBox(InteractiveComponent):
                 if -self.__speedPerTick < friction: self.__speedPerTick = 0
                 else: self.__speedPerTick += friction
 
-    def render(self) -> Container:
+    def render(self, pooled: bool = False) -> Container:
+        '''
+        if pooled is True, the box is built on a surface from the surface pool and has to be returned with
+        releaseToPool once it is no longer drawn, as drawScrollBox does at tick.
+
+        Return:
+            Box of the visible contents
+        '''
+        if not self.__virtualized:
+            return self.__renderAll(pooled)
+
+        box = self.__createBox(self.size, pooled)
+        if self.__backgroundColor is not None:
+            box.fill(self.__backgroundColor)
+
+        h = self.elementSize[1]
+        for i in self.visibleRange:
+            content = self.getContent(i)
+            if content.size[0] > self.elementSize[0] or content.size[1] > self.elementSize[1]:
+                raise ValueError("Size of Element doesn't match elementSize")
+            content.pos = (0, h * i - self.offset)
+            box.drawContainer(content)
+
+        box.drawRect(self.scrollbarColor, (self.elementSize[0], self.scrollBarOffset), (self.scrollbarWidth, self.scrollBarLength), radius=self.__radius)
+
+        return box
+
+    @final
+    def __createBox(self, size: int2d, pooled: bool) -> Container:
+        if not pooled:
+            return Container(self.pos, size)
+        # The whole box is filled when there is a background color
+        return Container.fromPool(self.pos, size, clear=self.__backgroundColor is None)
+
+    @final
+    def __renderAll(self, pooled: bool) -> Container:
         l = self.elementSize[1] * self.numOfContents
-        box = Container(self.pos, (self.size[0], l if l > self.size[1] else self.size[1]))
+        box = self.__createBox((self.size[0], l if l > self.size[1] else self.size[1]), pooled)
         if self.__backgroundColor is not None:
             box.fill(self.__backgroundColor)
 
         for i in range(0, self.numOfContents):
-            content = self.__contents[i]
+            content = self.getContent(i)
             if content.size[0] > self.elementSize[0] or content.size[1] > self.elementSize[1]:
                 raise ValueError("Size of Element doesn't match elementSize")
             content.pos = (0, self.elementSize[1] * i)
@@ -843,6 +1748,17 @@ class DropdownStyle(ComponentStyle):
         self.itemHoverColor = itemHoverColor
         self.itemTextColor = itemTextColor
 
+class _DropdownItemSource(ScrollBoxSource):
+    def __init__(self, dropdown: Dropdown) -> None:
+        self.__dropdown = dropdown
+
+    def count(self) -> int:
+        return self.__dropdown.numOfItems
+
+    def build(self, index: int, hovered: bool) -> Container:
+        d = self.__dropdown
+        return Container.buildByCenteredText(d.getScrollBox().elementSize, d.items[index], d.font, d.itemTextColor, d.itemHoverColor if hovered else d.itemBackgroundColor, pooled=True)
+
 class Dropdown(Component):
     def __init__(self, pos: float2d, buttonSize: int2d, scrollBoxSize: int2d, style: DropdownStyle, items: List[str], default: int = 0) -> None:
         if len(items) == 0:
@@ -862,7 +1778,7 @@ class Dropdown(Component):
             self.__font = style.font
 
         self.__btn = Button(pos, buttonSize, style.buttonStyle, items[default])
-        self.__box = ScrollBox((0, 0), scrollBoxSize, style.scrollBoxStyle, contents=[])
+        self.__box = ScrollBox((0, 0), scrollBoxSize, style.scrollBoxStyle, source=_DropdownItemSource(self))
 
         self.__hoveridx: Optional[int] = None
         self.__box.setHoverHandler(self.onItemHover)
@@ -925,6 +1841,7 @@ class Dropdown(Component):
             self.__font = getFont(font)
         elif type(font) is Font:
             self.__font = font
+        self.__box.invalidateRows()
 
     @property
     def itemTextColor(self) -> Color:
@@ -933,6 +1850,7 @@ class Dropdown(Component):
     @itemTextColor.setter
     def itemTextColor(self, color: Color) -> None:
         self.__itemTextColor = color
+        self.__box.invalidateRows()
 
     @property
     def itemHoverColor(self) -> Color:
@@ -941,6 +1859,7 @@ class Dropdown(Component):
     @itemHoverColor.setter
     def itemHoverColor(self, color: Color) -> None:
         self.__itemHoverColor = color
+        self.__box.invalidateRows()
 
     @property
     def itemBackgroundColor(self) -> Color:
@@ -949,10 +1868,12 @@ class Dropdown(Component):
     @itemBackgroundColor.setter
     def itemBackgroundColor(self, color: Color) -> None:
         self.__itemBackgroundColor = color
+        self.__box.invalidateRows()
     
     @final
     def append(self, item: str) -> None:
         self.__items.append(item)
+        self.__box.invalidateRows()
 
     @final
     def pop(self, idx: int) -> None:
@@ -960,7 +1881,9 @@ class Dropdown(Component):
             raise IndexError("list index out of range")
         else:
             self.__items.pop(idx)
+            self.__box.invalidateRows()
     
     @final
     def remove(self, item: Container) -> None:
-        self.__items.remove(item)
\ No newline at end of file
+        self.__items.remove(item)
+        self.__box.invalidateRows()
\ No newline at end of file
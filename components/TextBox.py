@@ -1,8 +1,10 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Dict, Optional, Tuple, final
+from pygame import Rect, Surface
 from .Base import InteractiveComponent
-from ..utils.position import float2d, int2d
+from ..utils.position import float2d, int2d, getBoundingRect
 from ..utils.font import Font, getFont
+from ..utils.textlayout import TextLayout, layoutText
 from ..utils.color import Color, COLORS
 from ..utils.style import ComponentStyle
 
@@ -15,8 +17,12 @@ class TextBoxStyle(ComponentStyle):
     borderColor: Optional[Color]
     borderThickness: int
     radius: int
+    multiline: bool
 
-    def __init__(self, font: Font | str, textColor: Color = COLORS.BLACK, backgroundColor: Optional[Color] = COLORS.WHITE, borderColor: Optional[Color] = COLORS.BLACK, borderThickness: int = 1, radius: int = -1) -> None:
+    def __init__(self, font: Font | str, textColor: Color = COLORS.BLACK, backgroundColor: Optional[Color] = COLORS.WHITE, borderColor: Optional[Color] = COLORS.BLACK, borderThickness: int = 1, radius: int = -1, multiline: bool = False) -> None:
+        '''
+        if multiline is True, text is wrapped by words to the width of the box and drawn from its top left.
+        '''
         super().__init__()
         self.font = font
         self.textColor = textColor
@@ -24,8 +30,11 @@ class TextBoxStyle(ComponentStyle):
         self.borderColor = borderColor
         self.borderThickness = borderThickness
         self.radius = radius
+        self.multiline = multiline
 
 class TextBox(InteractiveComponent):
+    __slots__ = ('__text', '__textColor', '__backgroundColor', '__borderColor', '__borderThickness', '__radius', '__multiline', '__font', '__renderCache')
+
     def __init__(self, pos: float2d, size: int2d, style: TextBoxStyle, text: str = '') -> None:
         super().__init__(pos, size)
         self.__text = text
@@ -34,6 +43,7 @@ class TextBox(InteractiveComponent):
         self.__borderColor = style.borderColor
         self.__borderThickness = style.borderThickness
         self.__radius = style.radius
+        self.__multiline = style.multiline
         self.__font: Font | None
 
         if type(style.font) is str:
@@ -43,13 +53,18 @@ class TextBox(InteractiveComponent):
         else:
             self.__font = None
 
+        # Created on the first render, most widgets of a large tree are never drawn
+        self.__renderCache: Optional[Dict[bool, Tuple[tuple, Surface]]] = None
+
     @property
     def text(self) -> str:
         return self.__text
 
     @text.setter
     def text(self, text: str):
-        self.__text = text
+        if text != self.__text:
+            self.__text = text
+            self.markDirty()
     
     @property
     def textColor(self) -> Color:
@@ -58,6 +73,7 @@ class TextBox(InteractiveComponent):
     @textColor.setter
     def textColor(self, color: Color):
         self.__textColor = color
+        self.markDirty()
     
     @property
     def backgroundColor(self) -> Color:
@@ -66,6 +82,7 @@ class TextBox(InteractiveComponent):
     @backgroundColor.setter
     def setBackgroundColor(self, color: Color):
         self.__backgroundColor = color
+        self.markDirty()
 
     @property
     def borderColor(self) -> Color:
@@ -74,6 +91,7 @@ class TextBox(InteractiveComponent):
     @borderColor.setter
     def borderColor(self, color: Color):
         self.__borderColor = color
+        self.markDirty()
 
     @property
     def borderThickness(self) -> int:
@@ -82,6 +100,7 @@ class TextBox(InteractiveComponent):
     @borderThickness.setter
     def borderThickness(self, value: int):
         self.__borderThickness = value
+        self.markDirty()
 
     @property
     def font(self) -> Optional[Font]:
@@ -93,10 +112,84 @@ class TextBox(InteractiveComponent):
             self.__font = getFont(font)
         elif type(font) is Font:
             self.__font = font
+        self.markDirty()
 
     @property
     def radius(self) -> int:
         return self.__radius
 
+    @property
+    def multiline(self) -> bool:
+        return self.__multiline
+
+    @multiline.setter
+    def multiline(self, value: bool):
+        self.__multiline = value
+        self.markDirty()
+
+    def getLayout(self) -> Optional[TextLayout]:
+        '''
+        Return:
+            Lines of the text wrapped to the width of the box, None if there is no font
+        '''
+        if self.font is None:
+            return None
+        return layoutText(self.text, self.font, int(self.size[0]))
+
+    @property
+    def textSize(self) -> int2d:
+        '''
+        Return:
+            Size of the rendered text, (0, 0) if there is no font
+        '''
+        if self.font is None:
+            return (0, 0)
+        if self.__multiline:
+            return self.getLayout().size
+        return self.font.size(self.text)
+
+    @property
+    def renderRect(self) -> Rect:
+        size = self.size
+        pos = self.pos
+        b = self.borderThickness
+        rect = getBoundingRect(pos, (size[0] + (b * 2), size[1] + (b * 2)))
+        # Multiline text is cut at the edges of the box
+        if self.font is not None and not self.multiline:
+            w, h = self.textSize
+            rect.union_ip(getBoundingRect((pos[0] + (size[0] - w) / 2, pos[1] + (size[1] - h) / 2), (w, h)))
+        return rect
+
+    @final
+    def getRenderCache(self, state: bool, key: tuple) -> Optional[Surface]:
+        '''
+        Return:
+            Pre-rendered image of the given hover state, if it was rendered with the same key
+        '''
+        if self.__renderCache is None:
+            return None
+        entry = self.__renderCache.get(state)
+        return entry[1] if entry is not None and entry[0] == key else None
+
+    @final
+    def setRenderCache(self, state: bool, key: tuple, image: Surface) -> None:
+        if self.__renderCache is None:
+            self.__renderCache = {}
+        self.__renderCache[state] = (key, image)
+
+    @final
+    def clearRenderCache(self) -> None:
+        self.__renderCache = None
+
+    @property
+    def renderCacheBytes(self) -> int:
+        '''
+        Return:
+            Memory used by the pre-rendered images of this widget
+        '''
+        if self.__renderCache is None:
+            return 0
+        return sum(image.get_pitch() * image.get_height() for _, image in self.__renderCache.values())
+
     def tick(self) -> None:
         pass
\ No newline at end of file
@@ -1,14 +1,11 @@
 from ..utils.position import float2d, int2d
-from ..utils.language import Language, LanguageState, Hangul
+from ..utils.language import Language, LanguageState, HangulComposer
+from ..utils.scheduler import ScheduledCall, getScheduler
+from ..utils.textbuffer import TextBuffer
 from .TextBox import TextBox, TextBoxStyle
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
 import pygame
-import threading
-
-'''
-TODO: buffer가 아니라 LanguageChangePoint를 이용해 한글 입력을 구현해야 함.
-buffer를 사용하면 한글 입력 상태에서 buffer에 담긴 내용 이전까지 지우려 할 때 문제가 발생함
-어디에서 한영전환이 일어났는지 기록한 후 모드를 바꿔가며 구현해야 함.
-'''
 
 __all__ = ['TextInput', 'TextInputStyle']
 
@@ -16,82 +13,193 @@ TextInputStyle = TextBoxStyle
 
 mapping = {'1': '!', '2': '@', '3': '#', '4': '$', '5': '%', '6': '^', '7': '&', '8': '*', '9': '(', '0': ')', '-': '_', '=': '+', '`': '~', '\'': '"', ';': ':', ',': '<', '.': '>', '/': '?', '\\':'|'}
 class TextInput(TextBox):
+    __slots__ = ('__buffer', '__composer', '__isDeleting', '__timer', '__runsKey', '__runs', '__widths', '__offsets', '__textSize')
+
     def __init__(self, pos: float2d, size: int2d, style: TextInputStyle, text: str = '') -> None:
         super().__init__(pos, size, style, text)
-        self.__completedText = ""
-        self.__buffer = ""
+        self.__buffer = TextBuffer(text)
+        self.__composer = HangulComposer()
         self.__isDeleting: bool = False
-        self.__timer = None
+        self.__timer: Optional[ScheduledCall] = None
+        self.__runsKey: Optional[tuple] = None
+        self.__runs: List[str] = []
+        self.__widths: Dict[str, int] = {}
+        self.__offsets: List[int] = []
+        self.__textSize: int2d = (0, 0)
         Language.addEventListener(self.__languageChangeHandler)
 
+    @property
+    def text(self) -> str:
+        return self.__buffer.text
+
+    @text.setter
+    def text(self, text: str):
+        if text != self.__buffer.text:
+            self.__buffer.text = text
+            self.__composer.clear()
+            self.markDirty()
+
+    @property
+    def buffer(self) -> TextBuffer:
+        return self.__buffer
+
+    @property
+    def cursor(self) -> int:
+        return self.__buffer.cursor
+
+    @cursor.setter
+    def cursor(self, cursor: int):
+        self.__composer.clear()
+        self.__buffer.cursor = cursor
+
+    @property
+    def isAnimating(self) -> bool:
+        return self.__isDeleting
+
+    @property
+    def textSize(self) -> int2d:
+        if self.multiline:
+            return super().textSize
+        return self.getTextRuns()[2]
+
+    def getTextRuns(self) -> Tuple[List[str], List[int], int2d]:
+        '''
+        Text is laid out chunk by chunk of the buffer, so an edit only measures the chunk it changed
+        and only the visible chunks have to be rendered. Glyphs are not kerned across chunks.
+
+        Return:
+            Chunks of the text, x offset of every chunk, and the size of the whole text
+        '''
+        font = self.font
+        if font is None:
+            return [], [], (0, 0)
+
+        key = (self.__buffer.version, font)
+        if key != self.__runsKey:
+            if self.__runsKey is None or self.__runsKey[1] is not font:
+                self.__widths = {}
+            widths = self.__widths
+            chunks = [chunk for chunk in self.__buffer.chunks if len(chunk) > 0]
+            # Unchanged chunks keep their measured width
+            self.__widths = {chunk: widths.get(chunk) or font.size(chunk)[0] for chunk in chunks}
+            offsets = [0]
+            offsets.extend(accumulate(self.__widths[chunk] for chunk in chunks))
+            self.__runs = chunks
+            self.__offsets = offsets[:-1]
+            self.__textSize = (offsets[-1], font.get_height())
+            self.__runsKey = key
+        return self.__runs, self.__offsets, self.__textSize
+
+    def getCursorOffset(self) -> int:
+        '''
+        Return:
+            x offset of the cursor from the left of the text, for single line text
+        '''
+        chunks, offsets, _ = self.getTextRuns()
+        if len(chunks) == 0:
+            return 0
+        index, offset = self.__buffer.cursorChunk
+        return offsets[index] + self.font.size(chunks[index][:offset])[0]
+
     def __startDeleting(self):
         self.__isDeleting = True
-        self.__runDeleting()
+        # A stalled frame must not delete a burst of characters at once
+        self.__timer = getScheduler().callRepeating(0.01, self.__runDeleting, 0, skipMissed=True)
+
+    def __stopDeleting(self):
+        self.__isDeleting = False
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
 
     def __languageChangeHandler(self, language: LanguageState):
         if language == LanguageState.KOREAN:
-            self.__completedText = self.text
-            self.__buffer = ""
+            self.__composer.clear()
+
+    def __compose(self, edit) -> None:
+        # Only the end of the composed text changes, so only that part is replaced in the buffer
+        composer = self.__composer
+        committed = len(composer.committedText)
+        length = committed + len(composer.composingText)
+        edit()
+        start = min(committed, len(composer.committedText))
+        self.__buffer.delete(length - start)
+        self.__buffer.insert(composer.committedText[start:] + composer.composingText)
+        self.markDirty()
 
-    def __applyBuffer(self):
-        self.text = self.__completedText + Hangul.combineIntoHangul(self.__buffer)
+    def __deleteChar(self, byChar: bool) -> None:
+        if Language.getLanguageState() == LanguageState.KOREAN and self.__composer.numOfKeys > 0:
+            self.__compose(self.__composer.popChar if byChar else self.__composer.pop)
+        elif self.__buffer.delete(1) > 0:
+            self.markDirty()
 
     def __runDeleting(self):
-        if Language.getLanguageState() == LanguageState.ENGLISH:
-            self.text = self.text[0:-1]
-        else:
-            if (len(self.__buffer) == 0):
-                #self.__
-                pass
-            count = Hangul.getLengthOfLastChar(self.__buffer)
-            self.__buffer = self.__buffer[0:-count]
-            self.__applyBuffer()
-
-        if self.__isDeleting:
-            threading.Timer(0.01, self.__runDeleting).start()
-            
+        self.__deleteChar(True)
+
+    def __moveCursor(self, delta: int) -> None:
+        self.__composer.clear()
+        self.__buffer.moveCursor(delta)
+
     def onKeyDown(self, event) -> None:
         super().onKeyDown(event)
         key = event.key
         ls = Language.getLanguageState()
 
         if key == pygame.K_BACKSPACE:
-            if len(self.text) == 0:
+            if self.__buffer.cursor == 0:
                 return
-            self.__timer = threading.Timer(0.3, self.__startDeleting)
-            self.__timer.start()
-            if ls == LanguageState.ENGLISH:
-                self.text = self.text[0:-1]
-            else:
-                self.__buffer = self.__buffer[0:-1]
-                self.__applyBuffer()
+            self.__stopDeleting()
+            self.__timer = getScheduler().callLater(0.3, self.__startDeleting)
+            self.__deleteChar(False)
+            return
+        elif key == pygame.K_RETURN and self.multiline:
+            self.__composer.clear()
+            self.__buffer.insert('\n')
+            self.markDirty()
+            return
+        elif self.multiline and key in (pygame.K_DELETE, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_HOME, pygame.K_END):
+            # The caret is only drawn on a single line, so multiline text is edited at its end
+            return
+        elif key == pygame.K_DELETE:
+            self.__composer.clear()
+            if self.__buffer.deleteForward(1) > 0:
+                self.markDirty()
+            return
+        elif key == pygame.K_LEFT:
+            self.__moveCursor(-1)
+            return
+        elif key == pygame.K_RIGHT:
+            self.__moveCursor(1)
+            return
+        elif key == pygame.K_HOME:
+            self.__moveCursor(-self.__buffer.cursor)
+            return
+        elif key == pygame.K_END:
+            self.__moveCursor(len(self.__buffer) - self.__buffer.cursor)
             return
         elif not 32 <= event.key <= 126:
             return
-        
+
         if mapping.get(chr(key)) != None and (event.mod & pygame.KMOD_SHIFT):
             key = ord(mapping[chr(key)])
-        
+
         if (97 <= key <= 122):
             if (event.mod & pygame.KMOD_CAPS) and (not (event.mod & pygame.KMOD_SHIFT)):
                 key -= 32
             elif (not (event.mod & pygame.KMOD_CAPS)) and (event.mod & pygame.KMOD_SHIFT):
                 key -= 32
-        
+
         if ls == LanguageState.ENGLISH:
-            self.text = self.text + chr(key)
+            self.__buffer.insert(chr(key))
+            self.markDirty()
         else:
-            self.__buffer += chr(key)
-            self.__applyBuffer()
+            self.__compose(lambda: self.__composer.push(chr(key)))
 
     def onKeyUp(self, event) -> None:
         super().onKeyUp(event)
 
         if event.key == pygame.K_BACKSPACE:
-            if self.__isDeleting:
-                self.__isDeleting = False
-            elif self.__timer is not None:
-                self.__timer.cancel()
-                
+            self.__stopDeleting()
+
 
 
@@ -1 +1,2 @@
-from .app import *
\ No newline at end of file
+from .app import *
+from .preloader import *
\ No newline at end of file
@@ -8,6 +8,10 @@ from ..components.Scene import Scene
 from ..utils.event import EventType
 from ..utils.app import renewFramerate, DisplayMode, renewWindowSize
 from ..utils.language import Language
+from ..utils.profiler import FrameProfiler, enableProfiling, disableProfiling, getProfiler
+from .preloader import Preloader
+from ..utils.scheduler import Scheduler, getScheduler
+import math
 
 __all__ = ['App']
 
@@ -19,8 +23,16 @@ class App:
         self.__clock = pygame.time.Clock()
         self.__framerate: int = 0
         self.__eventListeners: Dict[EventType, List[Callable[[App], None]]] = {}
-        self.__scene: Optional[Scene]
+        self.__scene: Optional[Scene] = None
         self.__pygameSurface: Optional[pygame.surface.Surface] = None
+        self.__retainedMode: bool = False
+        self.__idleMode: bool = False
+        self.__idleTimeout: int = 1000
+        self.__framesSkipped: int = 0
+        self.__profilerOverlay: bool = False
+        self.__overlayFont: Optional[pygame.font.Font] = None
+        self.__overlayRect: Optional[pygame.Rect] = None
+        self.__preloaders: List[Preloader] = []
 
     def __occurEvent(self, event: EventType) -> None:
         if event in self.__eventListeners:
@@ -29,13 +41,18 @@ class App:
     
     def run(self, initialScene: Scene) -> None:
         self.__scene = initialScene
+        self.__scene.retained = self.__retainedMode
 
         self.__occurEvent(EventType.RUN)
         self.__scene.onEnterScene()
 
         while not self.__terminate:
+            profiler = getProfiler()
+            if profiler is not None:
+                profiler.beginFrame()
+
             # Event handling
-            for event in pygame.event.get():
+            for event in self.__getEvents():
                 if event.type == pygame.QUIT:
                     self.__scene.onEscapeScene()
                     self.__occurEvent(EventType.QUIT)
@@ -57,23 +74,146 @@ class App:
                 elif event.type == pygame.KEYUP:
                     self.__scene.onKeyUp(event)
 
+            if len(self.__preloaders) > 0:
+                self.__pollPreloaders()
+
+            getScheduler().run()
+
+            if profiler is not None:
+                profiler.mark('events')
+
             # Drawing
             self.__scene.tick()
-            self.__scene.draw()
-            self.__scene.render()
+            if profiler is not None:
+                profiler.mark('tick')
+
+            if self.__retainedMode:
+                self.__renderDirtyRects(profiler)
+            else:
+                self.__scene.draw()
+                if profiler is not None:
+                    profiler.mark('draw')
+                self.__scene.render()
+                if profiler is not None:
+                    profiler.mark('render')
 
-            assert self.__pygameSurface is not None, 'Use setWindowMode before running'
+                assert self.__pygameSurface is not None, 'Use setWindowMode before running'
 
-            self.__pygameSurface.blit(self.__scene.getPygameSurface(), (0, 0))
-            pygame.display.update()         
+                self.__pygameSurface.blit(self.__scene.getPygameSurface(), (0, 0))
+                if profiler is not None:
+                    profiler.mark('blit')
+                    if self.__profilerOverlay:
+                        self.__drawProfilerOverlay(profiler)
+                pygame.display.update()         
+                if profiler is not None:
+                    profiler.mark('update')
             
             # Framerate
             if not self.__framerate == 0:
                 self.__clock.tick(self.__framerate)
+
+            if profiler is not None:
+                profiler.mark('wait')
+                profiler.endFrame()
                 
         pygame.quit()
         sys.exit()
 
+    def __pollPreloaders(self) -> None:
+        for preloader in list(self.__preloaders):
+            preloader.poll()
+            if preloader.isComplete:
+                self.__preloaders.remove(preloader)
+
+    def preload(self, preloader: Preloader) -> Preloader:
+        '''
+        Starts preloader if needed and hands its finished assets over every frame until it is complete.
+        '''
+        if not preloader.isStarted:
+            preloader.start()
+        if not preloader.isComplete:
+            self.__preloaders.append(preloader)
+        return preloader
+
+    def __getEvents(self) -> List[pygame.event.Event]:
+        if not self.__idleMode or len(self.__preloaders) > 0 or self.__scene.isAnimating or (self.__retainedMode and self.__scene.isDirty):
+            return pygame.event.get()
+
+        # Nothing is animating, so sleep until an event arrives or the timeout passes
+        timeout = self.__idleTimeout
+        due = getScheduler().nextDue
+        if due is not None:
+            # Wake up in time for the next scheduled callback, 0 would mean waiting without timeout
+            timeout = max(math.ceil(due * 1000), 1) if timeout == 0 else min(timeout, max(math.ceil(due * 1000), 1))
+
+        start = pygame.time.get_ticks()
+        event = pygame.event.wait(timeout)
+        elapsed = pygame.time.get_ticks() - start
+        profiler = getProfiler()
+        if profiler is not None:
+            profiler.mark('idle')
+        if self.__framerate == 0:
+            self.__framesSkipped += 1
+        else:
+            self.__framesSkipped += elapsed * self.__framerate // 1000
+
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+        return events
+
+    def __renderDirtyRects(self, profiler: Optional[FrameProfiler]) -> None:
+        assert self.__pygameSurface is not None, 'Use setWindowMode before running'
+
+        rects = self.__scene.collectDirtyRects()
+        if len(rects) == 0:
+            self.__framesSkipped += 1
+            return
+
+        surface = self.__scene.getPygameSurface()
+        surface.set_clip(rects[0].unionall(rects[1:]))
+        self.__scene.clearFrameObjects()
+        self.__scene.draw()
+        if profiler is not None:
+            profiler.mark('draw')
+        self.__scene.render()
+        if profiler is not None:
+            profiler.mark('render')
+        surface.set_clip(None)
+
+        for rect in rects:
+            self.__pygameSurface.blit(surface, rect, rect)
+        if profiler is not None:
+            profiler.mark('blit')
+            if self.__profilerOverlay:
+                # The overlay is not part of the scene, so the area under it is restored first
+                if self.__overlayRect is not None:
+                    self.__pygameSurface.blit(surface, self.__overlayRect, self.__overlayRect)
+                    rects.append(self.__overlayRect)
+                rects.append(self.__drawProfilerOverlay(profiler))
+        pygame.display.update(rects)
+        if profiler is not None:
+            profiler.mark('update')
+
+    def __drawProfilerOverlay(self, profiler: FrameProfiler) -> pygame.Rect:
+        assert self.__pygameSurface is not None, 'Use setWindowMode before running'
+
+        if self.__overlayFont is None:
+            self.__overlayFont = pygame.font.Font(None, 16)
+        font = self.__overlayFont
+
+        lines = [font.render(line, True, (255, 255, 255)) for line in profiler.getSummary()]
+        height = font.get_linesize()
+        rect = pygame.Rect(0, 0, max((line.get_width() for line in lines), default=0) + 8, height * len(lines) + 8)
+
+        background = pygame.Surface(rect.size)
+        background.set_alpha(180)
+        self.__pygameSurface.blit(background, rect)
+        self.__pygameSurface.blits([(line, (4, 4 + height * i)) for i, line in enumerate(lines)], doreturn=False)
+
+        self.__overlayRect = rect
+        return rect
+
     @property
     def title(self) -> str:
         return pygame.display.get_caption()[0]
@@ -114,6 +254,88 @@ class App:
         renewFramerate(framerate)
         self.__framerate = framerate
 
+    @property
+    def retainedMode(self) -> bool:
+        '''
+        If True, only the areas of the scene which have changed are redrawn and pushed to the display.
+        '''
+        return self.__retainedMode
+
+    @retainedMode.setter
+    def retainedMode(self, value: bool) -> None:
+        self.__retainedMode = value
+        if self.__scene is not None:
+            self.__scene.retained = value
+
+    @property
+    def idleMode(self) -> bool:
+        '''
+        If True, the main loop sleeps until an event arrives while no component of the scene is animating.\n
+        A frame is still drawn every idleTimeout milliseconds.
+        '''
+        return self.__idleMode
+
+    @idleMode.setter
+    def idleMode(self, value: bool) -> None:
+        self.__idleMode = value
+
+    @property
+    def idleTimeout(self) -> int:
+        '''
+        value in milliseconds, 0 means waiting for an event without timeout
+        '''
+        return self.__idleTimeout
+
+    @idleTimeout.setter
+    def idleTimeout(self, value: int) -> None:
+        self.__idleTimeout = value
+
+    @property
+    def framesSkipped(self) -> int:
+        '''
+        Return:
+            Number of frames which were not drawn because the scene was idle
+        '''
+        return self.__framesSkipped
+
+    @property
+    def scheduler(self) -> Scheduler:
+        '''
+        Return:
+            The scheduler run once per frame, the same one returned by utils.scheduler.getScheduler
+        '''
+        return getScheduler()
+
+    @property
+    def profiling(self) -> bool:
+        '''
+        If True, every frame is timed by phase and draw method. Stats are available through profiler.
+        '''
+        return getProfiler() is not None
+
+    @profiling.setter
+    def profiling(self, value: bool) -> None:
+        if value and getProfiler() is None:
+            enableProfiling()
+        elif not value:
+            disableProfiling()
+
+    @property
+    def profiler(self) -> Optional[FrameProfiler]:
+        return getProfiler()
+
+    @property
+    def profilerOverlay(self) -> bool:
+        '''
+        If True, a summary of the profiler is drawn over the scene while profiling is enabled.
+        '''
+        return self.__profilerOverlay
+
+    @profilerOverlay.setter
+    def profilerOverlay(self, value: bool) -> None:
+        self.__profilerOverlay = value
+        self.__overlayRect = None
+
     @property
     def scene(self) -> Scene | None:
         return self.__scene
@@ -123,6 +345,7 @@ class App:
         if self.__scene is not None:
             self.__scene.onEscapeScene()
         self.__scene = scene
+        self.__scene.retained = self.__retainedMode
         self.__scene.onEnterScene()
 
     
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import io
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from ..utils.image import addImage, convertImage
+from ..utils.font import addFont
+from ..components.Audio import addPreloadedSound
+
+__all__ = ['Preloader', 'PreloadEventType', 'PRELOAD_EVENT']
+
+# Posted by worker threads so that an idle App wakes up to hand finished assets over
+PRELOAD_EVENT = pygame.event.custom_type()
+
+class PreloadEventType(Enum):
+    onProgress = 0
+    onComplete = 1
+    onError = 2
+
+class Preloader:
+    '''
+    Decodes images, fonts and sounds on worker threads while the main loop keeps running.\n
+    Finished assets are handed over on the main thread by poll, which App calls every frame for preloaders passed to App.preload.
+    Images go to utils.image, fonts to utils.font and sounds to Audio, so they are found there by path afterwards.
+    '''
+    def __init__(self, maxWorkers: int = 4, pollBudget: float = 4) -> None:
+        '''
+        pollBudget in milliseconds spent handing over assets per poll
+        '''
+        self.__maxWorkers = maxWorkers
+        self.__pollBudget = pollBudget / 1000
+        self.__jobs: List[Tuple[str, Callable[[], object], Callable[[object], None]]] = []
+        self.__finished: queue.Queue[Tuple[str, Optional[object], Optional[Exception], Callable[[object], None]]] = queue.Queue()
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__numOfLoaded: int = 0
+        self.__errors: Dict[str, Exception] = {}
+        self.__eventListeners: Dict[PreloadEventType, List[Callable[[Preloader], None]]] = {}
+
+    def __occurEvent(self, event: PreloadEventType) -> None:
+        if event in self.__eventListeners:
+            for callback in self.__eventListeners[event]:
+                callback(self)
+
+    def addImage(self, path: str) -> Preloader:
+        self.__jobs.append((path, lambda: pygame.image.load(path), lambda image: addImage(path, convertImage(image))))
+        return self
+
+    def addFont(self, path: str, size: int, regName: Optional[str] = None) -> Preloader:
+        '''
+        if regName is None, font is stored as path
+        '''
+        def read() -> bytes:
+            with open(path, 'rb') as f:
+                return f.read()
+
+        self.__jobs.append((path, read, lambda data: addFont(pygame.font.Font(io.BytesIO(data), size), path if regName is None else regName)))
+        return self
+
+    def addSound(self, path: str) -> Preloader:
+        self.__jobs.append((path, lambda: pygame.mixer.Sound(path).get_raw(), lambda raw: addPreloadedSound(path, raw)))
+        return self
+
+    def start(self) -> Preloader:
+        if self.__executor is not None:
+            raise RuntimeError("Preloader has already been started")
+
+        self.__executor = ThreadPoolExecutor(max_workers=self.__maxWorkers)
+        for key, load, handOver in self.__jobs:
+            self.__executor.submit(self.__run, key, load, handOver)
+        self.__executor.shutdown(wait=False)
+
+        if len(self.__jobs) == 0:
+            self.__occurEvent(PreloadEventType.onComplete)
+        return self
+
+    def __run(self, key: str, load: Callable[[], object], handOver: Callable[[object], None]) -> None:
+        try:
+            self.__finished.put((key, load(), None, handOver))
+        except Exception as e:
+            self.__finished.put((key, None, e, handOver))
+
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(PRELOAD_EVENT))
+
+    def poll(self) -> None:
+        '''
+        Hands finished assets over to the main thread, must be called from the main thread.
+        '''
+        if self.isComplete:
+            return
+
+        deadline = time.perf_counter() + self.__pollBudget
+        changed = False
+        failed = False
+        while time.perf_counter() < deadline:
+            try:
+                key, value, error, handOver = self.__finished.get_nowait()
+            except queue.Empty:
+                break
+
+            if error is None:
+                try:
+                    handOver(value)
+                except Exception as e:
+                    error = e
+            if error is not None:
+                self.__errors[key] = error
+                failed = True
+
+            self.__numOfLoaded += 1
+            changed = True
+
+        if failed:
+            self.__occurEvent(PreloadEventType.onError)
+        if changed:
+            self.__occurEvent(PreloadEventType.onProgress)
+            if self.isComplete:
+                self.__occurEvent(PreloadEventType.onComplete)
+
+    @property
+    def numOfAssets(self) -> int:
+        return len(self.__jobs)
+
+    @property
+    def numOfLoaded(self) -> int:
+        '''
+        Return:
+            Number of assets which have been handed over or have failed
+        '''
+        return self.__numOfLoaded
+
+    @property
+    def progress(self) -> float:
+        return self.__numOfLoaded / len(self.__jobs) if len(self.__jobs) > 0 else 1.0
+
+    @property
+    def isStarted(self) -> bool:
+        return self.__executor is not None
+
+    @property
+    def isComplete(self) -> bool:
+        return self.__executor is not None and self.__numOfLoaded == len(self.__jobs)
+
+    @property
+    def errors(self) -> Dict[str, Exception]:
+        return self.__errors
+
+    def addEventListener(self, event: PreloadEventType, callback: Callable[[Preloader], None]) -> Preloader:
+        if not event in self.__eventListeners:
+            self.__eventListeners[event] = []
+        self.__eventListeners[event].append(callback)
+        return self
+
+    def removeEventListener(self, event: PreloadEventType, callback: Callable[[Preloader], None]) -> Preloader:
+        if event in self.__eventListeners:
+            self.__eventListeners[event].remove(callback)
+        return self
+
+    def clearEventListeners(self, event: PreloadEventType) -> Preloader:
+        if event in self.__eventListeners:
+            self.__eventListeners[event].clear()
+        return self
@@ -0,0 +1,166 @@
+import threading
+import time
+from typing import Optional
+
+import pygame
+import pytest
+
+from ..components.CameraCapture import CameraCapture
+from ..utils.position import int2d
+
+class FakeCameraBackend:
+    '''
+    Stands in for pygame.camera.Camera without a device. Frame n is filled with (n % 256, n // 256, 0),
+    so a drawn surface tells which frame it holds.\n
+    if fps is 0, get_image blocks until the test calls advance, otherwise it blocks until the next frame is due.
+    '''
+    def __init__(self, size: int2d, fps: float = 0) -> None:
+        self.__size = (int(size[0]), int(size[1]))
+        self.__interval = 1 / fps if fps > 0 else 0
+        self.__manual = fps <= 0
+        self.__next: float = 0
+        self.__frames = threading.Semaphore(0)
+        self.__closed = threading.Event()
+        self.__frameCount: int = 0
+        self.__allocations: int = 0
+
+    @property
+    def frameCount(self) -> int:
+        return self.__frameCount
+
+    @property
+    def allocations(self) -> int:
+        '''
+        Return:
+            Number of calls to get_image without a destination surface
+        '''
+        return self.__allocations
+
+    def advance(self, count: int = 1) -> None:
+        self.__frames.release(count)
+
+    def close(self) -> None:
+        '''
+        Stops blocking, so the capture thread can be joined
+        '''
+        self.__closed.set()
+        self.__frames.release()
+
+    def start(self) -> None:
+        self.__next = time.perf_counter()
+
+    def stop(self) -> None:
+        pass
+
+    def set_controls(self, hflip: bool = False, vflip: bool = False) -> None:
+        pass
+
+    def get_size(self) -> int2d:
+        return self.__size
+
+    def get_image(self, surface: Optional[pygame.Surface] = None) -> pygame.Surface:
+        # The first frame is captured by the constructor of CameraCapture
+        if self.__frameCount > 0 and not self.__closed.is_set():
+            if self.__manual:
+                self.__frames.acquire()
+            else:
+                delay = self.__next - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                self.__next = max(self.__next + self.__interval, time.perf_counter())
+
+        if surface is None:
+            surface = pygame.Surface(self.__size)
+            self.__allocations += 1
+        n = self.__frameCount
+        surface.fill((n % 256, n // 256, 0))
+        self.__frameCount += 1
+        return surface
+
+def frameOf(surface: pygame.Surface) -> int:
+    color = surface.get_at((0, 0))
+    return color.r + color.g * 256
+
+def waitFor(condition, timeout: float = 2) -> None:
+    end = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < end, 'timed out'
+        time.sleep(0.001)
+
+@pytest.fixture
+def fake():
+    backend = FakeCameraBackend((8, 8))
+    yield backend
+    backend.close()
+
+@pytest.fixture
+def capture(fake):
+    camera = CameraCapture((0, 0), (8, 8), None, threaded=True, bufferSize=3, backend=fake)
+    yield camera
+    fake.close()
+    camera.stop()
+
+def test_image_is_latest_frame(fake, capture):
+    assert frameOf(capture.image) == 0
+
+    fake.advance(5)
+    waitFor(lambda: capture.capturedFrames == 6)
+    assert frameOf(capture.image) == 5
+
+def test_unread_frames_are_dropped(fake, capture):
+    # Frames 0 to 3 are replaced before they are drawn
+    fake.advance(4)
+    waitFor(lambda: capture.capturedFrames == 5)
+    assert capture.droppedFrames == 4
+    assert capture.isDirty
+
+    # Drawn by a retained surface
+    capture.image
+    capture.clearDirty()
+    assert not capture.isDirty
+    fake.advance()
+    waitFor(lambda: capture.capturedFrames == 6)
+    # The frame after a drawn frame is not dropped
+    assert capture.droppedFrames == 4
+
+def test_buffers_are_reused(fake, capture):
+    surfaces = set()
+    for i in range(1, 20):
+        fake.advance()
+        waitFor(lambda: capture.capturedFrames == i + 1)
+        surfaces.add(id(capture.image))
+
+    assert len(surfaces) <= 3
+    assert fake.allocations == 1
+
+def test_frame_being_drawn_is_not_overwritten(fake, capture):
+    fake.advance()
+    waitFor(lambda: capture.capturedFrames == 2)
+    image = capture.image
+
+    # More frames than the other buffers, which all have to avoid the one being drawn
+    fake.advance(10)
+    waitFor(lambda: capture.capturedFrames == 12)
+    assert frameOf(image) == 1
+    assert frameOf(capture.image) == 11
+
+def test_capture_fps():
+    backend = FakeCameraBackend((8, 8), fps=100)
+    camera = CameraCapture((0, 0), (8, 8), None, threaded=True, backend=backend)
+    try:
+        waitFor(lambda: camera.capturedFrames > 30)
+        assert 50 < camera.captureFps < 150
+    finally:
+        backend.close()
+        camera.stop()
+
+def test_unthreaded_capture_reuses_buffer():
+    backend = FakeCameraBackend((8, 8), fps=1000)
+    camera = CameraCapture((0, 0), (8, 8), None, backend=backend)
+    first = camera.image
+    assert camera.image is first
+    assert frameOf(first) == 1
+    assert camera.capturedFrames == 2
+    assert backend.allocations == 1
+    assert not camera.threaded
+    camera.stop()
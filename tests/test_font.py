@@ -0,0 +1,35 @@
+import pygame
+import pytest
+
+from ..utils.color import COLORS
+from ..utils.font import GlyphAtlas
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    yield
+    pygame.quit()
+
+TEXTS = (
+    '0123456789' * 4,
+    'The quick brown fox jumps over the lazy',
+    'AVAWAVAT Tyyyy 11111',
+    # Precomposed syllables, drawn with the fallback glyph when the font has none
+    '한글 입력기는 조합형입니다',
+)
+
+@pytest.mark.parametrize('size', (16, 24, 40))
+@pytest.mark.parametrize('text', TEXTS)
+def test_layout_matches_font_size(size, text):
+    font = pygame.font.Font(None, size)
+    blits, textSize = GlyphAtlas(font, True, COLORS.BLACK).layout(text)
+    assert textSize[0] == font.size(text)[0]
+
+    # Rounded pair advances put glyphs a few pixels off at most, the error must not add up along the text
+    for i, (_, (x, _), _) in enumerate(blits):
+        offset = min(font.metrics(text[i])[0][0], 0)
+        assert abs(x - offset - font.size(text[:i])[0]) <= 3
+
+def test_empty_layout():
+    font = pygame.font.Font(None, 24)
+    assert GlyphAtlas(font, True, COLORS.BLACK).layout('') == ([], (0, font.get_height()))
@@ -0,0 +1,107 @@
+from typing import List, Tuple
+
+import pytest
+
+from ..utils.language import Hangul, HangulComposer, Language, LanguageState
+
+# (keys, text, length of the last character in keys)
+CORPUS: List[Tuple[str, str, int]] = [
+    ('', '', 0),
+    ('r', 'ㄱ', 1),
+    ('k', 'ㅏ', 1),
+    ('hk', 'ㅘ', 2),
+    ('rk', '가', 2),
+    ('Rk', '까', 2),
+    ('Tkd', '쌍', 3),
+    ('GKS', '한', 3),
+    ('rt', 'ㄱㅅ', 1),
+    ('rkt', '갓', 3),
+    ('rkrt', '갃', 4),
+    ('rkrtk', '각사', 2),
+    ('dhk', '와', 3),
+    ('dhkd', '왕', 4),
+    ('dml', '의', 3),
+    ('gksrmf', '한글', 3),
+    ('dkssud', '안녕', 3),
+    ('dkssudgktpdy', '안녕하세요', 2),
+    ('tjdnf', '서울', 3),
+    ('wnsql', '준비', 2),
+    ('ahadl', '몸이', 2),
+    ('dlfrrl', '읽기', 2),
+    ('dkfx', '앑', 4),
+    ('dkfxk', '알타', 2),
+    ('qkfqk', '발바', 2),
+    ('kkk', 'ㅏㅏㅏ', 1),
+    ('rk ek', '가 다', 2),
+    ('gks123', '한123', 1),
+]
+
+# (keys, number of pops, text)
+POP_CORPUS: List[Tuple[str, int, str]] = [
+    ('gksrmf', 1, '한그'),
+    ('gksrmf', 3, '한'),
+    ('gksr', 1, '한'),
+    ('rkrtk', 1, '갃'),
+    ('rkrtk', 2, '각'),
+    ('dkssud', 6, ''),
+    ('dkssud', 10, ''),
+]
+
+# (keys, number of popChar, text)
+POP_CHAR_CORPUS: List[Tuple[str, int, str]] = [
+    ('gksrmf', 1, '한'),
+    ('dkssud', 1, '안'),
+    ('rkrtk', 1, '각'),
+    ('dkssudgktpdy', 3, '안녕'),
+    ('gks123', 2, '한1'),
+    ('dkssud', 3, ''),
+]
+
+def compose(keys: str) -> HangulComposer:
+    composer = HangulComposer()
+    for key in keys:
+        composer.push(key)
+    return composer
+
+@pytest.mark.parametrize('keys, text, length', CORPUS)
+def test_compose(keys: str, text: str, length: int):
+    composer = compose(keys)
+    assert (composer.text, composer.lengthOfLastChar) == (text, length)
+    assert Hangul.combineIntoHangul(keys) == text
+    assert Hangul.getLengthOfLastChar(keys) == length
+
+@pytest.mark.parametrize('keys, count, text', POP_CORPUS)
+def test_pop(keys: str, count: int, text: str):
+    composer = compose(keys)
+    for _ in range(count):
+        composer.pop()
+    assert composer.text == text
+
+@pytest.mark.parametrize('keys, count, text', POP_CHAR_CORPUS)
+def test_pop_char(keys: str, count: int, text: str):
+    composer = compose(keys)
+    for _ in range(count):
+        composer.popChar()
+    assert composer.text == text
+
+def test_undo_passes_through_every_state():
+    keys = ''.join(k for k, _, _ in CORPUS)
+    composer = compose(keys)
+    for i in range(len(keys), 0, -1):
+        assert composer.text == Hangul.combineIntoHangul(keys[:i]), f'undo at {i}'
+        composer.pop()
+    assert composer.text == ''
+
+def test_change_language_notifies_listeners():
+    states = []
+    before = Language.getLanguageState()
+    Language.addEventListener(states.append)
+    try:
+        Language.changeLanguage()
+        Language.changeLanguage()
+    finally:
+        Language.removeEventListener(states.append)
+
+    other = LanguageState.KOREAN if before == LanguageState.ENGLISH else LanguageState.ENGLISH
+    assert states == [other, before]
+    assert Language.getLanguageState() == before
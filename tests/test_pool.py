@@ -0,0 +1,63 @@
+import gc
+
+import pygame
+import pytest
+
+from ..components.Surface import Container, ScrollBox, ScrollBoxStyle, TextLayoutSource
+from ..utils.app import renewFramerate
+from ..utils.color import COLORS
+from ..utils.pool import SurfacePool, getSurfacePool
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    getSurfacePool().clear()
+    yield
+    getSurfacePool().clear()
+    pygame.quit()
+
+def test_released_surface_is_reused():
+    pool = SurfacePool()
+    surface = pool.acquire((10, 10))
+    assert pool.owns(surface)
+    assert pool.release(surface)
+    assert not pool.release(surface)
+    assert pool.acquire((10, 10)) is surface
+    assert pool.stats.hits == 1
+
+def test_foreign_surface_is_ignored():
+    pool = SurfacePool()
+    assert not pool.release(pygame.Surface((10, 10)))
+    assert pool.stats.numOfFree == 0
+
+def test_dropped_surface_is_not_kept():
+    pool = SurfacePool()
+    pool.acquire((10, 10))
+    gc.collect()
+    assert pool.stats.numOfInUse == 0
+
+def test_dropped_scroll_boxes_leave_nothing_in_use():
+    renewFramerate(60)
+    font = pygame.font.Font(None, 20)
+    text = '\n'.join(f'line {i}' for i in range(200))
+    window = Container((0, 0), (400, 400))
+    boxes = []
+    for _ in range(20):
+        source = TextLayoutSource(text, font, COLORS.BLACK, 300, COLORS.WHITE)
+        boxes.append(ScrollBox((0, 0), (305, 300), ScrollBoxStyle(elementHeight=source.lineHeight), source=source))
+
+    for box in boxes:
+        window.drawScrollBox(box)
+    window.render()
+    window.tick()
+    assert getSurfacePool().stats.numOfInUse > 0
+
+    del box, boxes
+    gc.collect()
+    assert getSurfacePool().stats.numOfInUse == 0
+
+def test_render_does_not_use_the_pool():
+    box = ScrollBox((0, 0), (100, 100), ScrollBoxStyle(elementHeight=10), contents=[Container((0, 0), (95, 10)) for _ in range(20)])
+    assert not getSurfacePool().owns(box.render().getPygameSurface())
+    assert getSurfacePool().owns(box.render(pooled=True).getPygameSurface())
@@ -0,0 +1,46 @@
+import time
+
+import pytest
+
+from ..utils.scheduler import Scheduler
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, 'perf_counter', lambda: now[0])
+    return now
+
+def test_missed_calls_are_made_up(clock):
+    scheduler = Scheduler()
+    calls = []
+    scheduler.callRepeating(0.01, lambda: calls.append(clock[0]), 0)
+
+    clock[0] += 2
+    assert scheduler.run() == 201
+
+def test_missed_calls_are_skipped(clock):
+    scheduler = Scheduler()
+    calls = []
+    scheduler.callRepeating(0.01, lambda: calls.append(clock[0]), 0, skipMissed=True)
+
+    # A 2 s stall calls it once, then the rate is kept from there
+    clock[0] += 2
+    assert scheduler.run() == 1
+    assert scheduler.run() == 0
+    clock[0] += 0.01
+    assert scheduler.run() == 1
+    clock[0] += 0.005
+    assert scheduler.run() == 0
+
+def test_call_later_is_called_once(clock):
+    scheduler = Scheduler()
+    calls = []
+    call = scheduler.callLater(0.3, lambda: calls.append(clock[0]))
+
+    clock[0] += 0.2
+    assert scheduler.run() == 0
+    clock[0] += 1
+    assert scheduler.run() == 1
+    assert scheduler.run() == 0
+    assert not call.isActive
+    assert len(scheduler) == 0
@@ -0,0 +1,118 @@
+import pygame
+import pytest
+
+from ..components.Button import Button, ButtonStyle
+from ..components.Surface import Container
+from ..components.TextBox import TextBox, TextBoxStyle
+from ..components.CameraCapture import CameraCapture
+from ..utils.color import COLORS
+from ..utils.pool import getSurfacePool
+from .test_camera import FakeCameraBackend, frameOf
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+def colorAt(surface: Container, pos) -> tuple:
+    return tuple(surface.getPygameSurface().get_at(pos))
+
+def test_container_changed_after_draw():
+    window = Container((0, 0), (20, 20))
+    c = Container((5, 5), (5, 5))
+    c.fill(COLORS.BLUE)
+    window.drawContainer(c)
+
+    c.fill(COLORS.RED)
+    assert colorAt(window, (6, 6)) == COLORS.BLUE.rgba
+
+def test_container_surface_handed_out_after_draw():
+    window = Container((0, 0), (20, 20))
+    c = Container((5, 5), (5, 5))
+    c.fill(COLORS.BLUE)
+    window.drawContainer(c)
+
+    c.getPygameSurface().fill(COLORS.RED.rgba)
+    assert colorAt(window, (6, 6)) == COLORS.BLUE.rgba
+
+def test_container_drawn_twice():
+    window = Container((0, 0), (20, 20))
+    c = Container((0, 0), (5, 5))
+    c.fill(COLORS.BLUE)
+    window.drawContainer(c)
+
+    c.pos = (10, 10)
+    c.fill(COLORS.RED)
+    window.drawContainer(c)
+    assert colorAt(window, (1, 1)) == COLORS.BLUE.rgba
+    assert colorAt(window, (11, 11)) == COLORS.RED.rgba
+
+def test_nested_containers():
+    window = Container((0, 0), (20, 20))
+    parent = Container((0, 0), (10, 10))
+    child = Container((0, 0), (5, 5))
+    child.fill(COLORS.BLUE)
+    parent.drawContainer(child)
+    window.drawContainer(parent)
+
+    # Changing the child submits the parent first, which has to submit the window before it changes
+    child.fill(COLORS.RED)
+    parent.fill(COLORS.GREEN)
+    assert colorAt(window, (1, 1)) == COLORS.BLUE.rgba
+
+def test_camera_drawn_twice_in_a_frame():
+    window = Container((0, 0), (20, 20))
+    camera = CameraCapture((0, 0), (5, 5), None, backend=FakeCameraBackend((5, 5), fps=1000))
+    window.drawCameraCapture(camera)
+    camera.pos = (10, 10)
+    window.drawCameraCapture(camera)
+
+    surface = window.getPygameSurface()
+    assert frameOf(surface.subsurface((0, 0, 5, 5))) == 0
+    assert frameOf(surface.subsurface((10, 10, 5, 5))) == 1
+    camera.stop()
+
+def test_antialiased_line_outside_the_clip_is_cleared():
+    c = Container((0, 0), (200, 200))
+    c.getPygameSurface().set_clip(pygame.Rect(0, 0, 100, 100))
+    # Clipped partly, then entirely
+    c.drawAntialiasedLine(COLORS.RED, (0, 0), (199, 199))
+    c.drawAntialiasedLine(COLORS.RED, (150, 110), (190, 190))
+
+    layer = getSurfacePool().getScratchLayer((200, 200))
+    assert pygame.mask.from_surface(layer, 0).count() == 0
+    assert colorAt(c, (50, 50))[:3] != (0, 0, 0)
+    assert colorAt(c, (150, 150)) == (0, 0, 0, 255)
+
+def test_scratch_layer_shared_with_a_clipped_surface():
+    clipped = Container((0, 0), (200, 200))
+    clipped.getPygameSurface().set_clip(pygame.Rect(0, 0, 100, 100))
+    clipped.drawAntialiasedLine(COLORS.RED, (0, 0), (199, 199))
+
+    # Same size, so the same scratch layer, but nothing red is drawn on it
+    other = Container((0, 0), (200, 200))
+    other.drawAntialiasedLine(COLORS.BLUE, (0, 199), (199, 0))
+    other.drawRects([(140, 140, 20, 20)], [(0, 255, 0, 128)])
+    surface = other.getPygameSurface()
+    assert all(surface.get_at((x, x)).r == 0 for x in range(200))
+
+def test_hovered_text_box_keeps_one_image():
+    font = pygame.font.Font(None, 20)
+    window = Container((0, 0), (100, 100))
+    textBox = TextBox((10, 10), (80, 30), TextBoxStyle(font, COLORS.BLACK, COLORS.WHITE), 'cell')
+    window.drawTextBox(textBox)
+    size = textBox.renderCacheBytes
+
+    textBox.onMouseEnter(None)
+    window.drawTextBox(textBox)
+    assert textBox.renderCacheBytes == size
+
+    # Buttons are drawn in their hover colors, so they keep an image for each state
+    button = Button((10, 50), (80, 30), ButtonStyle(font, backgroundHoverColor=COLORS.RED), 'cell')
+    window.drawButton(button)
+    size = button.renderCacheBytes
+    button.onMouseEnter(None)
+    window.drawButton(button)
+    assert button.renderCacheBytes == size * 2
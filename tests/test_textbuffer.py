@@ -0,0 +1,97 @@
+import random
+
+import pygame
+import pytest
+
+from ..components.TextInput import TextInput, TextInputStyle
+from ..utils.textbuffer import TextBuffer
+
+class Model:
+    '''
+    Plain string with a cursor, which a TextBuffer has to match after every edit
+    '''
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.cursor = len(text)
+
+    def moveCursor(self, delta: int) -> int:
+        moved = max(-self.cursor, min(delta, len(self.text) - self.cursor))
+        self.cursor += moved
+        return moved
+
+    def insert(self, text: str) -> None:
+        self.text = self.text[:self.cursor] + text + self.text[self.cursor:]
+        self.cursor += len(text)
+
+    def delete(self, count: int) -> int:
+        n = min(count, self.cursor)
+        self.text = self.text[:self.cursor - n] + self.text[self.cursor:]
+        self.cursor -= n
+        return n
+
+    def deleteForward(self, count: int) -> int:
+        n = min(count, len(self.text) - self.cursor)
+        self.text = self.text[:self.cursor] + self.text[self.cursor + n:]
+        return n
+
+def assertSame(buffer: TextBuffer, model: Model) -> None:
+    assert buffer.text == model.text
+    assert buffer.cursor == model.cursor
+    assert len(buffer) == len(model.text)
+
+    chunks = buffer.chunks
+    assert ''.join(chunks) == model.text
+    assert all(0 < len(chunk) <= buffer.CHUNK_SIZE for chunk in chunks) or chunks == ['']
+    index, offset = buffer.cursorChunk
+    assert 0 <= offset <= len(chunks[index])
+    assert sum(len(chunk) for chunk in chunks[:index]) + offset == model.cursor
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_edits_match_a_string(monkeypatch, seed):
+    # Small chunks, so chunks are split and merged many times
+    monkeypatch.setattr(TextBuffer, 'CHUNK_SIZE', 8)
+    rng = random.Random(seed)
+    start = ''.join(rng.choice('abc한글') for _ in range(rng.randint(0, 40)))
+    buffer = TextBuffer(start)
+    model = Model(start)
+
+    for _ in range(500):
+        op = rng.random()
+        if op < 0.35:
+            text = ''.join(rng.choice('abc한글 ') for _ in range(rng.choice((1, 1, 2, 5, 20))))
+            buffer.insert(text)
+            model.insert(text)
+        elif op < 0.55:
+            count = rng.choice((1, 1, 3, 30))
+            assert buffer.delete(count) == model.delete(count)
+        elif op < 0.7:
+            count = rng.choice((1, 3, 30))
+            assert buffer.deleteForward(count) == model.deleteForward(count)
+        elif op < 0.97:
+            delta = rng.randint(-20, 20)
+            assert buffer.moveCursor(delta) == model.moveCursor(delta)
+        else:
+            text = ''.join(rng.choice('xyz') for _ in range(rng.randint(0, 30)))
+            buffer.text = text
+            model = Model(text)
+        assertSame(buffer, model)
+
+def test_delete_everything(monkeypatch):
+    monkeypatch.setattr(TextBuffer, 'CHUNK_SIZE', 8)
+    buffer = TextBuffer('x' * 50)
+    buffer.cursor = 20
+    assert buffer.deleteForward(100) == 30
+    assert buffer.delete(100) == 20
+    assertSame(buffer, Model(''))
+
+def test_cursor_offset_follows_the_cursor():
+    pygame.init()
+    font = pygame.font.Font(None, 20)
+    text = 'hello world ' * 20
+    textInput = TextInput((0, 0), (200, 30), TextInputStyle(font), text)
+
+    for cursor in (0, 5, 63, 64, 65, 130, len(text)):
+        textInput.cursor = cursor
+        # Glyphs are not kerned across chunks
+        assert abs(textInput.getCursorOffset() - font.size(text[:cursor])[0]) <= 2
+    pygame.quit()
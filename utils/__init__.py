@@ -6,4 +6,11 @@ from .font import *
 from .event import *
 from .color import *
 from .position import *
-from .style import *
\ No newline at end of file
+from .style import *
+from .grid import *
+from .profiler import *
+from .image import *
+from .scheduler import *
+from .textbuffer import *
+from .textlayout import *
+from .pool import *
\ No newline at end of file
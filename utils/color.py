@@ -1,34 +1,74 @@
 from __future__ import annotations
-from typing import Union, Tuple
+from typing import Dict, Union, Tuple
 
 __all__ = ['ColorLike', 'Color', 'COLORS']
 
 ColorLike = Union[Tuple[int, int, int], Tuple[int, int, int, int], str]
+
 class Color:
-    def __init__(self, color: ColorLike) -> None:
+    '''
+    Colors are immutable and compare and hash by their rgba, so they can be used as cache keys.\n
+    Constructing a Color from a tuple or a hex string which has been used before returns the same object
+    without parsing it again.
+    '''
+    __slots__ = ('__rgba', '__hash')
+
+    MAX_INTERNED = 4096
+    # Tuples and hex strings -> the Color constructed from them
+    __interned: Dict[ColorLike, Color] = {}
+
+    def __new__(cls, color: ColorLike) -> Color:
+        interned = Color.__interned
+        try:
+            self = interned.get(color)
+        except TypeError:
+            self = None
+        if self is not None:
+            return self
+
         if type(color) is tuple:
-            self.__r = color[0]
-            self.__g = color[1]
-            self.__b = color[2]
-            if len(color) < 4: self.__a = 255
-            elif 0 < color[3] < 1:
-                self.__a = int(255 * color[3])
-            else:
-                self.__a = color[3]
+            rgba = color if len(color) >= 4 else (color[0], color[1], color[2], 255)
         elif type(color) is str:
-            rgba = self.HEXToRGBA(color)
-            self.__r = rgba[0]
-            self.__g = rgba[1]
-            self.__b = rgba[2]
+            rgba = cls.HEXToRGBA(color)
+        else:
+            raise TypeError(f"'{color}' is not a tuple or a hex string.")
+
+        a = rgba[3]
+        if 0 < a < 1:
+            a = int(255 * a)
+        rgba = (rgba[0], rgba[1], rgba[2], a)
+
+        # Equal colors given in another form share the same object
+        self = interned.get(rgba)
+        if self is None:
+            self = super().__new__(cls)
+            self.__rgba = rgba
+            self.__hash = hash(rgba)
+        # Past the limit colors are still constructed, just not kept
+        if len(interned) < cls.MAX_INTERNED:
+            interned[rgba] = self
+            interned[color] = self
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
+        if type(other) is not Color:
+            return NotImplemented
+        return self.__rgba == other.__rgba
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __repr__(self) -> str:
+        return f'Color({self.__rgba})'
 
-            if 0 < rgba[3] < 1:
-                self.__a = int(255 * rgba[3])
-            else:
-                self.__a = rgba[3]
+    def __reduce__(self):
+        return (Color, (self.__rgba,))
 
     @property
     def rgba(self) -> Tuple[int, int, int, int]:
-        return (self.__r, self.__g, self.__b, self.__a)
+        return self.__rgba
     
     @property
     def hex(self) -> str:
@@ -55,52 +95,22 @@ class Color:
         return '#' + code
 
 class _COLORS:
-    @property
-    def BLACK(self):
-        return Color((0, 0, 0))
-    
-    @property
-    def WHITE(self):
-        return Color((255, 255, 255))
-    
-    @property
-    def RED(self):
-        return Color((255, 0, 0))
-    
-    @property
-    def ORANGE(self):
-        return Color((255, 128, 0))
-    
-    @property
-    def YELLOW(self):
-        return Color((255, 255, 0))
-    
-    @property
-    def GREEN(self):
-        return Color((0, 255, 0))
-    
-    @property
-    def SKYBLUE(self):
-        return Color((0, 128, 255))
-    
-    @property
-    def BLUE(self):
-        return Color((0, 0, 255))
-    
-    @property
-    def PURPLE(self):
-        return Color((127, 0, 255))
-    
-    @property
-    def PINK(self):
-        return Color((255, 0, 255))
-    
-    @property
-    def HOTPINK(self):
-        return Color((255, 0, 127))
-    
-    @property
-    def GRAY(self):
-        return Color((128, 128, 128))
-    
+    '''
+    Named colors, every access returns the same Color.
+    '''
+    __slots__ = ()
+
+    BLACK = Color((0, 0, 0))
+    WHITE = Color((255, 255, 255))
+    RED = Color((255, 0, 0))
+    ORANGE = Color((255, 128, 0))
+    YELLOW = Color((255, 255, 0))
+    GREEN = Color((0, 255, 0))
+    SKYBLUE = Color((0, 128, 255))
+    BLUE = Color((0, 0, 255))
+    PURPLE = Color((127, 0, 255))
+    PINK = Color((255, 0, 255))
+    HOTPINK = Color((255, 0, 127))
+    GRAY = Color((128, 128, 128))
+
 COLORS = _COLORS()
\ No newline at end of file
@@ -1,12 +1,25 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 
 import pygame
 
+from .color import Color
+from .profiler import countSurfaceAllocation
+
 Font = pygame.font.Font
 
 __fontStorage: Dict[str, Font] = {}
 
-__all__ = ['Font', 'loadSystemFont', 'loadFont', 'getFont']
+__textCache: 'OrderedDict[Tuple[Font, str, bool, Color], pygame.Surface]' = OrderedDict()
+__textCacheBudget: int = 32 * 1024 * 1024
+__textCacheBytes: int = 0
+__textCacheHits: int = 0
+__textCacheMisses: int = 0
+
+__glyphAtlases: 'OrderedDict[Tuple[Font, bool, Color], GlyphAtlas]' = OrderedDict()
+__glyphAtlasCacheSize: int = 32
+
+__all__ = ['Font', 'loadSystemFont', 'loadFont', 'addFont', 'getFont', 'renderText', 'TextCacheStats', 'getTextCacheStats', 'setTextCacheBudget', 'clearTextCache', 'GlyphAtlas', 'getGlyphAtlas', 'setGlyphAtlasCacheSize', 'clearGlyphAtlases']
 
 def loadSystemFont(name: str, size: int, bold: bool = False, italic: bool = False, regName: Optional[str] = None) -> Font:
     '''
@@ -30,5 +43,216 @@ def loadFont(path: str, size: int, regName: Optional[str] = None) -> Font:
 
     return font
 
+def addFont(font: Font, regName: str) -> Font:
+    '''
+    Stores a font created elsewhere, such as by a Preloader
+    '''
+    __fontStorage[regName] = font
+    return font
+
 def getFont(regName: str) -> Optional[pygame.font.Font]:
     return __fontStorage[regName] if regName in __fontStorage else None
+
+class TextCacheStats:
+    hits: int
+    misses: int
+    bytes: int
+    budget: int
+    numOfEntries: int
+
+    def __init__(self, hits: int, misses: int, bytes: int, budget: int, numOfEntries: int) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.bytes = bytes
+        self.budget = budget
+        self.numOfEntries = numOfEntries
+
+    @property
+    def hitRate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0
+
+def renderText(font: Font, text: str, antialias: bool, color: Color) -> pygame.Surface:
+    '''
+    Renders text with the alpha of color applied.\n
+    Results are cached by (font, text, antialias, color) until the cache exceeds its budget,
+    so the returned surface must not be modified.
+    '''
+    global __textCacheBytes, __textCacheHits, __textCacheMisses
+
+    key = (font, text, antialias, color)
+    image = __textCache.get(key)
+    if image is not None:
+        __textCache.move_to_end(key)
+        __textCacheHits += 1
+        return image
+
+    __textCacheMisses += 1
+    rgba = color.rgba
+    image = font.render(text, antialias, rgba)
+    image.set_alpha(rgba[3])
+    countSurfaceAllocation()
+
+    size = image.get_pitch() * image.get_height()
+    if size <= __textCacheBudget:
+        __textCache[key] = image
+        __textCacheBytes += size
+        while __textCacheBytes > __textCacheBudget:
+            _, old = __textCache.popitem(last=False)
+            __textCacheBytes -= old.get_pitch() * old.get_height()
+
+    return image
+
+def getTextCacheStats() -> TextCacheStats:
+    return TextCacheStats(__textCacheHits, __textCacheMisses, __textCacheBytes, __textCacheBudget, len(__textCache))
+
+def setTextCacheBudget(budget: int) -> None:
+    '''
+    budget in bytes, 0 disables the cache
+    '''
+    global __textCacheBudget, __textCacheBytes
+    __textCacheBudget = budget
+    while __textCacheBytes > __textCacheBudget:
+        _, old = __textCache.popitem(last=False)
+        __textCacheBytes -= old.get_pitch() * old.get_height()
+
+def clearTextCache() -> None:
+    global __textCacheBytes, __textCacheHits, __textCacheMisses
+    __textCache.clear()
+    __textCacheBytes = 0
+    __textCacheHits = 0
+    __textCacheMisses = 0
+
+class GlyphAtlas:
+    '''
+    Glyphs of a font rendered once in a single color and packed into atlas pages.\n
+    Text is laid out glyph by glyph using the advances of glyph pairs, which include kerning,
+    and scaled to the width of font.size, since the font positions glyphs at fractional pixels.
+    '''
+    PAGE_SIZE = 1024
+
+    def __init__(self, font: Font, antialias: bool, color: Color) -> None:
+        self.__font = font
+        self.__antialias = antialias
+        self.__rgba = color.rgba
+        self.__lineHeight = font.get_height()
+        self.__pages: List[pygame.Surface] = []
+        self.__cursor: Tuple[int, int] = (0, 0)
+        # char -> (page, area in page, x offset, advance)
+        self.__glyphs: Dict[str, Tuple[pygame.Surface, pygame.Rect, int, int]] = {}
+        # char + next char -> advance of char
+        self.__steps: Dict[str, int] = {}
+
+    @property
+    def numOfGlyphs(self) -> int:
+        return len(self.__glyphs)
+
+    @property
+    def bytes(self) -> int:
+        return sum(page.get_pitch() * page.get_height() for page in self.__pages)
+
+    def __newPage(self, width: int) -> pygame.Surface:
+        rows = max(self.PAGE_SIZE // self.__lineHeight, 1)
+        page = pygame.Surface((max(width, self.PAGE_SIZE), rows * self.__lineHeight), pygame.SRCALPHA)
+        page.set_alpha(self.__rgba[3])
+        countSurfaceAllocation()
+        self.__pages.append(page)
+        self.__cursor = (0, 0)
+        return page
+
+    def __addGlyph(self, char: str) -> Tuple[pygame.Surface, pygame.Rect, int, int]:
+        image = self.__font.render(char, self.__antialias, self.__rgba)
+        w, h = image.get_size()
+
+        metrics = self.__font.metrics(char)
+        if len(metrics) > 0 and metrics[0] is not None:
+            offset = min(metrics[0][0], 0)
+            advance = metrics[0][4]
+        else:
+            offset = 0
+            advance = w
+
+        x, y = self.__cursor
+        page = self.__pages[-1] if len(self.__pages) > 0 else None
+        if page is not None and x + w > page.get_width():
+            x, y = 0, y + self.__lineHeight
+        if page is None or y + h > page.get_height():
+            page = self.__newPage(w)
+            x, y = 0, 0
+
+        # Glyphs are copied as they are instead of being blended onto the empty page
+        page.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX if self.__antialias else 0)
+        self.__cursor = (x + w, y)
+
+        glyph = (page, pygame.Rect(x, y, w, h), offset, advance)
+        self.__glyphs[char] = glyph
+        return glyph
+
+    def __addStep(self, pair: str) -> int:
+        size = self.__font.size
+        step = size(pair)[0] - size(pair[1])[0]
+        self.__steps[pair] = step
+        return step
+
+    def layout(self, text: str) -> Tuple[List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]], Tuple[int, int]]:
+        '''
+        Return:
+            Blit sequence placing every glyph relative to (0, 0), and the size of the whole text
+        '''
+        placed = []
+        x = 0
+        advance = 0
+        prev = None
+        glyphs = self.__glyphs
+        steps = self.__steps
+        for char in text:
+            glyph = glyphs.get(char)
+            if glyph is None:
+                glyph = self.__addGlyph(char)
+            if prev is not None:
+                pair = prev + char
+                step = steps.get(pair)
+                x += step if step is not None else self.__addStep(pair)
+            placed.append((glyph, x))
+            advance = glyph[3]
+            prev = char
+
+        # Pair advances are rounded, so the error is spread over the text instead of piling up at its end
+        width = self.__font.size(text)[0] if len(text) > 0 else 0
+        scale = width / (x + advance) if x + advance > 0 else 0
+        blits = []
+        for (page, area, offset, _), x in placed:
+            if area.width > 0:
+                blits.append((page, (int(x * scale + 0.5) + offset, 0), area))
+
+        return blits, (width, self.__lineHeight)
+
+def getGlyphAtlas(font: Font, antialias: bool, color: Color) -> GlyphAtlas:
+    '''
+    Atlases are kept for the most recently used (font, antialias, color) only,
+    so a text in ever changing colors does not keep a page per color.
+    '''
+    key = (font, antialias, color)
+    atlas = __glyphAtlases.get(key)
+    if atlas is not None:
+        __glyphAtlases.move_to_end(key)
+        return atlas
+
+    atlas = GlyphAtlas(font, antialias, color)
+    if __glyphAtlasCacheSize > 0:
+        __glyphAtlases[key] = atlas
+        while len(__glyphAtlases) > __glyphAtlasCacheSize:
+            __glyphAtlases.popitem(last=False)
+    return atlas
+
+def setGlyphAtlasCacheSize(size: int) -> None:
+    '''
+    size in number of atlases, 0 disables the cache
+    '''
+    global __glyphAtlasCacheSize
+    __glyphAtlasCacheSize = size
+    while len(__glyphAtlases) > __glyphAtlasCacheSize:
+        __glyphAtlases.popitem(last=False)
+
+def clearGlyphAtlases() -> None:
+    __glyphAtlases.clear()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from typing import Dict, Generic, List, Tuple, TypeVar
+import math
+
+from .position import float2d
+
+__all__ = ['HitGrid']
+
+T = TypeVar('T')
+
+class HitGrid(Generic[T]):
+    '''
+    Uniform grid of buckets for looking up which areas contain a point.\n
+    Items are returned in the order they were inserted.
+    '''
+    def __init__(self, cellSize: int = 64) -> None:
+        self.__cellSize = cellSize
+        self.__cells: Dict[Tuple[int, int], List[T]] = {}
+        self.__count: int = 0
+
+    @property
+    def cellSize(self) -> int:
+        return self.__cellSize
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def clear(self) -> None:
+        self.__cells.clear()
+        self.__count = 0
+
+    def insert(self, item: T, pos: float2d, size: float2d) -> None:
+        c = self.__cellSize
+        left = math.floor(pos[0] / c)
+        top = math.floor(pos[1] / c)
+        right = math.floor((pos[0] + size[0]) / c)
+        bottom = math.floor((pos[1] + size[1]) / c)
+
+        cells = self.__cells
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = cells.get((x, y))
+                if cell is None:
+                    cells[(x, y)] = [item]
+                else:
+                    cell.append(item)
+        self.__count += 1
+
+    def query(self, pos: float2d) -> List[T]:
+        '''
+        Return:
+            Items whose area may contain pos, in insertion order
+        '''
+        c = self.__cellSize
+        return self.__cells.get((math.floor(pos[0] / c), math.floor(pos[1] / c)), [])
@@ -0,0 +1,145 @@
+from typing import Dict, Hashable, Set, Tuple
+from collections import OrderedDict
+
+import pygame
+
+from .position import int2d
+from .profiler import countSurfaceAllocation
+
+__imageStorage: Dict[str, pygame.Surface] = {}
+__unconverted: Set[str] = set()
+
+__variantCache: 'OrderedDict[Tuple[Hashable, Tuple[int, int]], pygame.Surface]' = OrderedDict()
+__variantCacheBudget: int = 64 * 1024 * 1024
+__variantCacheBytes: int = 0
+__variantCacheHits: int = 0
+__variantCacheMisses: int = 0
+
+__all__ = ['loadImage', 'addImage', 'convertImage', 'getScaledImage', 'ImageCacheStats', 'getImageCacheStats', 'setImageCacheBudget', 'clearImageCache', 'clearImages']
+
+def convertImage(image: pygame.Surface) -> pygame.Surface:
+    '''
+    Return:
+        image in the pixel format of the display, which blits several times faster.\n
+    image is returned as it is if the display mode has not been set yet.
+    '''
+    if pygame.display.get_surface() is None:
+        return image
+    if image.get_flags() & pygame.SRCALPHA or image.get_colorkey() is not None:
+        return image.convert_alpha()
+    return image.convert()
+
+def loadImage(path: str) -> pygame.Surface:
+    '''
+    Every path is loaded and converted once, the returned surface is shared and must not be modified.\n
+    Images loaded before the display mode is set are converted when they are requested again afterwards.
+    '''
+    image = __imageStorage.get(path)
+    if image is not None:
+        if path in __unconverted and pygame.display.get_surface() is not None:
+            image = __imageStorage[path] = convertImage(image)
+            __unconverted.discard(path)
+        return image
+
+    image = pygame.image.load(path)
+    countSurfaceAllocation()
+    if pygame.display.get_surface() is None:
+        __unconverted.add(path)
+    else:
+        image = convertImage(image)
+    __imageStorage[path] = image
+
+    return image
+
+def addImage(path: str, image: pygame.Surface) -> None:
+    '''
+    Stores an image decoded elsewhere as if it had been loaded from path.
+    '''
+    __imageStorage[path] = image
+    if pygame.display.get_surface() is None:
+        __unconverted.add(path)
+    else:
+        __unconverted.discard(path)
+
+def getScaledImage(key: Hashable, image: pygame.Surface, size: int2d) -> pygame.Surface:
+    '''
+    Parameter:
+        key: Identifies image, such as its path or the surface itself\n
+    Scaled variants are cached by (key, size) until the cache exceeds its budget,
+    so the returned surface must not be modified.
+    '''
+    global __variantCacheBytes, __variantCacheHits, __variantCacheMisses
+
+    size = (int(size[0]), int(size[1]))
+    if size == image.get_size():
+        return image
+
+    cacheKey = (key, size)
+    variant = __variantCache.get(cacheKey)
+    if variant is not None:
+        __variantCache.move_to_end(cacheKey)
+        __variantCacheHits += 1
+        return variant
+
+    __variantCacheMisses += 1
+    variant = pygame.transform.scale(image, size)
+    countSurfaceAllocation()
+
+    numOfBytes = variant.get_pitch() * variant.get_height()
+    if numOfBytes <= __variantCacheBudget:
+        __variantCache[cacheKey] = variant
+        __variantCacheBytes += numOfBytes
+        while __variantCacheBytes > __variantCacheBudget:
+            _, old = __variantCache.popitem(last=False)
+            __variantCacheBytes -= old.get_pitch() * old.get_height()
+
+    return variant
+
+class ImageCacheStats:
+    hits: int
+    misses: int
+    bytes: int
+    budget: int
+    numOfEntries: int
+    numOfImages: int
+
+    def __init__(self, hits: int, misses: int, bytes: int, budget: int, numOfEntries: int, numOfImages: int) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.bytes = bytes
+        self.budget = budget
+        self.numOfEntries = numOfEntries
+        self.numOfImages = numOfImages
+
+    @property
+    def hitRate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0
+
+def getImageCacheStats() -> ImageCacheStats:
+    return ImageCacheStats(__variantCacheHits, __variantCacheMisses, __variantCacheBytes, __variantCacheBudget, len(__variantCache), len(__imageStorage))
+
+def setImageCacheBudget(budget: int) -> None:
+    '''
+    budget in bytes for scaled variants, 0 disables the cache
+    '''
+    global __variantCacheBudget, __variantCacheBytes
+    __variantCacheBudget = budget
+    while __variantCacheBytes > __variantCacheBudget:
+        _, old = __variantCache.popitem(last=False)
+        __variantCacheBytes -= old.get_pitch() * old.get_height()
+
+def clearImageCache() -> None:
+    global __variantCacheBytes, __variantCacheHits, __variantCacheMisses
+    __variantCache.clear()
+    __variantCacheBytes = 0
+    __variantCacheHits = 0
+    __variantCacheMisses = 0
+
+def clearImages() -> None:
+    '''
+    Forgets every loaded image and scaled variant. Images which are still in use are not affected.
+    '''
+    __imageStorage.clear()
+    __unconverted.clear()
+    clearImageCache()
@@ -1,28 +1,181 @@
-import ctypes
-from typing import Callable, List
+from typing import Callable, Dict, List, Optional, Tuple
 from enum import Enum
-import os.path
 
-__all__ = ['Hangul', 'LanguageState', 'Language']
+__all__ = ['Hangul', 'HangulComposer', 'LanguageState', 'Language']
 
-__dllpath = os.path.sep.join([os.path.split(__file__)[0], '..', 'dll', 'Hangul.dll'])
-__hanguldll = ctypes.windll.LoadLibrary(__dllpath)
-__run = __hanguldll['run']
-__run.argtypes = (ctypes.c_wchar_p,)
-__run.restype = ctypes.c_wchar_p
-__getLength = __hanguldll['getLengthOfLastChar']
-__getLength.argtypes = (ctypes.c_wchar_p,)
-__getLength.restype = ctypes.c_int
+# Dubeolsik keyboard layout
+__keyToJamo: Dict[str, str] = {
+    'r': 'ㄱ', 'R': 'ㄲ', 's': 'ㄴ', 'e': 'ㄷ', 'E': 'ㄸ', 'f': 'ㄹ', 'a': 'ㅁ', 'q': 'ㅂ', 'Q': 'ㅃ', 't': 'ㅅ', 'T': 'ㅆ',
+    'd': 'ㅇ', 'w': 'ㅈ', 'W': 'ㅉ', 'c': 'ㅊ', 'z': 'ㅋ', 'x': 'ㅌ', 'v': 'ㅍ', 'g': 'ㅎ',
+    'k': 'ㅏ', 'o': 'ㅐ', 'O': 'ㅒ', 'i': 'ㅑ', 'j': 'ㅓ', 'p': 'ㅔ', 'P': 'ㅖ', 'u': 'ㅕ', 'h': 'ㅗ', 'y': 'ㅛ',
+    'n': 'ㅜ', 'b': 'ㅠ', 'm': 'ㅡ', 'l': 'ㅣ',
+}
+# Shifted keys without a doubled jamo type the same jamo
+for __key in list(__keyToJamo):
+    __keyToJamo.setdefault(__key.upper(), __keyToJamo[__key])
+del __key
+
+_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+_COMPOUND_VOWELS = {('ㅗ', 'ㅏ'): 'ㅘ', ('ㅗ', 'ㅐ'): 'ㅙ', ('ㅗ', 'ㅣ'): 'ㅚ', ('ㅜ', 'ㅓ'): 'ㅝ', ('ㅜ', 'ㅔ'): 'ㅞ', ('ㅜ', 'ㅣ'): 'ㅟ', ('ㅡ', 'ㅣ'): 'ㅢ'}
+_COMPOUND_FINALS = {('ㄱ', 'ㅅ'): 'ㄳ', ('ㄴ', 'ㅈ'): 'ㄵ', ('ㄴ', 'ㅎ'): 'ㄶ', ('ㄹ', 'ㄱ'): 'ㄺ', ('ㄹ', 'ㅁ'): 'ㄻ', ('ㄹ', 'ㅂ'): 'ㄼ',
+                    ('ㄹ', 'ㅅ'): 'ㄽ', ('ㄹ', 'ㅌ'): 'ㄾ', ('ㄹ', 'ㅍ'): 'ㄿ', ('ㄹ', 'ㅎ'): 'ㅀ', ('ㅂ', 'ㅅ'): 'ㅄ'}
+_SPLIT_FINALS = {v: k for k, v in _COMPOUND_FINALS.items()}
+
+# (choseong, jungseong, jongseong, number of keys)
+_Syllable = Tuple[Optional[str], Optional[str], Optional[str], int]
+_EMPTY: _Syllable = (None, None, None, 0)
+
+def _toJamo(key: str) -> Optional[str]:
+    return __keyToJamo.get(key)
+
+def _compose(syllable: _Syllable) -> str:
+    cho, jung, jong, _ = syllable
+    if cho is None:
+        return jung or ''
+    if jung is None:
+        return cho
+    return chr(0xAC00 + (_CHOSEONG.index(cho) * 21 + _JUNGSEONG.index(jung)) * 28 + _JONGSEONG.index(jong or ''))
+
+class HangulComposer:
+    '''
+    Composes keys typed on a dubeolsik keyboard into Hangul one key at a time.\n
+    Every key is handled in constant time and can be undone with pop, so the keys are never composed again from the start.
+    Keys which are not on the layout are passed through as they are.
+    '''
+    def __init__(self) -> None:
+        # Finished characters and the number of keys which made each of them
+        self.__committed: List[Tuple[str, int]] = []
+        self.__committedText: str = ''
+        self.__current: _Syllable = _EMPTY
+        # Per key, the state before it was pushed
+        self.__history: List[Tuple[int, _Syllable]] = []
+
+    @property
+    def text(self) -> str:
+        return self.__committedText + _compose(self.__current)
+
+    @property
+    def committedText(self) -> str:
+        '''
+        Return:
+            Characters which are finished, text without the syllable being composed
+        '''
+        return self.__committedText
+
+    @property
+    def composingText(self) -> str:
+        '''
+        Return:
+            The syllable being composed, empty if there is none
+        '''
+        return _compose(self.__current)
+
+    @property
+    def numOfKeys(self) -> int:
+        return len(self.__history)
+
+    @property
+    def lengthOfLastChar(self) -> int:
+        '''
+        Return:
+            Number of keys which made the last character
+        '''
+        if self.__current[3] > 0:
+            return self.__current[3]
+        return self.__committed[-1][1] if len(self.__committed) > 0 else 0
+
+    def __commit(self, char: str, numOfKeys: int) -> None:
+        if char != '':
+            self.__committed.append((char, numOfKeys))
+            self.__committedText += char
+
+    def __commitCurrent(self) -> None:
+        self.__commit(_compose(self.__current), self.__current[3])
+        self.__current = _EMPTY
+
+    def push(self, key: str) -> None:
+        self.__history.append((len(self.__committed), self.__current))
+
+        jamo = _toJamo(key)
+        cho, jung, jong, n = self.__current
+
+        if jamo is None:
+            self.__commitCurrent()
+            self.__commit(key, 1)
+        elif jamo in _CHOSEONG:
+            if cho is not None and jung is not None and jong is None and jamo in _JONGSEONG:
+                self.__current = (cho, jung, jamo, n + 1)
+            elif jong is not None and (jong, jamo) in _COMPOUND_FINALS:
+                self.__current = (cho, jung, _COMPOUND_FINALS[(jong, jamo)], n + 1)
+            else:
+                self.__commitCurrent()
+                self.__current = (jamo, None, None, 1)
+        else:
+            if jong is not None:
+                # The final consonant becomes the initial of the next syllable
+                if jong in _SPLIT_FINALS:
+                    keep, move = _SPLIT_FINALS[jong]
+                else:
+                    keep, move = None, jong
+                self.__current = (cho, jung, keep, n - 1)
+                self.__commitCurrent()
+                self.__current = (move, jamo, None, 2)
+            elif jung is not None and (jung, jamo) in _COMPOUND_VOWELS:
+                self.__current = (cho, _COMPOUND_VOWELS[(jung, jamo)], None, n + 1)
+            elif cho is not None and jung is None:
+                self.__current = (cho, jamo, None, n + 1)
+            else:
+                self.__commitCurrent()
+                self.__current = (None, jamo, None, 1)
+
+    def pop(self) -> None:
+        '''
+        Undoes the last key.
+        '''
+        if len(self.__history) == 0:
+            return
+
+        numOfCommitted, self.__current = self.__history.pop()
+        if numOfCommitted < len(self.__committed):
+            removed = self.__committed[numOfCommitted:]
+            del self.__committed[numOfCommitted:]
+            self.__committedText = self.__committedText[:len(self.__committedText) - sum(len(c) for c, _ in removed)]
+
+    def popChar(self) -> int:
+        '''
+        Undoes every key of the last character.
+
+        Return:
+            Number of keys which have been undone
+        '''
+        count = self.lengthOfLastChar
+        for _ in range(count):
+            self.pop()
+        return count
+
+    def clear(self) -> None:
+        self.__committed.clear()
+        self.__committedText = ''
+        self.__current = _EMPTY
+        self.__history.clear()
 
 class Hangul:
     @staticmethod
     def combineIntoHangul(text: str) -> str:
-        s = str(__run(text))
-        return s
-    
+        composer = HangulComposer()
+        for key in text:
+            composer.push(key)
+        return composer.text
+
     @staticmethod
     def getLengthOfLastChar(text: str) -> int:
-        return __getLength(text)
+        composer = HangulComposer()
+        for key in text:
+            composer.push(key)
+        return composer.lengthOfLastChar
 
 class LanguageState(Enum):
     ENGLISH = 1
@@ -35,14 +188,13 @@ class Language:
 
     @staticmethod
     def changeLanguage():
-        global __languageState
-        if __languageState == LanguageState.ENGLISH:
-            __languageState = LanguageState.KOREAN
+        if Language.__languageState == LanguageState.ENGLISH:
+            Language.__languageState = LanguageState.KOREAN
         else:
-            __languageState = LanguageState.ENGLISH
-        
+            Language.__languageState = LanguageState.ENGLISH
+
         for listener in Language.__eventListeners:
-            listener(__languageState)
+            listener(Language.__languageState)
 
     @staticmethod
     def getLanguageState() -> LanguageState:
@@ -61,4 +213,4 @@ class Language:
 
     @staticmethod
     def clearEventListeners():
-        Language.__eventListeners.clear()
\ No newline at end of file
+        Language.__eventListeners.clear()
@@ -0,0 +1,137 @@
+from typing import Dict, List, Tuple
+from collections import OrderedDict
+import weakref
+
+import pygame
+
+from .position import int2d
+from .profiler import countSurfaceAllocation
+
+__all__ = ['SurfacePoolStats', 'SurfacePool', 'getSurfacePool']
+
+class SurfacePoolStats:
+    hits: int
+    misses: int
+    numOfFree: int
+    numOfInUse: int
+    bytes: int
+
+    def __init__(self, hits: int, misses: int, numOfFree: int, numOfInUse: int, bytes: int) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.numOfFree = numOfFree
+        self.numOfInUse = numOfInUse
+        self.bytes = bytes
+
+    @property
+    def hitRate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0
+
+class SurfacePool:
+    '''
+    Keeps released pygame surfaces by (size, flags) and hands them out again instead of allocating new ones.\n
+    Surfaces are cleared when acquired, so they look the same as newly created ones, unless the caller is going to
+    paint all of it anyway.
+    Surfaces which were not acquired from the pool are ignored on release.
+    Surfaces in use are tracked weakly, so one which is dropped without being released is just freed.
+    '''
+    MAX_SCRATCH_LAYERS = 8
+
+    def __init__(self, maxFreePerKey: int = 32) -> None:
+        self.__maxFreePerKey = maxFreePerKey
+        self.__free: Dict[Tuple[int2d, int], List[pygame.Surface]] = {}
+        # Surfaces handed out with the key they return to
+        self.__inUse: 'weakref.WeakKeyDictionary[pygame.Surface, Tuple[int2d, int]]' = weakref.WeakKeyDictionary()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__scratchLayers: 'OrderedDict[int2d, pygame.Surface]' = OrderedDict()
+
+    def acquire(self, size: int2d, flags: int = 0, clear: bool = True) -> pygame.Surface:
+        '''
+        if clear is False, a reused surface keeps what was drawn on it before
+        '''
+        key = ((int(size[0]), int(size[1])), flags)
+        free = self.__free.get(key)
+        if free:
+            surface = free.pop()
+            if clear:
+                surface.fill((0, 0, 0, 0))
+            self.__hits += 1
+        else:
+            surface = pygame.Surface(key[0], flags)
+            countSurfaceAllocation()
+            self.__misses += 1
+
+        self.__inUse[surface] = key
+        return surface
+
+    def release(self, surface: pygame.Surface) -> bool:
+        '''
+        Subsurfaces release the surface they belong to.
+
+        Return:
+            True if the surface has been returned to the pool
+        '''
+        surface = surface.get_abs_parent()
+        if surface not in self.__inUse:
+            return False
+
+        key = self.__inUse.pop(surface)
+        surface.set_alpha(None)
+        surface.set_clip(None)
+        free = self.__free.setdefault(key, [])
+        if len(free) < self.__maxFreePerKey:
+            free.append(surface)
+        return True
+
+    def getScratchLayer(self, size: int2d) -> pygame.Surface:
+        '''
+        Return:
+            A transparent layer shared by every surface of the given size. Areas drawn into it must be cleared
+            right after compositing, so it is transparent whenever someone else gets it.
+        '''
+        size = (int(size[0]), int(size[1]))
+        layer = self.__scratchLayers.get(size)
+        if layer is None:
+            layer = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            countSurfaceAllocation()
+            self.__scratchLayers[size] = layer
+            if len(self.__scratchLayers) > self.MAX_SCRATCH_LAYERS:
+                self.__scratchLayers.popitem(last=False)
+        else:
+            self.__scratchLayers.move_to_end(size)
+        return layer
+
+    def owns(self, surface: pygame.Surface) -> bool:
+        return surface.get_abs_parent() in self.__inUse
+
+    @property
+    def maxFreePerKey(self) -> int:
+        return self.__maxFreePerKey
+
+    @maxFreePerKey.setter
+    def maxFreePerKey(self, value: int) -> None:
+        self.__maxFreePerKey = value
+        for free in self.__free.values():
+            del free[value:]
+
+    @property
+    def stats(self) -> SurfacePoolStats:
+        free = [surface for surfaces in self.__free.values() for surface in surfaces]
+        size = sum(surface.get_pitch() * surface.get_height() for surface in free + list(self.__inUse))
+        return SurfacePoolStats(self.__hits, self.__misses, len(free), len(self.__inUse), size)
+
+    def clear(self) -> None:
+        '''
+        Drops the free surfaces, the scratch layers and the stats. Surfaces in use are still accepted on release.
+        '''
+        self.__free.clear()
+        self.__scratchLayers.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+__surfacePool = SurfacePool()
+
+def getSurfacePool() -> SurfacePool:
+    return __surfacePool
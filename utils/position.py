@@ -1,7 +1,10 @@
 from typing import Tuple
 from enum import Enum
+import math
 
-__all__ = ['float2d', 'int2d', 'Position']
+import pygame
+
+__all__ = ['float2d', 'int2d', 'Position', 'getBoundingRect']
 
 float2d = Tuple[float, float]
 int2d = Tuple[int, int]
@@ -11,4 +14,15 @@ class Position(Enum):
     TOPLEFT = 1
     TOPRIGHT = 2
     BOTTOMLEFT = 3
-    BOTTOMRIGHT = 4
\ No newline at end of file
+    BOTTOMRIGHT = 4
+
+def getBoundingRect(pos: float2d, size: float2d, padding: int = 1) -> pygame.Rect:
+    '''
+    Return:
+        The smallest integer rect containing the given float area, grown by padding on every side
+    '''
+    left = math.floor(pos[0]) - padding
+    top = math.floor(pos[1]) - padding
+    right = math.ceil(pos[0] + size[0]) + padding
+    bottom = math.ceil(pos[1] + size[1]) + padding
+    return pygame.Rect(left, top, right - left, bottom - top)
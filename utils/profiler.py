@@ -0,0 +1,205 @@
+from __future__ import annotations
+from typing import Callable, Deque, Dict, List, Optional, TypeVar
+from collections import deque
+from time import perf_counter
+import functools
+import inspect
+
+__profiler: Optional[FrameProfiler] = None
+
+__all__ = ['FrameProfiler', 'SectionStats', 'DrawCallStats', 'enableProfiling', 'disableProfiling', 'getProfiler', 'profileDrawCall', 'countSurfaceAllocation']
+
+class SectionStats:
+    name: str
+    last: float
+    mean: float
+    max: float
+
+    def __init__(self, name: str, last: float, mean: float, max: float) -> None:
+        '''
+        times in milliseconds
+        '''
+        self.name = name
+        self.last = last
+        self.mean = mean
+        self.max = max
+
+class DrawCallStats:
+    name: str
+    callsPerFrame: float
+    timePerFrame: float
+
+    def __init__(self, name: str, callsPerFrame: float, timePerFrame: float) -> None:
+        '''
+        timePerFrame in milliseconds, including the time of draw calls made inside
+        '''
+        self.name = name
+        self.callsPerFrame = callsPerFrame
+        self.timePerFrame = timePerFrame
+
+class FrameProfiler:
+    '''
+    Keeps the timings of the last window frames.
+    '''
+    def __init__(self, window: int = 120) -> None:
+        self.__window = window
+        self.__frameCount: int = 0
+        self.__frameStart: float = 0
+        self.__lastMark: float = 0
+
+        self.__sections: Dict[str, float] = {}
+        self.__drawCalls: Dict[str, List[float]] = {}
+        self.__allocations: int = 0
+
+        self.__sectionHistory: Dict[str, Deque[float]] = {}
+        self.__drawCallHistory: Dict[str, Deque[List[float]]] = {}
+        self.__allocationHistory: Deque[int] = deque(maxlen=window)
+
+    @property
+    def window(self) -> int:
+        return self.__window
+
+    @property
+    def frameCount(self) -> int:
+        return self.__frameCount
+
+    def beginFrame(self) -> None:
+        self.__frameStart = self.__lastMark = perf_counter()
+
+    def mark(self, section: str) -> None:
+        '''
+        Adds the time passed since the previous mark or beginFrame to section.
+        '''
+        now = perf_counter()
+        self.addTime(section, now - self.__lastMark)
+        self.__lastMark = now
+
+    def addTime(self, section: str, seconds: float) -> None:
+        self.__sections[section] = self.__sections.get(section, 0) + seconds
+
+    def addDrawCall(self, name: str, seconds: float) -> None:
+        entry = self.__drawCalls.get(name)
+        if entry is None:
+            self.__drawCalls[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def countAllocation(self) -> None:
+        self.__allocations += 1
+
+    def endFrame(self) -> None:
+        self.addTime('frame', perf_counter() - self.__frameStart)
+
+        for name in self.__sections.keys() | self.__sectionHistory.keys():
+            history = self.__sectionHistory.get(name)
+            if history is None:
+                history = self.__sectionHistory[name] = deque([0.0] * len(self.__allocationHistory), maxlen=self.__window)
+            history.append(self.__sections.get(name, 0) * 1000)
+
+        for name in self.__drawCalls.keys() | self.__drawCallHistory.keys():
+            history = self.__drawCallHistory.get(name)
+            if history is None:
+                history = self.__drawCallHistory[name] = deque([[0, 0.0]] * len(self.__allocationHistory), maxlen=self.__window)
+            history.append(self.__drawCalls.get(name, [0, 0.0]))
+
+        self.__allocationHistory.append(self.__allocations)
+
+        self.__sections = {}
+        self.__drawCalls = {}
+        self.__allocations = 0
+        self.__frameCount += 1
+
+    @property
+    def frameTime(self) -> Optional[SectionStats]:
+        return self.getSection('frame')
+
+    def getSection(self, name: str) -> Optional[SectionStats]:
+        history = self.__sectionHistory.get(name)
+        if history is None or len(history) == 0:
+            return None
+        return SectionStats(name, history[-1], sum(history) / len(history), max(history))
+
+    def getSectionStats(self) -> List[SectionStats]:
+        '''
+        Return:
+            Stats of every timed section, slowest first
+        '''
+        stats = [self.getSection(name) for name in self.__sectionHistory]
+        return sorted((s for s in stats if s is not None), key=lambda s: s.mean, reverse=True)
+
+    def getDrawCallStats(self) -> List[DrawCallStats]:
+        '''
+        Return:
+            Per frame averages of every draw method, slowest first
+        '''
+        stats = []
+        for name, history in self.__drawCallHistory.items():
+            n = len(history)
+            stats.append(DrawCallStats(name, sum(h[0] for h in history) / n, sum(h[1] for h in history) / n * 1000))
+        return sorted(stats, key=lambda s: s.timePerFrame, reverse=True)
+
+    @property
+    def allocationsPerFrame(self) -> float:
+        n = len(self.__allocationHistory)
+        return sum(self.__allocationHistory) / n if n > 0 else 0
+
+    def getSummary(self, numOfDrawCalls: int = 5) -> List[str]:
+        '''
+        Return:
+            Human readable lines describing the recent frames
+        '''
+        lines = []
+        for s in self.getSectionStats():
+            lines.append(f'{s.name:<12} {s.mean:7.2f} ms  max {s.max:7.2f}')
+        lines.append(f'{"surfaces":<12} {self.allocationsPerFrame:7.1f} /frame')
+        for d in self.getDrawCallStats()[:numOfDrawCalls]:
+            lines.append(f'{d.name:<20} {d.callsPerFrame:7.1f}x {d.timePerFrame:7.2f} ms')
+        return lines
+
+def enableProfiling(window: int = 120) -> FrameProfiler:
+    global __profiler
+    __profiler = FrameProfiler(window)
+    return __profiler
+
+def disableProfiling() -> None:
+    global __profiler
+    __profiler = None
+
+def getProfiler() -> Optional[FrameProfiler]:
+    return __profiler
+
+def countSurfaceAllocation() -> None:
+    if __profiler is not None:
+        __profiler.countAllocation()
+
+F = TypeVar('F', bound=Callable[..., None])
+
+def profileDrawCall(func: F) -> F:
+    '''
+    Counts calls and time of a draw method while profiling is enabled.\n
+    Calls which only register a drawing for a z-index are not counted, the drawing is counted when it is rendered.
+    '''
+    name = func.__name__
+    params = list(inspect.signature(func).parameters)
+    zindexPos = params.index('zindex') if 'zindex' in params else None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = __profiler
+        if profiler is None:
+            return func(*args, **kwargs)
+
+        zindex = kwargs.get('zindex')
+        if zindex is None and zindexPos is not None and len(args) > zindexPos:
+            zindex = args[zindexPos]
+        if zindex is not None:
+            return func(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.addDrawCall(name, perf_counter() - start)
+
+    return wrapper
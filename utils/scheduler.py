@@ -0,0 +1,127 @@
+from __future__ import annotations
+from typing import Callable, List, Optional, Tuple
+import heapq
+import time
+
+__all__ = ['ScheduledCall', 'Scheduler', 'getScheduler']
+
+class ScheduledCall:
+    '''
+    Handle of a callback registered to a Scheduler.
+    '''
+    def __init__(self, callback: Callable[[], None], interval: Optional[float], skipMissed: bool = False) -> None:
+        self.__callback = callback
+        self.__interval = interval
+        self.__skipMissed = skipMissed
+        self.__active: bool = True
+
+    @property
+    def callback(self) -> Callable[[], None]:
+        return self.__callback
+
+    @property
+    def interval(self) -> Optional[float]:
+        '''
+        Return:
+            Seconds between calls, None if the callback is called only once
+        '''
+        return self.__interval
+
+    @property
+    def skipMissed(self) -> bool:
+        '''
+        Return:
+            True if calls missed by more than an interval are dropped instead of made up
+        '''
+        return self.__skipMissed
+
+    @property
+    def isActive(self) -> bool:
+        return self.__active
+
+    def cancel(self) -> None:
+        self.__active = False
+
+class Scheduler:
+    '''
+    Calls callbacks on the main loop once they are due. App runs the scheduler once per frame,
+    so callbacks are never called from another thread and may be late by up to a frame.
+    '''
+    def __init__(self) -> None:
+        self.__heap: List[Tuple[float, int, ScheduledCall]] = []
+        self.__count: int = 0
+
+    def __push(self, due: float, call: ScheduledCall) -> None:
+        heapq.heappush(self.__heap, (due, self.__count, call))
+        self.__count += 1
+
+    def callLater(self, delay: float, callback: Callable[[], None]) -> ScheduledCall:
+        '''
+        delay in seconds
+        '''
+        call = ScheduledCall(callback, None)
+        self.__push(time.perf_counter() + delay, call)
+        return call
+
+    def callRepeating(self, interval: float, callback: Callable[[], None], delay: Optional[float] = None, skipMissed: bool = False) -> ScheduledCall:
+        '''
+        interval and delay in seconds, if delay is None the first call is made after interval.\n
+        Calls missed while a frame was running are made up in the next run, so the rate stays the same.
+        if skipMissed is True, a call which has fallen behind by an interval or more is made once
+        and the next one is scheduled from now, so a stall does not cause a burst of calls.
+        '''
+        if interval <= 0:
+            raise ValueError("interval must be larger than 0")
+        call = ScheduledCall(callback, interval, skipMissed)
+        self.__push(time.perf_counter() + (interval if delay is None else delay), call)
+        return call
+
+    def run(self) -> int:
+        '''
+        Return:
+            Number of callbacks which have been called
+        '''
+        now = time.perf_counter()
+        heap = self.__heap
+        numOfCalls = 0
+        while len(heap) > 0 and heap[0][0] <= now:
+            due, _, call = heapq.heappop(heap)
+            if not call.isActive:
+                continue
+
+            if call.interval is None:
+                call.cancel()
+            elif call.skipMissed and due + call.interval <= now:
+                self.__push(now + call.interval, call)
+            else:
+                self.__push(due + call.interval, call)
+            call.callback()
+            numOfCalls += 1
+
+        return numOfCalls
+
+    @property
+    def nextDue(self) -> Optional[float]:
+        '''
+        Return:
+            Seconds until the next callback is due, None if nothing is scheduled
+        '''
+        heap = self.__heap
+        while len(heap) > 0 and not heap[0][2].isActive:
+            heapq.heappop(heap)
+        if len(heap) == 0:
+            return None
+        return max(heap[0][0] - time.perf_counter(), 0)
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, call in self.__heap if call.isActive)
+
+    def clear(self) -> None:
+        for _, _, call in self.__heap:
+            call.cancel()
+        self.__heap.clear()
+
+__scheduler = Scheduler()
+
+def getScheduler() -> Scheduler:
+    return __scheduler
@@ -0,0 +1,176 @@
+from typing import List, Optional, Tuple
+
+__all__ = ['TextBuffer']
+
+class TextBuffer:
+    '''
+    Editable text with a cursor.\n
+    Text is kept as a list of short chunks (a flat rope), so an edit at the cursor only copies the chunk under it
+    instead of the whole text. Chunks which were not edited stay the same str objects, so they can be used to cache
+    anything derived from them, such as rendered images.
+    '''
+    CHUNK_SIZE = 64
+
+    def __init__(self, text: str = '') -> None:
+        self.__chunks: List[str] = ['']
+        # Cursor as the chunk it is in and the offset in that chunk
+        self.__index: int = 0
+        self.__offset: int = 0
+        self.__cursor: int = 0
+        self.__length: int = 0
+        self.__text: Optional[str] = ''
+        self.__version: int = 0
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        if self.__text is None:
+            self.__text = ''.join(self.__chunks)
+        return self.__text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        '''
+        Replaces the whole text and moves the cursor to the end.
+        '''
+        size = self.CHUNK_SIZE
+        self.__chunks = [text[i:i + size] for i in range(0, len(text), size)] or ['']
+        self.__index = len(self.__chunks) - 1
+        self.__offset = len(self.__chunks[-1])
+        self.__cursor = len(text)
+        self.__length = len(text)
+        self.__changed()
+        self.__text = text
+
+    @property
+    def chunks(self) -> List[str]:
+        '''
+        Return:
+            Chunks of the text in order, must not be modified
+        '''
+        return self.__chunks
+
+    @property
+    def version(self) -> int:
+        '''
+        Return:
+            Number which changes every time the text is edited
+        '''
+        return self.__version
+
+    @property
+    def cursor(self) -> int:
+        return self.__cursor
+
+    @cursor.setter
+    def cursor(self, cursor: int) -> None:
+        self.moveCursor(cursor - self.__cursor)
+
+    @property
+    def cursorChunk(self) -> Tuple[int, int]:
+        '''
+        Return:
+            Index of the chunk the cursor is in, and the offset of the cursor in that chunk
+        '''
+        return self.__index, self.__offset
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __changed(self) -> None:
+        self.__text = None
+        self.__version += 1
+
+    def moveCursor(self, delta: int) -> int:
+        '''
+        Return:
+            Number of characters the cursor has actually moved, negative if moved backwards
+        '''
+        delta = max(-self.__cursor, min(delta, self.__length - self.__cursor))
+        chunks = self.__chunks
+        index = self.__index
+        offset = self.__offset + delta
+        while offset < 0:
+            index -= 1
+            offset += len(chunks[index])
+        while offset > len(chunks[index]) and index < len(chunks) - 1:
+            offset -= len(chunks[index])
+            index += 1
+        self.__index = index
+        self.__offset = offset
+        self.__cursor += delta
+        return delta
+
+    def insert(self, text: str) -> None:
+        '''
+        Inserts text at the cursor and moves the cursor after it.
+        '''
+        if len(text) == 0:
+            return
+
+        chunk = self.__chunks[self.__index]
+        offset = self.__offset
+        edited = chunk[:offset] + text + chunk[offset:]
+        offset += len(text)
+
+        if len(edited) <= self.CHUNK_SIZE:
+            self.__chunks[self.__index] = edited
+            self.__offset = offset
+        else:
+            # Split into half-full chunks so the next few inserts fit again
+            half = self.CHUNK_SIZE // 2
+            self.__chunks[self.__index:self.__index + 1] = [edited[i:i + half] for i in range(0, len(edited), half)]
+            self.__index += (offset - 1) // half
+            self.__offset = offset - ((offset - 1) // half) * half
+
+        self.__cursor += len(text)
+        self.__length += len(text)
+        self.__changed()
+
+    def delete(self, count: int = 1) -> int:
+        '''
+        Deletes count characters before the cursor.
+
+        Return:
+            Number of characters which have been deleted
+        '''
+        chunks = self.__chunks
+        deleted = 0
+        while deleted < count and self.__cursor > 0:
+            if self.__offset == 0:
+                self.__index -= 1
+                self.__offset = len(chunks[self.__index])
+
+            index = self.__index
+            chunk = chunks[index]
+            offset = self.__offset
+            n = min(count - deleted, offset)
+            chunks[index] = chunk[:offset - n] + chunk[offset:]
+            self.__offset = offset - n
+            self.__cursor -= n
+            deleted += n
+
+            if len(chunks[index]) == 0 and len(chunks) > 1:
+                del chunks[index]
+                if index > 0:
+                    self.__index = index - 1
+                    self.__offset = len(chunks[index - 1])
+                else:
+                    self.__offset = 0
+            elif index + 1 < len(chunks) and len(chunks[index]) + len(chunks[index + 1]) <= self.CHUNK_SIZE // 2:
+                # Merge chunks which became small so the number of chunks stays proportional to the length
+                chunks[index:index + 2] = [chunks[index] + chunks[index + 1]]
+
+        if deleted > 0:
+            self.__length -= deleted
+            self.__changed()
+        return deleted
+
+    def deleteForward(self, count: int = 1) -> int:
+        '''
+        Deletes count characters after the cursor.
+
+        Return:
+            Number of characters which have been deleted
+        '''
+        return self.delete(self.moveCursor(count))
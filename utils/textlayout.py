@@ -0,0 +1,214 @@
+from typing import Dict, List, Tuple
+from collections import OrderedDict
+import re
+
+from .font import Font
+
+__all__ = ['TextLayout', 'layoutText', 'LayoutCacheStats', 'getLayoutCacheStats', 'setLayoutCacheSize', 'clearLayoutCache']
+
+# Words with the spaces after them, or spaces at the start of a paragraph
+__token = re.compile(r'\S+\s*|\s+')
+
+# (paragraph, font, width) -> lines with their widths
+__breakCache: 'OrderedDict[Tuple[str, Font, int], Tuple[Tuple[str, int], ...]]' = OrderedDict()
+__breakCacheSize: int = 4096
+__breakCacheHits: int = 0
+__breakCacheMisses: int = 0
+
+__layoutCache: 'OrderedDict[Tuple[str, Font, int], TextLayout]' = OrderedDict()
+__layoutCacheSize: int = 64
+
+class LayoutCacheStats:
+    hits: int
+    misses: int
+    numOfEntries: int
+    size: int
+
+    def __init__(self, hits: int, misses: int, numOfEntries: int, size: int) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.numOfEntries = numOfEntries
+        self.size = size
+
+    @property
+    def hitRate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0
+
+def _splitWord(word: str, font: Font, width: int) -> List[str]:
+    # Longest prefixes which fit in width, at least one character each
+    pieces = []
+    while len(word) > 0:
+        lo, hi = 1, len(word)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if font.size(word[:mid])[0] <= width:
+                lo = mid
+            else:
+                hi = mid - 1
+        pieces.append(word[:lo])
+        word = word[lo:]
+    return pieces
+
+def _breakParagraph(paragraph: str, font: Font, width: int, widths: Dict[str, int]) -> Tuple[Tuple[str, int], ...]:
+    # Lines are measured word by word, widths holds the words measured so far
+    def measure(text: str) -> int:
+        w = widths.get(text)
+        if w is None:
+            w = font.size(text)[0]
+            widths[text] = w
+        return w
+
+    lines: List[Tuple[str, int]] = []
+    line = ''
+    # Sum of the widths of the tokens in line, which is short of its real width by up to a pixel per token
+    lineWidth = 0
+    numOfTokens = 0
+    for token in __token.findall(paragraph):
+        word = token.rstrip()
+        wordWidth = measure(word)
+        if line != '':
+            estimate = lineWidth + wordWidth
+            # Lines are only measured as a whole when the estimate is too close to tell
+            if estimate > width or (estimate + numOfTokens > width and font.size(line + word)[0] > width):
+                stripped = line.rstrip()
+                lines.append((stripped, font.size(stripped)[0]))
+                line = ''
+                lineWidth = 0
+                numOfTokens = 0
+
+        if line == '' and wordWidth > width:
+            # A word longer than a whole line is broken between characters
+            pieces = _splitWord(word, font, width)
+            lines.extend((piece, measure(piece)) for piece in pieces[:-1])
+            token = pieces[-1] + token[len(word):]
+            word = pieces[-1]
+
+        line += token
+        lineWidth += measure(token) if len(token) != len(word) else measure(word)
+        numOfTokens += 1
+
+    stripped = line.rstrip()
+    lines.append((stripped, font.size(stripped)[0]))
+    return tuple(lines)
+
+def _getParagraphLines(paragraph: str, font: Font, width: int, widths: Dict[str, int]) -> Tuple[Tuple[str, int], ...]:
+    global __breakCacheHits, __breakCacheMisses
+
+    key = (paragraph, font, width)
+    lines = __breakCache.get(key)
+    if lines is not None:
+        __breakCache.move_to_end(key)
+        __breakCacheHits += 1
+        return lines
+
+    __breakCacheMisses += 1
+    lines = _breakParagraph(paragraph, font, width, widths)
+    if __breakCacheSize > 0:
+        __breakCache[key] = lines
+        while len(__breakCache) > __breakCacheSize:
+            __breakCache.popitem(last=False)
+    return lines
+
+class TextLayout:
+    '''
+    Text wrapped by words to fit in a width, with every line starting a new paragraph kept.\n
+    Line breaks are cached per paragraph, so laying out a text again after editing it
+    only breaks the paragraphs which have changed.
+    '''
+    def __init__(self, text: str, font: Font, width: int) -> None:
+        self.__text = text
+        self.__font = font
+        self.__width = width
+        self.__lineHeight: int = font.get_linesize()
+
+        lines: List[str] = []
+        maxWidth = 0
+        words: Dict[str, int] = {}
+        for paragraph in text.split('\n'):
+            for line, lineWidth in _getParagraphLines(paragraph, font, width, words):
+                lines.append(line)
+                maxWidth = max(maxWidth, lineWidth)
+        self.__lines: Tuple[str, ...] = tuple(lines)
+        self.__maxWidth: int = maxWidth
+
+    @property
+    def text(self) -> str:
+        return self.__text
+
+    @property
+    def font(self) -> Font:
+        return self.__font
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def lines(self) -> Tuple[str, ...]:
+        return self.__lines
+
+    @property
+    def numOfLines(self) -> int:
+        return len(self.__lines)
+
+    @property
+    def lineHeight(self) -> int:
+        return self.__lineHeight
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        '''
+        Return:
+            Width of the longest line and height of all lines
+        '''
+        return (self.__maxWidth, self.__lineHeight * len(self.__lines))
+
+    def getVisibleLines(self, top: float, height: float) -> range:
+        '''
+        Return:
+            Indexes of the lines which are at least partly inside [top, top + height)
+        '''
+        h = self.__lineHeight
+        start = max(int(top // h), 0)
+        end = min(int(-((top + height) // -h)), len(self.__lines))
+        return range(start, max(start, end))
+
+def layoutText(text: str, font: Font, width: int) -> TextLayout:
+    '''
+    Results are cached by (text, font, width), so the returned layout must not be modified.
+    '''
+    key = (text, font, width)
+    layout = __layoutCache.get(key)
+    if layout is not None:
+        __layoutCache.move_to_end(key)
+        return layout
+
+    layout = TextLayout(text, font, width)
+    __layoutCache[key] = layout
+    while len(__layoutCache) > __layoutCacheSize:
+        __layoutCache.popitem(last=False)
+    return layout
+
+def getLayoutCacheStats() -> LayoutCacheStats:
+    '''
+    Return:
+        Stats of the line breaks cached per paragraph
+    '''
+    return LayoutCacheStats(__breakCacheHits, __breakCacheMisses, len(__breakCache), __breakCacheSize)
+
+def setLayoutCacheSize(size: int) -> None:
+    '''
+    size in number of paragraphs, 0 disables the cache
+    '''
+    global __breakCacheSize
+    __breakCacheSize = size
+    while len(__breakCache) > __breakCacheSize:
+        __breakCache.popitem(last=False)
+
+def clearLayoutCache() -> None:
+    global __breakCacheHits, __breakCacheMisses
+    __breakCache.clear()
+    __layoutCache.clear()
+    __breakCacheHits = 0
+    __breakCacheMisses = 0